@@ -4,8 +4,7 @@ import argparse
 import json
 from pathlib import Path
 
-from communication_runtime.engine import build_analysis_report
-from communication_runtime.render import render_markdown_report, write_report_files
+from communication_runtime.batch import analyze_source
 
 
 def main() -> None:
@@ -19,22 +18,7 @@ def main() -> None:
     if source_path.suffix.lower() != ".md":
         raise SystemExit(f"Source file must be markdown: {source_path}")
 
-    report = build_analysis_report(source_path)
-    markdown = render_markdown_report(report)
-    markdown_path, json_path = write_report_files(report, markdown)
-    print(
-        json.dumps(
-            {
-                "ok": True,
-                "source": str(source_path),
-                "analysis_markdown_path": str(markdown_path),
-                "analysis_json_path": str(json_path),
-                "mode": report["source"]["analysis_mode"],
-                "top_findings": [finding["label"] for finding in report["findings"][:3]],
-            },
-            indent=2,
-        )
-    )
+    print(json.dumps(analyze_source(source_path), indent=2))
 
 
 if __name__ == "__main__":
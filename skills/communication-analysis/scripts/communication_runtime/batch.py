@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, Sequence
+
+from .engine import build_analysis_report
+from .render import render_markdown_report, write_report_files
+from .store import store_path, write_report_to_store
+
+
+def analyze_source(source_path: str | Path, use_cache: bool | None = None) -> dict[str, Any]:
+    source_path = Path(source_path).resolve()
+    report = build_analysis_report(source_path, use_cache=use_cache)
+    markdown = render_markdown_report(report)
+    markdown_path, json_path = write_report_files(report, markdown)
+    store = store_path()
+    if store is not None:
+        write_report_to_store(report, store)
+    return {
+        "ok": True,
+        "source": str(source_path),
+        "analysis_markdown_path": str(markdown_path),
+        "analysis_json_path": str(json_path),
+        "mode": report["source"]["analysis_mode"],
+        "top_findings": [finding["label"] for finding in report["findings"][:3]],
+    }
+
+
+def _analyze_source_or_error(source_path: str | Path, use_cache: bool | None = None) -> dict[str, Any]:
+    try:
+        return analyze_source(source_path, use_cache)
+    except Exception as exc:
+        return {"ok": False, "source": str(Path(source_path).resolve()), "error": f"{type(exc).__name__}: {exc}"}
+
+
+def default_worker_count() -> int:
+    return os.cpu_count() or 1
+
+
+def analyze_sources(
+    source_paths: Sequence[str | Path],
+    workers: int | None = None,
+    use_cache: bool | None = None,
+    keep_going: bool = False,
+) -> list[dict[str, Any]]:
+    """Analyze each source; with keep_going, a failing source yields {"ok": False, "error": ...} instead of raising."""
+    # Results come back in input order, matching what the per-file script would have printed.
+    analyze = _analyze_source_or_error if keep_going else analyze_source
+    workers = min(workers or default_worker_count(), len(source_paths))
+    if workers <= 1:
+        return [analyze(path, use_cache) for path in source_paths]
+    chunksize = max(1, len(source_paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(partial(analyze, use_cache=use_cache), source_paths, chunksize=chunksize))
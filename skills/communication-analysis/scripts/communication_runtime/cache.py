@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from . import constants
+from .constants import REPORT_VERSION
+
+CACHE_DIR_NAME = ".cache"
+
+
+def _constants_fingerprint() -> str:
+    lexicons = {name: value for name, value in vars(constants).items() if name.isupper()}
+    payload = json.dumps(lexicons, sort_keys=True, default=sorted)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# Any edit to a lexicon, weight, or target in constants.py changes this and invalidates entries.
+CONSTANTS_FINGERPRINT = _constants_fingerprint()
+
+
+def cache_enabled() -> bool:
+    return os.getenv("COMMUNICATION_SKILL_CACHE") != "0"
+
+
+def cache_path(source_path: str | Path) -> Path:
+    resolved = Path(source_path).resolve()
+    return resolved.parent / "analysis" / CACHE_DIR_NAME / f"{resolved.stem}.json"
+
+
+def analysis_cache_key(source_path: str | Path, llm_config: dict[str, Any]) -> str:
+    resolved = Path(source_path).resolve()
+    with resolved.open("rb") as handle:
+        content_hash = hashlib.file_digest(handle, "sha256").hexdigest()
+    payload = json.dumps(
+        {
+            "path": str(resolved),
+            "content": content_hash,
+            "report_version": REPORT_VERSION,
+            "constants": CONSTANTS_FINGERPRINT,
+            "llm": llm_config,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def load_cached_report(source_path: str | Path, key: str) -> dict[str, Any] | None:
+    path = cache_path(source_path)
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(entry, dict) or entry.get("key") != key:
+        return None
+    report = entry.get("report")
+    return report if isinstance(report, dict) else None
+
+
+def store_cached_report(source_path: str | Path, key: str, report: dict[str, Any]) -> None:
+    # One entry per source file, so edits overwrite instead of accumulating stale reports.
+    path = cache_path(source_path)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps({"key": key, "report": report}), encoding="utf-8")
+        os.replace(temp_path, path)
+    except OSError:
+        return
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+try:
+    import msgpack
+except ImportError:  # msgpack is optional; compact JSON is the stdlib fallback.
+    msgpack = None
+
+COMPACT_REPORT_SUFFIX = ".compact"
+# One leading byte names the encoding so a reader never has to guess.
+_MSGPACK_TAG = b"M"
+_JSON_TAG = b"J"
+
+
+def compact_reports_enabled() -> bool:
+    # Opt-in: the sidecar is one extra file per note on top of the .md and .json reports.
+    return os.getenv("COMMUNICATION_SKILL_COMPACT_REPORTS") == "1"
+
+
+def compact_report_path(json_path: str | Path) -> Path:
+    return Path(json_path).with_suffix(COMPACT_REPORT_SUFFIX)
+
+
+def encode_compact_report(report: dict[str, Any]) -> bytes:
+    if msgpack is not None:
+        return _MSGPACK_TAG + msgpack.packb(report, use_bin_type=True)
+    return _JSON_TAG + json.dumps(report, separators=(",", ":")).encode("utf-8")
+
+
+def decode_compact_report(data: bytes) -> dict[str, Any] | None:
+    tag, payload = data[:1], data[1:]
+    try:
+        if tag == _MSGPACK_TAG and msgpack is not None:
+            report = msgpack.unpackb(payload, raw=False)
+        elif tag == _JSON_TAG:
+            report = json.loads(payload.decode("utf-8"))
+        else:
+            return None
+    except ValueError:
+        return None
+    return report if isinstance(report, dict) else None
+
+
+def write_compact_report(report: dict[str, Any], json_path: str | Path) -> Path:
+    path = compact_report_path(json_path)
+    # Replace atomically so a reader never decodes a half-written sidecar that looks newer than its JSON.
+    temp_path = path.with_name(f"{path.name}.tmp")
+    temp_path.write_bytes(encode_compact_report(report))
+    os.replace(temp_path, path)
+    return path
+
+
+def read_compact_report(json_path: str | Path) -> dict[str, Any] | None:
+    """Load the sidecar for a report JSON, or None when it is missing, stale, or unreadable."""
+    path = compact_report_path(json_path)
+    try:
+        if path.stat().st_mtime_ns < Path(json_path).stat().st_mtime_ns:
+            return None
+        return decode_compact_report(path.read_bytes())
+    except OSError:
+        return None
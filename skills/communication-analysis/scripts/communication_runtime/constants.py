@@ -307,6 +307,15 @@ ACTION_WORDS = [
     "doing",
 ]
 
+SPOKEN_FILLERS = ["um", "uh", "like", "you know", "i mean", "basically", "actually"]
+PASSAGE_FILLERS = ["um", "uh", "like", "you know", "i mean"]
+DISFLUENCY_MARKERS = ["...", "--", "um", "uh", "you know", "i mean", "basically"]
+ABSOLUTES = ["always", "never", "everyone", "nothing"]
+REOPENERS = ["back to", "anyway", "what i'm trying to say", "but yeah"]
+TOPIC_RETURNS = ["back to", "anyway"]
+CLAIM_MARKERS = ["need", "problem", "solution", "should", "want", "goal"]
+CLAIM_FOCUS_MARKERS = ["problem", "solution", "need", "want", "goal"]
+
 CONTEXT_MAP = {
     "startup": {"startup", "investor", "cofounder", "product", "founder", "pitch", "customer"},
     "communication": {"communication", "speaking", "voice", "articulate", "conversation", "explain"},
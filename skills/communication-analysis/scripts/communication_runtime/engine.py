@@ -2,40 +2,43 @@ from __future__ import annotations
 
 import math
 import re
+from bisect import bisect_right
 from collections import Counter
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Iterable
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python path below covers everything.
+    np = None
+
+from .cache import analysis_cache_key, cache_enabled, load_cached_report, store_cached_report
 from .constants import (
-    ACTION_WORDS,
-    AGENCY_COMMITMENTS,
-    AGENCY_SOFTENERS,
-    ANCHOR_MARKERS,
-    APOLOGIES,
-    AUDIENCE_WORDS,
     CONTEXT_MAP,
     DEFAULT_LANGUAGE_ALLOWLIST,
     DIMENSION_LIBRARY,
-    FEAR_WORDS,
     GENERIC_NOUNS,
-    HEDGES,
-    INTENSIFIERS,
     MODE_WEIGHTS,
-    MODALS,
     REPORT_VERSION,
-    REVERSAL_MARKERS,
-    SELF_ATTACK,
     STOP_WORDS,
-    STRUCTURE_MARKERS,
-    VAGUE_WORDS,
     VOCABULARY_CONTEXT_BANKS,
     VOCABULARY_TARGETS,
 )
-from .llm import resolve_llm_config, synthesize_finding, synthesize_report_summary, synthesize_vocabulary_target
+from .llm import (
+    resolve_llm_config,
+    run_llm_requests,
+    synthesize_finding,
+    synthesize_report_batch,
+    synthesize_report_summary,
+    synthesize_vocabulary_target,
+)
 from .markdown_source import load_markdown_source
+from .markers import lexicon_column_totals, lexicon_row, lexicon_total
 
 WORD_RE = re.compile(r"[A-Za-z']+")
+# Below this many segments the per-pair Python loop is cheaper than building arrays.
+NUMPY_SIMILARITY_MIN_SEGMENTS = 64
 
 
 def _now() -> str:
@@ -56,17 +59,6 @@ def _clamp(value: float, minimum: float = 0.0, maximum: float = 100.0) -> float:
     return max(minimum, min(maximum, value))
 
 
-def _count_markers(text: str, markers: Iterable[str]) -> int:
-    lowered = text.lower()
-    count = 0
-    for marker in markers:
-        if " " in marker:
-            count += lowered.count(marker)
-        else:
-            count += len(re.findall(rf"(?<![A-Za-z]){re.escape(marker)}(?![A-Za-z])", lowered))
-    return count
-
-
 def _segment_token_set(text: str) -> set[str]:
     return {token for token in _tokenize(text) if token not in STOP_WORDS and len(token) > 2}
 
@@ -82,18 +74,65 @@ def _cosine_similarity(left: Counter[str], right: Counter[str]) -> float:
     return dot / (left_norm * right_norm)
 
 
-def _build_segment_strength(segment_text: str, artifact_count: int = 0) -> float:
-    lowered = segment_text.lower()
-    hedges = _count_markers(lowered, HEDGES)
-    anchors = _count_markers(lowered, ANCHOR_MARKERS)
-    structure = _count_markers(lowered, STRUCTURE_MARKERS)
-    actions = _count_markers(lowered, ACTION_WORDS)
-    audience = _count_markers(lowered, AUDIENCE_WORDS)
-    commitments = _count_markers(lowered, AGENCY_COMMITMENTS)
-    fillers = _count_markers(lowered, ["um", "uh", "like", "you know", "i mean", "basically", "actually"])
-    vague_words = _count_markers(lowered, VAGUE_WORDS)
-    generic_nouns = _count_markers(lowered, GENERIC_NOUNS)
-    token_count = len(_tokenize(segment_text))
+def _adjacent_similarities_numpy(segment_vectors: list[Counter[str]]) -> list[float]:
+    vocabulary: dict[str, int] = {}
+    rows: list[int] = []
+    columns: list[int] = []
+    weights: list[float] = []
+    for row, vector in enumerate(segment_vectors):
+        for token, weight in vector.items():
+            rows.append(row)
+            columns.append(vocabulary.setdefault(token, len(vocabulary)))
+            weights.append(weight)
+    segment_count = len(segment_vectors)
+    if not rows:
+        return [0.0] * (segment_count - 1)
+
+    # Sparse (row, column) entries encoded as sorted codes so the previous segment's weight
+    # for the same term is one searchsorted away.
+    width = len(vocabulary)
+    row_array = np.asarray(rows, dtype=np.int64)
+    codes = row_array * width + np.asarray(columns, dtype=np.int64)
+    order = np.argsort(codes, kind="stable")
+    codes = codes[order]
+    row_array = row_array[order]
+    weight_array = np.asarray(weights, dtype=np.float64)[order]
+    norms = np.sqrt(np.bincount(row_array, weights=weight_array * weight_array, minlength=segment_count))
+
+    previous_codes = codes - width
+    positions = np.minimum(np.searchsorted(codes, previous_codes), len(codes) - 1)
+    shared = (row_array > 0) & (codes[positions] == previous_codes)
+    dots = np.bincount(
+        row_array[shared],
+        weights=weight_array[shared] * weight_array[positions[shared]],
+        minlength=segment_count,
+    )[1:]
+    denominators = norms[:-1] * norms[1:]
+    similarities = np.zeros(segment_count - 1, dtype=np.float64)
+    nonzero = denominators > 0
+    similarities[nonzero] = dots[nonzero] / denominators[nonzero]
+    return similarities.tolist()
+
+
+def _adjacent_similarities(segment_vectors: list[Counter[str]]) -> list[float]:
+    if np is not None and len(segment_vectors) >= NUMPY_SIMILARITY_MIN_SEGMENTS:
+        return _adjacent_similarities_numpy(segment_vectors)
+    return [
+        _cosine_similarity(segment_vectors[index - 1], segment_vectors[index])
+        for index in range(1, len(segment_vectors))
+    ]
+
+
+def _build_segment_strength(counts: dict[str, int], token_count: int, artifact_count: int = 0) -> float:
+    hedges = counts["hedges"]
+    anchors = counts["anchors"]
+    structure = counts["structure"]
+    actions = counts["actions"]
+    audience = counts["audience"]
+    commitments = counts["agency_commitments"]
+    fillers = counts["spoken_fillers"]
+    vague_words = counts["vague_words"]
+    generic_nouns = counts["generic_nouns"]
     length_penalty = max(0, token_count - 28) * 1.2
     return _clamp(
         (anchors * 12)
@@ -110,6 +149,19 @@ def _build_segment_strength(segment_text: str, artifact_count: int = 0) -> float
     )
 
 
+def _segment_strength(source: dict[str, Any], segment: dict[str, Any]) -> float:
+    # Strength only depends on load-time data, so compute it once and keep it on the segment.
+    strength = segment.get("strength")
+    if strength is None:
+        strength = _build_segment_strength(
+            lexicon_row(source["lexicon_matrix"], segment["index"]),
+            segment["token_count"],
+            len(segment["artifact_span_ids"]),
+        )
+        segment["strength"] = strength
+    return strength
+
+
 def _bounded_pattern(marker: str) -> re.Pattern[str]:
     return re.compile(rf"(?<![A-Za-z]){re.escape(marker)}(?![A-Za-z])", re.IGNORECASE)
 
@@ -125,12 +177,13 @@ def _clip_excerpt(text: str, start: int, end: int, radius: int = 72) -> str:
     return excerpt
 
 
-def _segment_index_by_density(source: dict[str, Any], markers: Iterable[str]) -> int | None:
+def _segment_index_by_density(source: dict[str, Any], lexicons: Iterable[str]) -> int | None:
     best_index = None
     best_score = -1.0
     best_count = -1
+    lexicons = tuple(lexicons)
     for index, segment in enumerate(source["segments"]):
-        count = _count_markers(segment["text"].lower(), markers)
+        count = lexicon_total(source["lexicon_matrix"], index, lexicons)
         if count <= 0:
             continue
         density = (count * 100) / max(6, segment["token_count"])
@@ -164,38 +217,35 @@ def _note_features(source: dict[str, Any]) -> dict[str, Any]:
     unique_ratio = _safe_ratio(len(set(tokens)), token_count)
     repeated_generic = Counter(token for token in tokens if token in GENERIC_NOUNS)
     segment_vectors = [Counter(_segment_token_set(segment["text"])) for segment in source["segments"]]
-    similarities = [
-        _cosine_similarity(segment_vectors[index - 1], segment_vectors[index])
-        for index in range(1, len(segment_vectors))
-    ]
+    similarities = _adjacent_similarities(segment_vectors)
     abrupt_shifts = [index for index, value in enumerate(similarities, start=1) if value < 0.14]
     sentence_lengths = [len(_tokenize(sentence)) for sentence in sentences]
-    sentence_strengths = [
-        _build_segment_strength(segment["text"], len(segment["artifact_span_ids"]))
-        for segment in source["segments"]
-    ]
+    sentence_strengths = [_segment_strength(source, segment) for segment in source["segments"]]
     artifact_kinds = Counter(span["kind"] for span in source["artifact_spans"])
+    counts = lexicon_column_totals(source["lexicon_matrix"])
     return {
         "tokenCount": token_count,
         "sentenceCount": len(sentences) or 1,
         "uniqueRatio": unique_ratio,
         "fillerCount": artifact_kinds.get("filler", 0),
-        "hedgeCount": _count_markers(clean_text, HEDGES),
-        "vagueCount": _count_markers(clean_text, VAGUE_WORDS),
+        "hedgeCount": counts["hedges"],
+        "vagueCount": counts["vague_words"],
         "genericCount": sum(repeated_generic.values()),
-        "modalCount": _count_markers(clean_text, MODALS),
-        "structureCount": _count_markers(clean_text, STRUCTURE_MARKERS),
-        "anchorCount": _count_markers(clean_text, ANCHOR_MARKERS),
-        "actionCount": _count_markers(clean_text, ACTION_WORDS),
-        "audienceCount": _count_markers(clean_text, AUDIENCE_WORDS),
-        "softAgencyCount": _count_markers(clean_text, AGENCY_SOFTENERS),
-        "commitmentCount": _count_markers(clean_text, AGENCY_COMMITMENTS),
-        "reversalCount": _count_markers(clean_text, REVERSAL_MARKERS),
-        "fearCount": _count_markers(clean_text, FEAR_WORDS),
-        "selfAttackCount": _count_markers(clean_text, SELF_ATTACK),
-        "intensityCount": _count_markers(clean_text, INTENSIFIERS),
-        "apologyCount": _count_markers(clean_text, APOLOGIES),
-        "absoluteCount": _count_markers(clean_text, ["always", "never", "everyone", "nothing"]),
+        "modalCount": counts["modals"],
+        "structureCount": counts["structure"],
+        "anchorCount": counts["anchors"],
+        "actionCount": counts["actions"],
+        "audienceCount": counts["audience"],
+        "softAgencyCount": counts["agency_softeners"],
+        "commitmentCount": counts["agency_commitments"],
+        "reversalCount": counts["reversals"],
+        "fearCount": counts["fear"],
+        "selfAttackCount": counts["self_attack"],
+        "intensityCount": counts["intensifiers"],
+        "apologyCount": counts["apologies"],
+        "absoluteCount": counts["absolutes"],
+        "reopenerCount": counts["reopeners"],
+        "claimCount": counts["claims"],
         "artifactCount": len(source["artifact_spans"]),
         "artifactKinds": artifact_kinds,
         "segmentSimilarities": similarities,
@@ -243,7 +293,7 @@ def _detect_disfluency(source: dict[str, Any], features: dict[str, Any]) -> dict
     per_100 = _safe_ratio(features["artifactCount"] + features["fillerCount"], features["tokenCount"]) * 100
     restarts = features["artifactKinds"].get("stutter_restart", 0) + features["artifactKinds"].get("repeat_token", 0)
     score = _clamp((per_100 * 8) + (restarts * 5) + max(0, features["avgSentenceLength"] - 24) * 1.2)
-    segment_index = _segment_index_by_density(source, ["...", "--", "um", "uh", "you know", "i mean", "basically"])
+    segment_index = _segment_index_by_density(source, ["disfluency"])
     if segment_index is None:
         segment_index = _segment_index_by_artifacts(source)
     return {
@@ -259,7 +309,7 @@ def _detect_disfluency(source: dict[str, Any], features: dict[str, Any]) -> dict
 def _detect_hedging(source: dict[str, Any], features: dict[str, Any]) -> dict[str, Any]:
     hedge_rate = _safe_ratio(features["hedgeCount"] + features["vagueCount"] + features["modalCount"], features["tokenCount"]) * 100
     score = _clamp((hedge_rate * 12) + (features["softAgencyCount"] * 4))
-    segment_index = _segment_index_by_density(source, HEDGES + VAGUE_WORDS + MODALS)
+    segment_index = _segment_index_by_density(source, ["hedges", "vague_words", "modals"])
     return {
         "score": round(score, 1),
         "confidence": _clamp(0.68 + min(0.22, hedge_rate / 30), 0.2, 0.95),
@@ -273,7 +323,7 @@ def _detect_hedging(source: dict[str, Any], features: dict[str, Any]) -> dict[st
 def _detect_lexical_precision(source: dict[str, Any], features: dict[str, Any]) -> dict[str, Any]:
     generic_rate = _safe_ratio(features["genericCount"] + features["vagueCount"], features["tokenCount"]) * 100
     score = _clamp((generic_rate * 10) + max(0, (0.46 - features["uniqueRatio"]) * 90) + (features["maxSentenceLength"] / 6))
-    segment_index = _segment_index_by_density(source, GENERIC_NOUNS + VAGUE_WORDS)
+    segment_index = _segment_index_by_density(source, ["generic_nouns", "vague_words"])
     return {
         "score": round(score, 1),
         "confidence": _clamp(0.6 + min(0.26, generic_rate / 35), 0.2, 0.92),
@@ -286,9 +336,9 @@ def _detect_lexical_precision(source: dict[str, Any], features: dict[str, Any])
 
 def _detect_coherence(source: dict[str, Any], features: dict[str, Any]) -> dict[str, Any]:
     drift_rate = _safe_ratio(len(features["abruptShifts"]), max(1, len(source["segments"]) - 1))
-    reopeners = _count_markers(source["clean_body"], ["back to", "anyway", "what i'm trying to say", "but yeah"])
+    reopeners = features["reopenerCount"]
     score = _clamp((drift_rate * 58) + (reopeners * 6) + max(0, features["avgSentenceLength"] - 18) * 0.6)
-    segment_index = features["abruptShifts"][0] if features["abruptShifts"] else _segment_index_by_density(source, ["back to", "anyway"])
+    segment_index = features["abruptShifts"][0] if features["abruptShifts"] else _segment_index_by_density(source, ["topic_returns"])
     return {
         "score": round(score, 1),
         "confidence": _clamp(0.58 + min(0.26, drift_rate), 0.2, 0.92),
@@ -300,12 +350,12 @@ def _detect_coherence(source: dict[str, Any], features: dict[str, Any]) -> dict[
 
 
 def _detect_argument_structure(source: dict[str, Any], features: dict[str, Any]) -> dict[str, Any]:
-    claim_density = _count_markers(source["clean_body"], ["need", "problem", "solution", "should", "want", "goal"])
+    claim_density = features["claimCount"]
     support_gap = max(0, claim_density - (features["anchorCount"] + features["structureCount"]))
     score = _clamp((support_gap * 7) + max(0, (features["structureCount"] == 0) * 16) + max(0, (features["anchorCount"] == 0) * 10))
     if "startup" in source["contexts"] or "communication" in source["contexts"]:
         score = _clamp(score + 8 - (features["audienceCount"] * 3))
-    segment_index = _segment_index_by_density(source, ["problem", "solution", "need", "want", "goal"])
+    segment_index = _segment_index_by_density(source, ["claim_focus"])
     return {
         "score": round(score, 1),
         "confidence": _clamp(0.59 + min(0.23, claim_density / 18), 0.2, 0.9),
@@ -321,7 +371,7 @@ def _detect_commitment(source: dict[str, Any], features: dict[str, Any]) -> dict
     modal_rate = _safe_ratio(features["modalCount"], features["tokenCount"]) * 100
     action_gap = max(0, 10 - features["actionCount"])
     score = _clamp((leakage * 8) + (modal_rate * 10) + (action_gap * 2))
-    segment_index = _segment_index_by_density(source, AGENCY_SOFTENERS + AGENCY_COMMITMENTS)
+    segment_index = _segment_index_by_density(source, ["agency_softeners", "agency_commitments"])
     return {
         "score": round(score, 1),
         "confidence": _clamp(0.61 + min(0.24, leakage / 10), 0.2, 0.93),
@@ -336,7 +386,7 @@ def _detect_contradiction(source: dict[str, Any], features: dict[str, Any]) -> d
     flip_pairs = len(re.findall(r"\bi can\b.*\bi can't\b|\bi want\b.*\bi don't\b|\bi should\b.*\bi can't\b", source["clean_body"].lower()))
     reversal_rate = _safe_ratio(features["reversalCount"], features["tokenCount"]) * 100
     score = _clamp((reversal_rate * 20) + (flip_pairs * 18) + (_safe_ratio(features["modalCount"], features["tokenCount"]) * 100 * 4))
-    segment_index = _segment_index_by_density(source, REVERSAL_MARKERS)
+    segment_index = _segment_index_by_density(source, ["reversals"])
     return {
         "score": round(score, 1),
         "confidence": _clamp(0.56 + min(0.24, features["reversalCount"] / 12), 0.2, 0.91),
@@ -363,7 +413,7 @@ def _detect_stress(source: dict[str, Any], features: dict[str, Any]) -> dict[str
         + max(0, pressure_categories - 1) * 9
         + min(10, features["artifactCount"] / 20)
     )
-    segment_index = _segment_index_by_density(source, FEAR_WORDS + SELF_ATTACK + APOLOGIES + INTENSIFIERS)
+    segment_index = _segment_index_by_density(source, ["fear", "self_attack", "apologies", "intensifiers"])
     return {
         "score": round(score, 1),
         "confidence": _clamp(0.66 + min(0.21, intensity / 16), 0.2, 0.95),
@@ -508,27 +558,88 @@ def _mode_weight(source: dict[str, Any], dimension: str) -> float:
     return weight
 
 
-def _find_target_matches(source: dict[str, Any], target: dict[str, Any]) -> list[dict[str, Any]]:
-    matches: list[dict[str, Any]] = []
-    for segment in source["segments"]:
-        lowered = segment["text"].lower()
-        for term in target["terms"]:
-            pattern = _bounded_pattern(term)
-            for match_index, match in enumerate(pattern.finditer(lowered)):
-                matches.append(
-                    {
-                        "id": f"{target['id']}:{segment['id']}:{term}:{match_index}",
-                        "term": term,
-                        "segmentId": segment["id"],
-                        "segmentIndex": segment["index"],
-                        "localStart": match.start(),
-                        "localEnd": match.end(),
-                        "start": segment["start"] + match.start(),
-                        "end": segment["start"] + match.end(),
-                        "segmentText": segment["text"],
-                    }
-                )
-    matches.sort(key=lambda item: (item["start"], item["end"], item["term"]))
+def _vocabulary_term_prefixes() -> dict[str, tuple[str, ...]]:
+    return {
+        term: tuple(other for other in VOCABULARY_TERMS if other != term and term.startswith(other))
+        for term in VOCABULARY_TERMS
+    }
+
+
+VOCABULARY_TERMS = tuple(
+    sorted({term for target in VOCABULARY_TARGETS for term in target["terms"]}, key=lambda term: (-len(term), term))
+)
+VOCABULARY_TERM_TARGETS = {
+    term: tuple(target["id"] for target in VOCABULARY_TARGETS if term in target["terms"])
+    for term in VOCABULARY_TERMS
+}
+# One bounded lookahead per position; the named group tells which (longest) term matched.
+VOCABULARY_TERM_RE = re.compile(
+    r"(?<![A-Za-z])(?=(?:"
+    + "|".join(f"(?P<term{index}>{re.escape(term)})" for index, term in enumerate(VOCABULARY_TERMS))
+    + r")(?![A-Za-z]))",
+    re.IGNORECASE,
+)
+_VOCABULARY_TERM_PREFIXES = _vocabulary_term_prefixes()
+_LETTER_RE = re.compile(r"[A-Za-z]", re.IGNORECASE)
+
+
+def _scan_vocabulary_terms(lowered: str) -> list[tuple[str, int, int]]:
+    hits: list[tuple[str, int, int]] = []
+    resume_at: dict[str, int] = {}
+    for match in VOCABULARY_TERM_RE.finditer(lowered):
+        start = match.start()
+        longest = VOCABULARY_TERMS[int(match.lastgroup[len("term") :])]
+        for term in (longest, *_VOCABULARY_TERM_PREFIXES[longest]):
+            end = start + len(term)
+            if term != longest and _LETTER_RE.match(lowered, end):
+                continue
+            if start < resume_at.get(term, 0):
+                continue
+            resume_at[term] = end
+            hits.append((term, start, end))
+    return hits
+
+
+def _find_vocabulary_matches(source: dict[str, Any]) -> dict[str, list[dict[str, Any]]]:
+    segments = source["segments"]
+    clean_body = source["clean_body"]
+    lowered = clean_body.lower()
+    located: list[tuple[dict[str, Any], str, int, int]] = []
+    if len(lowered) == len(clean_body):
+        segment_starts = [segment["start"] for segment in segments]
+        for term, start, end in _scan_vocabulary_terms(lowered):
+            index = bisect_right(segment_starts, start) - 1
+            if index < 0:
+                continue
+            segment = segments[index]
+            located.append((segment, term, start - segment["start"], end - segment["start"]))
+    else:
+        # Lowercasing changed character offsets, so body positions no longer line up with segments.
+        for segment in segments:
+            for term, start, end in _scan_vocabulary_terms(segment["text"].lower()):
+                located.append((segment, term, start, end))
+
+    matches: dict[str, list[dict[str, Any]]] = {target["id"]: [] for target in VOCABULARY_TARGETS}
+    match_indexes: Counter[tuple[str, str]] = Counter()
+    for segment, term, local_start, local_end in located:
+        match_index = match_indexes[(segment["id"], term)]
+        match_indexes[(segment["id"], term)] += 1
+        for target_id in VOCABULARY_TERM_TARGETS[term]:
+            matches[target_id].append(
+                {
+                    "id": f"{target_id}:{segment['id']}:{term}:{match_index}",
+                    "term": term,
+                    "segmentId": segment["id"],
+                    "segmentIndex": segment["index"],
+                    "localStart": local_start,
+                    "localEnd": local_end,
+                    "start": segment["start"] + local_start,
+                    "end": segment["start"] + local_end,
+                    "segmentText": segment["text"],
+                }
+            )
+    for items in matches.values():
+        items.sort(key=lambda item: (item["start"], item["end"], item["term"]))
     return matches
 
 
@@ -543,7 +654,7 @@ def _build_context_banks(contexts: list[str]) -> list[dict[str, Any]]:
     return banks[:3]
 
 
-def _build_vocabulary_section(source: dict[str, Any], lexical_score: float, evidence: list[dict[str, Any]], llm_config: dict[str, Any]) -> list[dict[str, Any]]:
+def _build_vocabulary_section(source: dict[str, Any], lexical_score: float, evidence: list[dict[str, Any]]) -> list[dict[str, Any]]:
     eligible = source["language"] in DEFAULT_LANGUAGE_ALLOWLIST
     if not eligible:
         return []
@@ -551,8 +662,9 @@ def _build_vocabulary_section(source: dict[str, Any], lexical_score: float, evid
     total_words = max(1, source["word_count"])
     targets: list[dict[str, Any]] = []
     evidence_map = {item["id"]: item for item in evidence}
+    matches_by_target = _find_vocabulary_matches(source)
     for target in VOCABULARY_TARGETS:
-        matches = _find_target_matches(source, target)
+        matches = matches_by_target[target["id"]]
         min_occurrences = 1 if target["kind"] == "phrase" else 2
         if len(matches) < min_occurrences:
             continue
@@ -613,29 +725,6 @@ def _build_vocabulary_section(source: dict[str, Any], lexical_score: float, evid
         }
         if sample_rewrites:
             item["learningSystem"][0] = f"Use '{sample_rewrites[0]['replacement']}' as today's forced replacement whenever you hear '{target['label']}'."
-        if llm_config["enabled"]:
-            rewrite = synthesize_vocabulary_target(item, llm_config)
-            if rewrite:
-                if rewrite.get("whyItLimitsYou"):
-                    item["why_it_limits_you"] = rewrite["whyItLimitsYou"]
-                replacement_options = []
-                for option in rewrite.get("replacementOptions", [])[:5]:
-                    if not isinstance(option, dict):
-                        continue
-                    if not option.get("word") or not option.get("useWhen"):
-                        continue
-                    replacement_options.append(
-                        {
-                            "word": str(option["word"]).strip(),
-                            "useWhen": str(option["useWhen"]).strip(),
-                            "caution": str(option.get("caution", "")).strip(),
-                        }
-                    )
-                if replacement_options:
-                    item["replacementOptions"] = replacement_options
-                learning_steps = [str(step).strip() for step in rewrite.get("learningSystem", []) if str(step).strip()]
-                if learning_steps:
-                    item["learningSystem"] = learning_steps[:4]
         targets.append(item)
 
     targets.sort(key=lambda item: (-item["overuseScore"], -item["totalOccurrences"], item["label"]))
@@ -645,18 +734,15 @@ def _build_vocabulary_section(source: dict[str, Any], lexical_score: float, evid
 
 def _build_strengths(source: dict[str, Any], detector_results: list[dict[str, Any]], evidence_items: list[dict[str, Any]]) -> list[dict[str, Any]]:
     strengths: list[dict[str, Any]] = []
-    ranked_segments = sorted(
-        source["segments"],
-        key=lambda segment: _build_segment_strength(segment["text"], len(segment["artifact_span_ids"])),
-        reverse=True,
-    )
+    matrix = source["lexicon_matrix"]
+    ranked_segments = sorted(source["segments"], key=lambda segment: _segment_strength(source, segment), reverse=True)
     for segment in ranked_segments:
-        score = round(_build_segment_strength(segment["text"], len(segment["artifact_span_ids"])), 1)
-        lowered = segment["text"].lower()
-        filler_penalty = _count_markers(lowered, ["um", "uh", "like", "you know", "i mean"])
-        abstraction_penalty = _count_markers(lowered, VAGUE_WORDS + GENERIC_NOUNS)
+        score = round(_segment_strength(source, segment), 1)
         if score < 34:
-            continue
+            break
+        counts = lexicon_row(matrix, segment["index"])
+        filler_penalty = counts["passage_fillers"]
+        abstraction_penalty = counts["vague_words"] + counts["generic_nouns"]
         if filler_penalty > 1 or abstraction_penalty > 3 or segment["token_count"] > 40:
             continue
         strengths.append(
@@ -940,7 +1026,92 @@ def _build_sentence_upgrades(
     return unique[:6]
 
 
-def _build_executive_diagnosis(source: dict[str, Any], findings: list[dict[str, Any]], vocabulary_targets: list[dict[str, Any]], llm_config: dict[str, Any]) -> tuple[str, str]:
+def _apply_finding_rewrite(result: dict[str, Any], rewrite: dict[str, Any] | None) -> bool:
+    if not rewrite:
+        return False
+    result["explanation"] = rewrite.get("summary", result["explanation"]) or result["explanation"]
+    hypothesis = rewrite.get("hypothesis")
+    if hypothesis:
+        result["hypothesis"] = f"Tentative: {hypothesis}"
+    return True
+
+
+def _apply_vocabulary_rewrite(item: dict[str, Any], rewrite: dict[str, Any] | None) -> bool:
+    if not rewrite:
+        return False
+    if rewrite.get("whyItLimitsYou"):
+        item["why_it_limits_you"] = rewrite["whyItLimitsYou"]
+    replacement_options = []
+    for option in rewrite.get("replacementOptions", [])[:5]:
+        if not isinstance(option, dict):
+            continue
+        if not option.get("word") or not option.get("useWhen"):
+            continue
+        replacement_options.append(
+            {
+                "word": str(option["word"]).strip(),
+                "useWhen": str(option["useWhen"]).strip(),
+                "caution": str(option.get("caution", "")).strip(),
+            }
+        )
+    if replacement_options:
+        item["replacementOptions"] = replacement_options
+    learning_steps = [str(step).strip() for step in rewrite.get("learningSystem", []) if str(step).strip()]
+    if learning_steps:
+        item["learningSystem"] = learning_steps[:4]
+    return True
+
+
+def _refine_with_llm(finding_requests: list[tuple[dict[str, Any], dict[str, Any]]], vocabulary: list[dict[str, Any]], llm_config: dict[str, Any]) -> bool:
+    """Apply one rewrite per finding and vocabulary target; returns whether every rewrite applied."""
+    # Finding and vocabulary rewrites are independent, so they share one concurrent wave.
+    requests = [lambda payload=payload: synthesize_finding(payload, llm_config) for _, payload in finding_requests]
+    requests += [lambda item=item: synthesize_vocabulary_target(item, llm_config) for item in vocabulary]
+    rewrites = run_llm_requests(requests)
+    applied = [_apply_finding_rewrite(result, rewrite) for (result, _), rewrite in zip(finding_requests, rewrites)]
+    applied += [_apply_vocabulary_rewrite(item, rewrite) for item, rewrite in zip(vocabulary, rewrites[len(finding_requests) :])]
+    return all(applied)
+
+
+def _refine_with_llm_batch(
+    source: dict[str, Any],
+    finding_requests: list[tuple[dict[str, Any], dict[str, Any]]],
+    findings: list[dict[str, Any]],
+    vocabulary: list[dict[str, Any]],
+    llm_config: dict[str, Any],
+) -> tuple[bool, bool, dict[str, Any] | None]:
+    """Apply one batched rewrite.
+
+    Returns (applied, complete, summary rewrite or None when the batch had none); complete is
+    False when the batch left out a finding or vocabulary target.
+    """
+    batch = synthesize_report_batch(
+        [payload for _, payload in finding_requests],
+        vocabulary,
+        _summary_slice(source, findings, vocabulary),
+        llm_config,
+    )
+    if batch is None:
+        return False, False, None
+    applied = [_apply_finding_rewrite(result, rewrite) for (result, _), rewrite in zip(finding_requests, batch["findings"])]
+    applied += [_apply_vocabulary_rewrite(item, rewrite) for item, rewrite in zip(vocabulary, batch["vocabulary"])]
+    return True, all(applied), batch["summary"] or None
+
+
+def _summary_slice(source: dict[str, Any], findings: list[dict[str, Any]], vocabulary_targets: list[dict[str, Any]]) -> dict[str, Any]:
+    return {
+        "source": {"title": source["title"], "mode": source["analysis_mode"], "contexts": source["contexts"]},
+        "findings": [{"label": finding["label"], "severity": finding["severity"], "why": finding["why_it_matters"]} for finding in findings[:3]],
+        "vocabulary": [{"label": target["label"], "why": target["why_it_limits_you"]} for target in vocabulary_targets[:3]],
+    }
+
+
+def _build_executive_diagnosis(
+    source: dict[str, Any],
+    findings: list[dict[str, Any]],
+    vocabulary_targets: list[dict[str, Any]],
+    summary_rewrite: dict[str, Any] | None = None,
+) -> tuple[str, str]:
     if not findings:
         return (
             "This document does not show a major communication breakdown. The main opportunity is to keep pushing specificity and reuse your stronger sentence patterns deliberately.",
@@ -957,27 +1128,36 @@ def _build_executive_diagnosis(source: dict[str, Any], findings: list[dict[str,
         summary += f" The fastest vocabulary leverage comes from replacing habits like {vocab_label.lower()}."
 
     weekly_theme = f"Train against {top_gap.lower()} while forcing more precise nouns and cleaner openings."
-    if llm_config["enabled"]:
-        rewrite = synthesize_report_summary(
-            {
-                "source": {"title": source["title"], "mode": source["analysis_mode"], "contexts": source["contexts"]},
-                "findings": [{"label": finding["label"], "severity": finding["severity"], "why": finding["why_it_matters"]} for finding in findings[:3]],
-                "vocabulary": [{"label": target["label"], "why": target["why_it_limits_you"]} for target in vocabulary_targets[:3]],
-            },
-            llm_config,
-        )
-        if rewrite:
-            summary = rewrite.get("executiveDiagnosis", summary) or summary
-            weekly_theme = rewrite.get("weeklyTheme", weekly_theme) or weekly_theme
+    if summary_rewrite:
+        summary = summary_rewrite.get("executiveDiagnosis", summary) or summary
+        weekly_theme = summary_rewrite.get("weeklyTheme", weekly_theme) or weekly_theme
     return summary, weekly_theme
 
 
-def build_analysis_report(path: str | Path) -> dict[str, Any]:
-    source = load_markdown_source(path)
+def build_analysis_report(path: str | Path, use_cache: bool | None = None) -> dict[str, Any]:
     llm_config = resolve_llm_config()
+    if use_cache is None:
+        use_cache = cache_enabled()
+    if not use_cache:
+        return _compute_analysis_report(path, llm_config)[0]
+    cache_key = analysis_cache_key(path, llm_config)
+    cached = load_cached_report(path, cache_key)
+    if cached is not None:
+        return cached
+    report, llm_complete = _compute_analysis_report(path, llm_config)
+    # A report missing rewrites after a failed LLM request is not cached, so the next run retries them.
+    if llm_complete:
+        store_cached_report(path, cache_key, report)
+    return report
+
+
+def _compute_analysis_report(path: str | Path, llm_config: dict[str, Any]) -> tuple[dict[str, Any], bool]:
+    """Build the report; the flag is False when LLM refinement was requested but a rewrite did not apply."""
+    source = load_markdown_source(path)
     features = _note_features(source)
     results: list[dict[str, Any]] = []
     evidence_items: list[dict[str, Any]] = []
+    finding_requests: list[tuple[dict[str, Any], dict[str, Any]]] = []
 
     for dimension, detector in DETECTOR_MAP.items():
         raw = detector(source, features)
@@ -1011,33 +1191,38 @@ def build_analysis_report(path: str | Path) -> dict[str, Any]:
             "evidence_id": evidence["id"],
         }
         if llm_config["enabled"] and severity >= 35:
-            rewrite = synthesize_finding(
-                {
-                    "dimension": dimension,
-                    "label": library["label"],
-                    "severity": severity,
-                    "confidence": adjusted_confidence,
-                    "explanation": library["explanation"],
-                    "why_it_matters": library["why_it_matters"],
-                    "metrics": result["metrics"],
-                },
-                llm_config,
+            finding_requests.append(
+                (
+                    result,
+                    {
+                        "dimension": dimension,
+                        "label": library["label"],
+                        "severity": severity,
+                        "confidence": adjusted_confidence,
+                        "explanation": library["explanation"],
+                        "why_it_matters": library["why_it_matters"],
+                        "metrics": result["metrics"],
+                    },
+                )
             )
-            if rewrite:
-                result["explanation"] = rewrite.get("summary", result["explanation"]) or result["explanation"]
-                hypothesis = rewrite.get("hypothesis")
-                if hypothesis:
-                    result["hypothesis"] = f"Tentative: {hypothesis}"
         results.append(result)
 
     results.sort(key=lambda item: (-item["severity"], item["label"]))
     findings = [item for item in results if item["severity"] >= 30][:5]
-    vocabulary = _build_vocabulary_section(source, next((item["severity"] for item in results if item["dimension"] == "lexical_precision"), 0), evidence_items, llm_config)
+    vocabulary = _build_vocabulary_section(source, next((item["severity"] for item in results if item["dimension"] == "lexical_precision"), 0), evidence_items)
+    refined_in_batch, llm_complete, summary_rewrite = False, True, None
+    if llm_config["enabled"] and llm_config.get("batch"):
+        refined_in_batch, llm_complete, summary_rewrite = _refine_with_llm_batch(source, finding_requests, findings, vocabulary, llm_config)
+    if llm_config["enabled"] and not refined_in_batch:
+        llm_complete = _refine_with_llm(finding_requests, vocabulary, llm_config)
+    if llm_config["enabled"] and findings and summary_rewrite is None:
+        summary_rewrite = synthesize_report_summary(_summary_slice(source, findings, vocabulary), llm_config)
+        llm_complete = llm_complete and summary_rewrite is not None
     strengths = _build_strengths(source, results, evidence_items)
     practice_systems = _build_practice_systems(findings)
     activation_loop = _build_activation_loop(source, findings, vocabulary)
     sentence_upgrades = _build_sentence_upgrades(source, findings, vocabulary, evidence_items)
-    executive_diagnosis, weekly_theme = _build_executive_diagnosis(source, findings, vocabulary, llm_config)
+    executive_diagnosis, weekly_theme = _build_executive_diagnosis(source, findings, vocabulary, summary_rewrite)
 
     output_dir = source_output_dir(source["path"])
     markdown_path = output_dir / f"{Path(source['path']).stem}.md"
@@ -1082,7 +1267,7 @@ def build_analysis_report(path: str | Path) -> dict[str, Any]:
             "available_contexts": sorted(CONTEXT_MAP.keys()),
         },
     }
-    return report
+    return report, llm_complete
 
 
 def source_output_dir(path: str | Path) -> Path:
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import base64
+import http.client
+import os
+import queue
+import random
+import threading
+import time
+import urllib.parse
+import urllib.request
+
+DEFAULT_POOL_SIZE = 6
+DEFAULT_MAX_RETRIES = 3
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 20.0
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+_pools: dict[tuple[str, str, int, str | None], "ConnectionPool"] = {}
+_pools_lock = threading.Lock()
+
+
+def _reset_after_fork() -> None:
+    # A forked worker must not share the parent's sockets or inherit a lock held mid-request.
+    global _pools, _pools_lock
+    _pools = {}
+    _pools_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _pool_size() -> int:
+    try:
+        return max(1, int(os.getenv("COMMUNICATION_SKILL_HTTP_POOL_SIZE") or DEFAULT_POOL_SIZE))
+    except ValueError:
+        return DEFAULT_POOL_SIZE
+
+
+def _proxy_for(scheme: str, host: str) -> str | None:
+    """The proxy URL urllib would use for this scheme and host, honoring *_PROXY and NO_PROXY."""
+    proxy = urllib.request.getproxies().get(scheme)
+    if not proxy or urllib.request.proxy_bypass(host):
+        return None
+    return proxy if "://" in proxy else f"http://{proxy}"
+
+
+class ConnectionPool:
+    """Keep-alive HTTP(S) connections to one host, reused across threads.
+
+    With a proxy, HTTPS requests are CONNECT-tunnelled through it and plain HTTP
+    requests are sent to it with absolute URLs, as urllib does.
+    """
+
+    def __init__(self, scheme: str, host: str, port: int, size: int, timeout: float, proxy: str | None = None) -> None:
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.proxy = urllib.parse.urlsplit(proxy) if proxy else None
+        self._idle: queue.LifoQueue[http.client.HTTPConnection] = queue.LifoQueue(maxsize=size)
+
+    def _proxy_headers(self) -> dict[str, str]:
+        if self.proxy is None or not self.proxy.username:
+            return {}
+        credentials = f"{urllib.parse.unquote(self.proxy.username)}:{urllib.parse.unquote(self.proxy.password or '')}"
+        return {"Proxy-Authorization": "Basic " + base64.b64encode(credentials.encode("utf-8")).decode("ascii")}
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        if self.proxy is None:
+            connection_class = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+            return connection_class(self.host, self.port, timeout=self.timeout)
+        proxy_class = http.client.HTTPSConnection if self.proxy.scheme == "https" else http.client.HTTPConnection
+        proxy_port = self.proxy.port or (443 if self.proxy.scheme == "https" else 80)
+        if self.scheme != "https":
+            return proxy_class(self.proxy.hostname or "", proxy_port, timeout=self.timeout)
+        connection = http.client.HTTPSConnection(self.proxy.hostname or "", proxy_port, timeout=self.timeout)
+        connection.set_tunnel(self.host, self.port, headers=self._proxy_headers())
+        return connection
+
+    def _request_target(self, path: str) -> str:
+        if self.proxy is not None and self.scheme != "https":
+            return f"http://{self.host}:{self.port}{path}"
+        return path
+
+    def _release(self, connection: http.client.HTTPConnection) -> None:
+        try:
+            self._idle.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+    def _send(self, connection: http.client.HTTPConnection, method: str, path: str, body: bytes, headers: dict[str, str]) -> tuple[http.client.HTTPResponse, bytes]:
+        if self.proxy is not None and self.scheme != "https":
+            headers = {**headers, **self._proxy_headers()}
+        try:
+            connection.request(method, self._request_target(path), body=body, headers=headers)
+            response = connection.getresponse()
+            return response, response.read()
+        except BaseException:
+            connection.close()
+            raise
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def request(self, method: str, path: str, body: bytes, headers: dict[str, str]) -> tuple[int, http.client.HTTPMessage, bytes]:
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            connection = self._new_connection()
+            response, payload = self._send(connection, method, path, body, headers)
+        else:
+            try:
+                response, payload = self._send(connection, method, path, body, headers)
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # The server dropped an idle keep-alive connection; retry once on a fresh one.
+                connection = self._new_connection()
+                response, payload = self._send(connection, method, path, body, headers)
+        if response.will_close:
+            connection.close()
+        else:
+            self._release(connection)
+        return response.status, response.headers, payload
+
+
+def get_pool(url: str, timeout: float) -> tuple[ConnectionPool, str]:
+    parsed = urllib.parse.urlsplit(url)
+    scheme = parsed.scheme or "https"
+    port = parsed.port or (443 if scheme == "https" else 80)
+    host = parsed.hostname or ""
+    proxy = _proxy_for(scheme, host)
+    key = (scheme, host, port, proxy)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = ConnectionPool(scheme, host, port, _pool_size(), timeout, proxy)
+    path = parsed.path or "/"
+    if parsed.query:
+        path = f"{path}?{parsed.query}"
+    return pool, path
+
+
+def close_pools() -> None:
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+def _retry_delay(attempt: int, retry_after: str | None) -> float:
+    if retry_after:
+        try:
+            return min(BACKOFF_MAX_SECONDS, max(0.0, float(retry_after)))
+        except ValueError:
+            pass
+    # Full exponential backoff with jitter so parallel workers do not retry in lockstep.
+    return random.uniform(0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2**attempt)))
+
+
+def post(url: str, body: bytes, headers: dict[str, str], *, timeout: float, max_retries: int = DEFAULT_MAX_RETRIES) -> tuple[int, bytes]:
+    pool, path = get_pool(url, timeout)
+    attempt = 0
+    while True:
+        status, response_headers, payload = pool.request("POST", path, body, headers)
+        if status not in RETRY_STATUSES or attempt >= max_retries:
+            return status, payload
+        time.sleep(_retry_delay(attempt, response_headers.get("Retry-After")))
+        attempt += 1
@@ -1,14 +1,71 @@
 from __future__ import annotations
 
+import http.client
 import json
+import math
 import os
-import urllib.error
-import urllib.request
-from typing import Any
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Sequence, TypeVar
+
+from .http_pool import post
+from .response_cache import load_cached_response, response_cache_key, store_cached_response
 
 DEFAULT_OPENAI_MODEL = "gpt-5-mini"
 DEFAULT_REASONING_EFFORT = "low"
 RESPONSES_API_URL = "https://api.openai.com/v1/responses"
+DEFAULT_LLM_CONCURRENCY = 6
+LLM_REQUEST_TIMEOUT_SECONDS = 60
+
+T = TypeVar("T")
+
+FINDING_REWRITE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "summary": {"type": "string"},
+        "hypothesis": {"type": "string"},
+    },
+    "required": ["summary", "hypothesis"],
+    "additionalProperties": False,
+}
+
+VOCABULARY_REWRITE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "whyItLimitsYou": {"type": "string"},
+        "replacementOptions": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "word": {"type": "string"},
+                    "useWhen": {"type": "string"},
+                    "caution": {"type": "string"},
+                },
+                "required": ["word", "useWhen", "caution"],
+                "additionalProperties": False,
+            },
+        },
+        "learningSystem": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["whyItLimitsYou", "replacementOptions", "learningSystem"],
+    "additionalProperties": False,
+}
+
+SUMMARY_REWRITE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "executiveDiagnosis": {"type": "string"},
+        "weeklyTheme": {"type": "string"},
+    },
+    "required": ["executiveDiagnosis", "weeklyTheme"],
+    "additionalProperties": False,
+}
+
+_executor: ThreadPoolExecutor | None = None
+_executor_workers = DEFAULT_LLM_CONCURRENCY
+_executor_lock = threading.Lock()
 
 
 def resolve_llm_config() -> dict[str, Any]:
@@ -20,10 +77,47 @@ def resolve_llm_config() -> dict[str, Any]:
         "configured": bool(api_key),
         "model": os.getenv("COMMUNICATION_SKILL_OPENAI_MODEL") or os.getenv("PLAYGROUND_OPENAI_MODEL") or DEFAULT_OPENAI_MODEL,
         "reasoningEffort": os.getenv("COMMUNICATION_SKILL_REASONING_EFFORT") or DEFAULT_REASONING_EFFORT,
+        "batch": os.getenv("COMMUNICATION_SKILL_LLM_BATCH") == "1",
         "disabledReason": None if enabled else ("OPENAI_API_KEY is missing" if not api_key else "COMMUNICATION_SKILL_ENABLE_LLM=0"),
     }
 
 
+def _llm_concurrency() -> int:
+    try:
+        return max(1, int(os.getenv("COMMUNICATION_SKILL_LLM_CONCURRENCY") or DEFAULT_LLM_CONCURRENCY))
+    except ValueError:
+        return DEFAULT_LLM_CONCURRENCY
+
+
+def _llm_executor() -> ThreadPoolExecutor:
+    # One bounded pool per process, shared by every report analyzed in it.
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor is None:
+            _executor_workers = _llm_concurrency()
+            _executor = ThreadPoolExecutor(max_workers=_executor_workers, thread_name_prefix="communication-llm")
+        return _executor
+
+
+def run_llm_requests(requests: Sequence[Callable[[], T | None]]) -> list[T | None]:
+    """Run LLM calls concurrently and return their results in order; late calls resolve to None."""
+    if not requests:
+        return []
+    executor = _llm_executor()
+    futures = [executor.submit(request) for request in requests]
+    # Each queued wave gets a full request timeout, so a slow call cannot stall the report forever.
+    waves = math.ceil(len(requests) / _executor_workers)
+    deadline = time.monotonic() + waves * (LLM_REQUEST_TIMEOUT_SECONDS + 5)
+    results: list[T | None] = []
+    for future in futures:
+        try:
+            results.append(future.result(timeout=max(0.0, deadline - time.monotonic())))
+        except TimeoutError:
+            future.cancel()
+            results.append(None)
+    return results
+
+
 def _response_output_text(payload: dict[str, Any]) -> str | None:
     for item in payload.get("output", []):
         if item.get("type") != "message":
@@ -50,6 +144,19 @@ def _responses_json(
     if not api_key:
         return None
 
+    reasoning_effort = llm_config.get("reasoningEffort", DEFAULT_REASONING_EFFORT)
+    cache_key = response_cache_key(
+        model=llm_config["model"],
+        reasoning_effort=reasoning_effort,
+        schema_name=schema_name,
+        schema=schema,
+        system_prompt=system_prompt,
+        user_payload=user_payload,
+    )
+    cached = load_cached_response(cache_key)
+    if cached is not None:
+        return cached
+
     body = json.dumps(
         {
             "model": llm_config["model"],
@@ -57,7 +164,7 @@ def _responses_json(
                 {"role": "system", "content": [{"type": "input_text", "text": system_prompt}]},
                 {"role": "user", "content": [{"type": "input_text", "text": json.dumps(user_payload)}]},
             ],
-            "reasoning": {"effort": llm_config.get("reasoningEffort", DEFAULT_REASONING_EFFORT)},
+            "reasoning": {"effort": reasoning_effort},
             "text": {
                 "format": {
                     "type": "json_schema",
@@ -70,17 +177,17 @@ def _responses_json(
             "max_output_tokens": max_output_tokens,
         }
     ).encode("utf-8")
-    request = urllib.request.Request(
-        RESPONSES_API_URL,
-        data=body,
-        headers={"Content-Type": "application/json", "Authorization": f"Bearer {api_key}"},
-        method="POST",
-    )
-
     try:
-        with urllib.request.urlopen(request, timeout=60) as response:
-            payload = json.loads(response.read().decode("utf-8"))
-    except (urllib.error.URLError, TimeoutError, json.JSONDecodeError):
+        status, response_body = post(
+            RESPONSES_API_URL,
+            body,
+            {"Content-Type": "application/json", "Authorization": f"Bearer {api_key}"},
+            timeout=LLM_REQUEST_TIMEOUT_SECONDS,
+        )
+        if status != 200:
+            return None
+        payload = json.loads(response_body.decode("utf-8"))
+    except (OSError, http.client.HTTPException, json.JSONDecodeError):
         return None
 
     text = _response_output_text(payload)
@@ -88,21 +195,15 @@ def _responses_json(
         return None
 
     try:
-        return json.loads(text)
+        result = json.loads(text)
     except json.JSONDecodeError:
         return None
+    if isinstance(result, dict):
+        store_cached_response(cache_key, result)
+    return result
 
 
 def synthesize_finding(finding: dict[str, Any], llm_config: dict[str, Any]) -> dict[str, Any] | None:
-    schema = {
-        "type": "object",
-        "properties": {
-            "summary": {"type": "string"},
-            "hypothesis": {"type": "string"},
-        },
-        "required": ["summary", "hypothesis"],
-        "additionalProperties": False,
-    }
     return _responses_json(
         system_prompt="You are a careful communication analyst. Keep the language evidence-bound and do not overstate psychological certainty.",
         user_payload={
@@ -110,35 +211,13 @@ def synthesize_finding(finding: dict[str, Any], llm_config: dict[str, Any]) -> d
             "instruction": "Rewrite this finding more sharply, keep it practical, and mark any cause language as tentative.",
         },
         schema_name="communication_finding_rewrite",
-        schema=schema,
+        schema=FINDING_REWRITE_SCHEMA,
         llm_config=llm_config,
         max_output_tokens=500,
     )
 
 
 def synthesize_vocabulary_target(target: dict[str, Any], llm_config: dict[str, Any]) -> dict[str, Any] | None:
-    schema = {
-        "type": "object",
-        "properties": {
-            "whyItLimitsYou": {"type": "string"},
-            "replacementOptions": {
-                "type": "array",
-                "items": {
-                    "type": "object",
-                    "properties": {
-                        "word": {"type": "string"},
-                        "useWhen": {"type": "string"},
-                        "caution": {"type": "string"},
-                    },
-                    "required": ["word", "useWhen", "caution"],
-                    "additionalProperties": False,
-                },
-            },
-            "learningSystem": {"type": "array", "items": {"type": "string"}},
-        },
-        "required": ["whyItLimitsYou", "replacementOptions", "learningSystem"],
-        "additionalProperties": False,
-    }
     return _responses_json(
         system_prompt="You are a careful communication coach. Prefer practical spoken-language guidance over dramatic phrasing.",
         user_payload={
@@ -146,22 +225,13 @@ def synthesize_vocabulary_target(target: dict[str, Any], llm_config: dict[str, A
             "instruction": "Tighten this vocabulary coaching target, keep it natural, and preserve the practical replacement guidance.",
         },
         schema_name="communication_vocab_rewrite",
-        schema=schema,
+        schema=VOCABULARY_REWRITE_SCHEMA,
         llm_config=llm_config,
         max_output_tokens=700,
     )
 
 
 def synthesize_report_summary(report_slice: dict[str, Any], llm_config: dict[str, Any]) -> dict[str, Any] | None:
-    schema = {
-        "type": "object",
-        "properties": {
-            "executiveDiagnosis": {"type": "string"},
-            "weeklyTheme": {"type": "string"},
-        },
-        "required": ["executiveDiagnosis", "weeklyTheme"],
-        "additionalProperties": False,
-    }
     return _responses_json(
         system_prompt="You are a precise communication coach. Stay concrete, plainspoken, and evidence-bound.",
         user_payload={
@@ -169,7 +239,71 @@ def synthesize_report_summary(report_slice: dict[str, Any], llm_config: dict[str
             "instruction": "Write a compact executive diagnosis and a weekly theme from these evidence-backed findings.",
         },
         schema_name="communication_report_summary",
-        schema=schema,
+        schema=SUMMARY_REWRITE_SCHEMA,
         llm_config=llm_config,
         max_output_tokens=400,
     )
+
+
+def _indexed_items(schema: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "type": "array",
+        "items": {
+            **schema,
+            "properties": {"index": {"type": "integer"}, **schema["properties"]},
+            "required": ["index", *schema["required"]],
+        },
+    }
+
+
+REPORT_BATCH_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "findings": _indexed_items(FINDING_REWRITE_SCHEMA),
+        "vocabulary": _indexed_items(VOCABULARY_REWRITE_SCHEMA),
+        "summary": SUMMARY_REWRITE_SCHEMA,
+    },
+    "required": ["findings", "vocabulary", "summary"],
+    "additionalProperties": False,
+}
+
+
+def _scatter(items: Any, count: int) -> list[dict[str, Any] | None]:
+    scattered: list[dict[str, Any] | None] = [None] * count
+    for item in items if isinstance(items, list) else []:
+        if isinstance(item, dict) and isinstance(item.get("index"), int) and 0 <= item["index"] < count:
+            scattered[item["index"]] = item
+    return scattered
+
+
+def synthesize_report_batch(
+    findings: list[dict[str, Any]],
+    targets: list[dict[str, Any]],
+    report_slice: dict[str, Any],
+    llm_config: dict[str, Any],
+) -> dict[str, Any] | None:
+    """Rewrite every finding, vocabulary target and the summary in one request, scattered back by index."""
+    response = _responses_json(
+        system_prompt="You are a careful communication analyst and coach. Keep the language evidence-bound, practical, and plainspoken, and do not overstate psychological certainty.",
+        user_payload={
+            "findings": [{"index": index, "finding": finding} for index, finding in enumerate(findings)],
+            "vocabulary": [{"index": index, "target": target} for index, target in enumerate(targets)],
+            "report": report_slice,
+            "instruction": (
+                "For each finding, rewrite it more sharply, keep it practical, and mark any cause language as tentative. "
+                "For each vocabulary target, tighten the coaching, keep it natural, and preserve the practical replacement guidance. "
+                "Then write a compact executive diagnosis and a weekly theme for the report. Echo each item's index."
+            ),
+        },
+        schema_name="communication_report_batch",
+        schema=REPORT_BATCH_SCHEMA,
+        llm_config=llm_config,
+        max_output_tokens=400 + 500 * len(findings) + 700 * len(targets),
+    )
+    if not response:
+        return None
+    return {
+        "findings": _scatter(response.get("findings"), len(findings)),
+        "vocabulary": _scatter(response.get("vocabulary"), len(targets)),
+        "summary": response.get("summary") if isinstance(response.get("summary"), dict) else None,
+    }
@@ -1,13 +1,52 @@
 from __future__ import annotations
 
+import io
 import re
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator, TextIO
 
 from .constants import CONTEXT_MAP, DEFAULT_LANGUAGE_ALLOWLIST, FILLERS
+from .markers import build_lexicon_matrix
 
 WORD_RE = re.compile(r"[A-Za-z']+")
 FRONTMATTER_RE = re.compile(r"\A---\s*\n(.*?)\n---\s*\n?", re.DOTALL)
+FRONTMATTER_OPEN_RE = re.compile(r"---\s*\n")
+ANALYSIS_HEADING_PATTERNS = [
+    r"(?im)^##\s+transcript\s*$",
+    r"(?im)^#\s+transcript\s*$",
+    r"(?im)^##\s+note\s*$",
+    r"(?im)^#\s+note\s*$",
+]
+SPEAKER_LINE_RE = re.compile(r"^([A-Za-z][A-Za-z0-9 _-]{0,20}|me|speaker \d+):\s", re.IGNORECASE)
+BRACKET_SPEAKER_RE = re.compile(r"^\[[^\]]+\]\s")
+RESTART_RE = re.compile(r"\b([A-Za-z]{1,6})-\s*[A-Za-z]{1,20}\b")
+# Files above this size are cleaned paragraph by paragraph instead of as one string.
+STREAMING_THRESHOLD_BYTES = 1024 * 1024
+# Inline code or a link still open after this much text is cut at the next paragraph break anyway.
+STREAMING_CARRY_LIMIT_CHARS = 64 * 1024
+FRONTMATTER_SCAN_LIMIT = 64 * 1024
+ARTIFACT_PATTERNS = (
+    ("ellipsis", re.compile(r"\.\.\.")),
+    ("dash_fragment", re.compile(r"\b[A-Za-z]{1,15}-(?=\s|$)|--+")),
+    ("repeat_token", re.compile(r"\b([A-Za-z']{1,15})\s+\1\b", re.IGNORECASE)),
+    ("stutter_restart", re.compile(r"\b([A-Za-z]{1,6})-\s*[A-Za-z]{1,20}\b")),
+)
+
+
+def _filler_alternative(index: int, filler: str) -> str:
+    group = f"(?P<filler{index}>{re.escape(filler)})"
+    if filler == "like":
+        # "like" only counts as a filler after a clause break and before a new clause.
+        return (
+            rf"(?:^|[,.;!?]\s+|\b(?:and|but|or|so)\s+){group}"
+            r"(?=(?:\s+(?:i|you|we|he|she|they|it|this|that|what|a|an|the)\b|[,.!?]))"
+        )
+    return rf"(?<![A-Za-z]){group}(?![A-Za-z])"
+
+
+# Fillers never overlap one another, so one alternation finds the same spans as one scan per filler.
+FILLER_GROUPS = {f"filler{index}": filler for index, filler in enumerate(FILLERS)}
+FILLER_RE = re.compile("|".join(_filler_alternative(index, filler) for index, filler in enumerate(FILLERS)))
 
 
 def _normalize_text(text: str) -> str:
@@ -77,13 +116,7 @@ def _strip_markdown(text: str) -> str:
 
 
 def _extract_analysis_body(body: str) -> str:
-    heading_patterns = [
-        r"(?im)^##\s+transcript\s*$",
-        r"(?im)^#\s+transcript\s*$",
-        r"(?im)^##\s+note\s*$",
-        r"(?im)^#\s+note\s*$",
-    ]
-    for pattern in heading_patterns:
+    for pattern in ANALYSIS_HEADING_PATTERNS:
         match = re.search(pattern, body)
         if match:
             extracted = body[match.end() :].strip()
@@ -113,13 +146,7 @@ def _infer_title(body: str, path: Path) -> str:
 
 def _find_artifacts(text: str) -> list[dict[str, Any]]:
     spans: list[dict[str, Any]] = []
-    patterns = [
-        ("ellipsis", re.compile(r"\.\.\.")),
-        ("dash_fragment", re.compile(r"\b[A-Za-z]{1,15}-(?=\s|$)|--+")),
-        ("repeat_token", re.compile(r"\b([A-Za-z']{1,15})\s+\1\b", re.IGNORECASE)),
-        ("stutter_restart", re.compile(r"\b([A-Za-z]{1,6})-\s*[A-Za-z]{1,20}\b")),
-    ]
-    for kind, pattern in patterns:
+    for kind, pattern in ARTIFACT_PATTERNS:
         for index, match in enumerate(pattern.finditer(text)):
             spans.append(
                 {
@@ -131,26 +158,21 @@ def _find_artifacts(text: str) -> list[dict[str, Any]]:
                     "metadata": {},
                 }
             )
-    lowered = text.lower()
-    for filler in FILLERS:
-        if filler == "like":
-            pattern = re.compile(
-                r"(?:^|[,.;!?]\s+|\b(?:and|but|or|so)\s+)(like)(?=(?:\s+(?:i|you|we|he|she|they|it|this|that|what|a|an|the)\b|[,.!?]))"
-            )
-        else:
-            pattern = re.compile(rf"(?<![A-Za-z]){re.escape(filler)}(?![A-Za-z])")
-        for index, match in enumerate(pattern.finditer(lowered)):
-            start, end = match.span(1) if match.lastindex else match.span()
-            spans.append(
-                {
-                    "id": f"artifact:filler:{filler}:{index}",
-                    "kind": "filler",
-                    "start": start,
-                    "end": end,
-                    "text": text[start:end],
-                    "metadata": {"token": filler},
-                }
-            )
+    filler_indexes = dict.fromkeys(FILLERS, 0)
+    for match in FILLER_RE.finditer(text.lower()):
+        filler = FILLER_GROUPS[match.lastgroup]
+        start, end = match.span(match.lastgroup)
+        spans.append(
+            {
+                "id": f"artifact:filler:{filler}:{filler_indexes[filler]}",
+                "kind": "filler",
+                "start": start,
+                "end": end,
+                "text": text[start:end],
+                "metadata": {"token": filler},
+            }
+        )
+        filler_indexes[filler] += 1
     spans.sort(key=lambda item: (item["start"], item["end"]))
     return spans
 
@@ -162,8 +184,17 @@ def _segment_text(text: str, artifact_spans: list[dict[str, Any]]) -> list[dict[
     if boundaries[-1] != len(text):
         boundaries.append(len(text))
 
+    # Sweep spans in start order alongside the (increasing) segment boundaries so each span is
+    # visited a bounded number of times instead of once per segment.
+    ordered_spans = sorted(enumerate(artifact_spans), key=lambda item: item[1]["start"])
+    next_span = 0
+    active: list[tuple[int, dict[str, Any]]] = []
     segments: list[dict[str, Any]] = []
     for start, end in zip(boundaries, boundaries[1:]):
+        while next_span < len(ordered_spans) and ordered_spans[next_span][1]["start"] < end:
+            active.append(ordered_spans[next_span])
+            next_span += 1
+        active = [item for item in active if item[1]["end"] > start]
         segment_text = text[start:end].strip()
         if not segment_text:
             continue
@@ -176,11 +207,7 @@ def _segment_text(text: str, artifact_spans: list[dict[str, Any]]) -> list[dict[
                 "end": end,
                 "text": segment_text,
                 "token_count": len(WORD_RE.findall(segment_text)),
-                "artifact_span_ids": [
-                    span["id"]
-                    for span in artifact_spans
-                    if not (span["end"] <= start or span["start"] >= end)
-                ],
+                "artifact_span_ids": [span["id"] for _, span in sorted(active, key=lambda item: item[0])],
             }
         )
     return segments
@@ -236,18 +263,16 @@ def _infer_language(metadata: dict[str, Any], clean_body: str) -> str:
     return "en" if ascii_ratio > 0.95 else "und"
 
 
+def _is_speaker_line(line: str) -> bool:
+    stripped = line.strip()
+    return bool(SPEAKER_LINE_RE.match(stripped) or BRACKET_SPEAKER_RE.match(stripped))
+
+
 def _speaker_line_count(body: str) -> int:
-    count = 0
-    for line in body.splitlines():
-        stripped = line.strip()
-        if re.match(r"^([A-Za-z][A-Za-z0-9 _-]{0,20}|me|speaker \d+):\s", stripped, re.IGNORECASE):
-            count += 1
-        elif re.match(r"^\[[^\]]+\]\s", stripped):
-            count += 1
-    return count
+    return sum(1 for line in body.splitlines() if _is_speaker_line(line))
 
 
-def _infer_mode(metadata: dict[str, Any], body: str, clean_body: str, artifact_spans: list[dict[str, Any]]) -> str:
+def _infer_mode(metadata: dict[str, Any], clean_body: str, artifact_spans: list[dict[str, Any]], speaker_lines: int, body_restarts: int) -> str:
     explicit = str(metadata.get("analysis_mode") or metadata.get("mode") or "").strip().lower()
     if explicit in {"transcript", "speech", "spoken"}:
         return "transcript"
@@ -255,25 +280,144 @@ def _infer_mode(metadata: dict[str, Any], body: str, clean_body: str, artifact_s
         return "note"
 
     filler_count = sum(1 for span in artifact_spans if span["kind"] == "filler")
-    speaker_lines = _speaker_line_count(body)
     transcript_markers = filler_count + speaker_lines
     transcript_markers += len(re.findall(r"\b(um|uh|you know|i mean)\b", clean_body.lower()))
-    transcript_markers += len(re.findall(r"\b([A-Za-z]{1,6})-\s*[A-Za-z]{1,20}\b", body))
+    transcript_markers += body_restarts
     return "transcript" if transcript_markers >= 3 else "note"
 
 
-def load_markdown_source(path: str | Path) -> dict[str, Any]:
+def _read_frontmatter(handle: TextIO) -> tuple[dict[str, Any], str]:
+    """Read just the frontmatter block; returns metadata and the body text consumed with it."""
+    head = handle.readline()
+    if not FRONTMATTER_OPEN_RE.match(head):
+        return {}, head
+    while len(head) <= FRONTMATTER_SCAN_LIMIT:
+        line = handle.readline()
+        if not line:
+            break
+        head += line
+        if line.startswith("---") and FRONTMATTER_RE.match(head):
+            return parse_frontmatter(head)
+    return {}, head
+
+
+def _iter_body_lines(path: Path) -> Iterator[str]:
+    with path.open("r", encoding="utf-8") as handle:
+        _, consumed = _read_frontmatter(handle)
+        yield from io.StringIO(consumed)
+        yield from handle
+
+
+def _outline_body(lines: Iterable[str]) -> dict[str, Any]:
+    title = None
+    heading_lines: list[int | None] = [None] * len(ANALYSIS_HEADING_PATTERNS)
+    last_content_line = -1
+    speaker_lines = 0
+    restarts = 0
+    for index, line in enumerate(lines):
+        stripped = line.strip()
+        if not stripped:
+            continue
+        last_content_line = index
+        if title is None and stripped.startswith("# "):
+            title = stripped[2:].strip()
+        for position, pattern in enumerate(ANALYSIS_HEADING_PATTERNS):
+            if heading_lines[position] is None and re.match(pattern, line.rstrip("\n")):
+                heading_lines[position] = index
+        if _is_speaker_line(line):
+            speaker_lines += 1
+        restarts += len(RESTART_RE.findall(line))
+    start_line = 0
+    for heading_line in heading_lines:
+        if heading_line is not None and heading_line < last_content_line:
+            start_line = heading_line + 1
+            break
+    return {"title": title, "start_line": start_line, "speaker_lines": speaker_lines, "restarts": restarts}
+
+
+def _has_open_inline_markup(text: str) -> bool:
+    """Whether inline code or a link in text could still be closed by a later paragraph."""
+    text = re.sub(r"```.*?```", " ", text, flags=re.DOTALL)
+    if text.count("`") % 2:
+        return True
+    if text.rfind("[") > text.rfind("]"):
+        return True
+    target = text.rfind("](")
+    return target >= 0 and text.rfind(")") < target
+
+
+def _stream_clean_body(lines: Iterable[str], start_line: int) -> str:
+    # Blank lines outside code fences are paragraph breaks, so each paragraph can be stripped
+    # on its own; only the cleaned text is kept. Inline code and links that span a break are
+    # carried into the next paragraph so they strip as they would in the whole document.
+    parts: list[str] = []
+    chunk: list[str] = []
+    chunk_chars = 0
+    fence_open = False
+    seen_content = False
+    title_pending = False
+
+    def flush() -> None:
+        nonlocal chunk_chars
+        cleaned = _strip_markdown("".join(chunk))
+        if cleaned:
+            parts.append(cleaned)
+        chunk.clear()
+        chunk_chars = 0
+
+    for index, line in enumerate(lines):
+        if index < start_line:
+            continue
+        if not seen_content:
+            if not line.strip():
+                continue
+            seen_content = True
+            if re.match(r"\s*#\s", line):
+                # Like the whole-document title strip, a bare "#" also takes the next non-blank line.
+                title_pending = line.strip() == "#"
+                continue
+        if title_pending:
+            if line.strip():
+                title_pending = False
+            continue
+        if line.count("```") % 2:
+            fence_open = not fence_open
+        chunk.append(line)
+        chunk_chars += len(line)
+        if not fence_open and not line.strip():
+            if chunk_chars > STREAMING_CARRY_LIMIT_CHARS or not _has_open_inline_markup("".join(chunk)):
+                flush()
+    flush()
+    return " ".join(parts)
+
+
+def load_markdown_source(path: str | Path, stream: bool | None = None) -> dict[str, Any]:
     source_path = Path(path).resolve()
-    raw_text = source_path.read_text(encoding="utf-8")
-    metadata, body = parse_frontmatter(raw_text)
-    title = str(metadata.get("title") or _infer_title(body, source_path)).strip() or "Untitled"
-    analysis_body = _extract_analysis_body(body)
-    analysis_body = re.sub(r"^\s*#\s+.*(?:\n|$)", "", analysis_body, count=1)
-    clean_body = _strip_markdown(analysis_body)
+    if stream is None:
+        stream = source_path.stat().st_size > STREAMING_THRESHOLD_BYTES
+    if stream:
+        with source_path.open("r", encoding="utf-8") as handle:
+            metadata, _ = _read_frontmatter(handle)
+        outline = _outline_body(_iter_body_lines(source_path))
+        title = str(metadata.get("title") or outline["title"] or _infer_title("", source_path)).strip() or "Untitled"
+        # The raw body is never materialized when streaming.
+        analysis_body = None
+        clean_body = _stream_clean_body(_iter_body_lines(source_path), outline["start_line"])
+        speaker_lines = outline["speaker_lines"]
+        body_restarts = outline["restarts"]
+    else:
+        raw_text = source_path.read_text(encoding="utf-8")
+        metadata, body = parse_frontmatter(raw_text)
+        title = str(metadata.get("title") or _infer_title(body, source_path)).strip() or "Untitled"
+        analysis_body = _extract_analysis_body(body)
+        analysis_body = re.sub(r"^\s*#\s+.*(?:\n|$)", "", analysis_body, count=1)
+        clean_body = _strip_markdown(analysis_body)
+        speaker_lines = _speaker_line_count(body)
+        body_restarts = len(RESTART_RE.findall(body))
     artifact_spans = _find_artifacts(clean_body)
     segments = _segment_text(clean_body, artifact_spans)
     language = _infer_language(metadata, clean_body)
-    mode = _infer_mode(metadata, body, clean_body, artifact_spans)
+    mode = _infer_mode(metadata, clean_body, artifact_spans, speaker_lines, body_restarts)
     tags_raw = metadata.get("tags", [])
     if isinstance(tags_raw, str):
         tags = _split_csvish(tags_raw)
@@ -296,6 +440,7 @@ def load_markdown_source(path: str | Path) -> dict[str, Any]:
         "word_count": len(WORD_RE.findall(clean_body)),
         "artifact_spans": artifact_spans,
         "segments": segments,
+        "lexicon_matrix": build_lexicon_matrix(segment["text"] for segment in segments),
         "metadata": metadata,
         "language_eligible": language in DEFAULT_LANGUAGE_ALLOWLIST,
         "transcript_source": "transcribed_markdown" if metadata.get("transcription_model") or metadata.get("source_media") else "manual_markdown",
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import re
+from array import array
+from collections import Counter
+from typing import Iterable
+
+from .constants import (
+    ABSOLUTES,
+    ACTION_WORDS,
+    AGENCY_COMMITMENTS,
+    AGENCY_SOFTENERS,
+    ANCHOR_MARKERS,
+    APOLOGIES,
+    AUDIENCE_WORDS,
+    CLAIM_FOCUS_MARKERS,
+    CLAIM_MARKERS,
+    DISFLUENCY_MARKERS,
+    FEAR_WORDS,
+    FILLERS,
+    GENERIC_NOUNS,
+    HEDGES,
+    INTENSIFIERS,
+    MODALS,
+    PASSAGE_FILLERS,
+    REOPENERS,
+    REVERSAL_MARKERS,
+    SELF_ATTACK,
+    SPOKEN_FILLERS,
+    STRUCTURE_MARKERS,
+    TOPIC_RETURNS,
+    VAGUE_WORDS,
+)
+
+LETTER_RUN_RE = re.compile(r"[A-Za-z]+")
+
+# Every lexicon the engine counts. Order is stable so it can double as a column layout.
+MARKER_LEXICONS: dict[str, tuple[str, ...]] = {
+    "hedges": tuple(HEDGES),
+    "vague_words": tuple(VAGUE_WORDS),
+    "generic_nouns": tuple(GENERIC_NOUNS),
+    "modals": tuple(MODALS),
+    "structure": tuple(STRUCTURE_MARKERS),
+    "anchors": tuple(ANCHOR_MARKERS),
+    "actions": tuple(ACTION_WORDS),
+    "audience": tuple(AUDIENCE_WORDS),
+    "agency_softeners": tuple(AGENCY_SOFTENERS),
+    "agency_commitments": tuple(AGENCY_COMMITMENTS),
+    "reversals": tuple(REVERSAL_MARKERS),
+    "fear": tuple(FEAR_WORDS),
+    "self_attack": tuple(SELF_ATTACK),
+    "intensifiers": tuple(INTENSIFIERS),
+    "apologies": tuple(APOLOGIES),
+    "absolutes": tuple(ABSOLUTES),
+    "fillers": tuple(FILLERS),
+    "spoken_fillers": tuple(SPOKEN_FILLERS),
+    "passage_fillers": tuple(PASSAGE_FILLERS),
+    "disfluency": tuple(DISFLUENCY_MARKERS),
+    "reopeners": tuple(REOPENERS),
+    "topic_returns": tuple(TOPIC_RETURNS),
+    "claims": tuple(CLAIM_MARKERS),
+    "claim_focus": tuple(CLAIM_FOCUS_MARKERS),
+}
+LEXICON_NAMES = tuple(MARKER_LEXICONS)
+LEXICON_INDEX = {name: index for index, name in enumerate(LEXICON_NAMES)}
+LEXICON_WIDTH = len(LEXICON_NAMES)
+
+
+def _is_word_marker(marker: str) -> bool:
+    return LETTER_RUN_RE.fullmatch(marker) is not None
+
+
+def _bounded_marker_pattern(marker: str) -> re.Pattern[str]:
+    return re.compile(rf"(?<![A-Za-z]){re.escape(marker)}(?![A-Za-z])")
+
+
+def _marker_membership() -> dict[str, tuple[str, ...]]:
+    membership: dict[str, tuple[str, ...]] = {}
+    for name, markers in MARKER_LEXICONS.items():
+        for marker in markers:
+            membership[marker] = membership.get(marker, ()) + (name,)
+    return membership
+
+
+_MARKER_MEMBERSHIP = _marker_membership()
+KNOWN_MARKERS = frozenset(_MARKER_MEMBERSHIP)
+
+# Single-word markers made only of letters are counted straight from letter runs, which is
+# exactly what the bounded regex used to match. Phrases keep substring semantics and are found
+# in one overlapping lookahead pass; anything else (e.g. "...", "co-founder") gets its own pattern.
+PHRASE_MARKERS = tuple(sorted((marker for marker in KNOWN_MARKERS if " " in marker), key=lambda marker: (-len(marker), marker)))
+PHRASE_RE = re.compile("(?=(" + "|".join(re.escape(marker) for marker in PHRASE_MARKERS) + "))") if PHRASE_MARKERS else None
+_PHRASE_PREFIXES = {
+    phrase: tuple(other for other in PHRASE_MARKERS if phrase.startswith(other))
+    for phrase in PHRASE_MARKERS
+}
+BOUNDED_MARKER_PATTERNS = {
+    marker: _bounded_marker_pattern(marker)
+    for marker in sorted(KNOWN_MARKERS)
+    if " " not in marker and not _is_word_marker(marker)
+}
+
+
+def scan_markers(text: str) -> Counter[str]:
+    lowered = text.lower()
+    counts: Counter[str] = Counter(LETTER_RUN_RE.findall(lowered))
+    if PHRASE_RE is not None:
+        # str.count is non-overlapping per phrase, so keep a per-phrase resume offset.
+        resume_at: dict[str, int] = {}
+        for match in PHRASE_RE.finditer(lowered):
+            start = match.start()
+            for phrase in _PHRASE_PREFIXES[match.group(1)]:
+                if start >= resume_at.get(phrase, 0):
+                    counts[phrase] += 1
+                    resume_at[phrase] = start + len(phrase)
+    for marker, pattern in BOUNDED_MARKER_PATTERNS.items():
+        hits = len(pattern.findall(lowered))
+        if hits:
+            counts[marker] = hits
+    return counts
+
+
+def lexicon_counts(counts: Counter[str]) -> dict[str, int]:
+    totals = dict.fromkeys(LEXICON_NAMES, 0)
+    for marker, hits in counts.items():
+        for name in _MARKER_MEMBERSHIP.get(marker, ()):
+            totals[name] += hits
+    return totals
+
+
+def count_lexicons(text: str) -> dict[str, int]:
+    return lexicon_counts(scan_markers(text))
+
+
+def build_lexicon_matrix(texts: Iterable[str]) -> array[int]:
+    # Flat row-major segment x lexicon counts; row i holds LEXICON_NAMES counts for segment i.
+    matrix: array[int] = array("I")
+    for text in texts:
+        matrix.extend(count_lexicons(text).values())
+    return matrix
+
+
+def lexicon_row(matrix: array[int], row: int) -> dict[str, int]:
+    base = row * LEXICON_WIDTH
+    return dict(zip(LEXICON_NAMES, matrix[base : base + LEXICON_WIDTH]))
+
+
+def lexicon_total(matrix: array[int], row: int, names: Iterable[str]) -> int:
+    base = row * LEXICON_WIDTH
+    return sum(matrix[base + LEXICON_INDEX[name]] for name in names)
+
+
+def lexicon_column_totals(matrix: array[int]) -> dict[str, int]:
+    return {name: sum(matrix[index::LEXICON_WIDTH]) for index, name in enumerate(LEXICON_NAMES)}
@@ -4,6 +4,8 @@ import json
 from pathlib import Path
 from typing import Any
 
+from .compact import compact_reports_enabled, write_compact_report
+
 
 def _evidence_lookup(report: dict[str, Any]) -> dict[str, dict[str, Any]]:
     return {item["id"]: item for item in report.get("evidence", [])}
@@ -135,4 +137,7 @@ def write_report_files(report: dict[str, Any], markdown: str) -> tuple[Path, Pat
     markdown_path.parent.mkdir(parents=True, exist_ok=True)
     markdown_path.write_text(markdown, encoding="utf-8")
     json_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    # Written after the JSON so its mtime marks it as current for the summarizer.
+    if compact_reports_enabled():
+        write_compact_report(report, json_path)
     return markdown_path, json_path
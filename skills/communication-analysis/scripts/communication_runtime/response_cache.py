@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+DEFAULT_RESPONSE_CACHE_PATH = Path.home() / ".cache" / "communication-skill" / "llm-responses.sqlite3"
+RESPONSE_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+RESPONSE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+_stats: Counter[str] = Counter()
+_stats_lock = threading.Lock()
+
+
+def response_cache_path() -> Path | None:
+    configured = os.getenv("COMMUNICATION_SKILL_LLM_CACHE")
+    if configured == "0":
+        return None
+    return Path(configured).expanduser() if configured else DEFAULT_RESPONSE_CACHE_PATH
+
+
+def response_cache_stats() -> dict[str, int]:
+    with _stats_lock:
+        return {name: _stats[name] for name in ("hits", "misses", "stores", "evictions")}
+
+
+def _count(name: str, amount: int = 1) -> None:
+    with _stats_lock:
+        _stats[name] += amount
+
+
+def response_cache_key(
+    *,
+    model: str,
+    reasoning_effort: str,
+    schema_name: str,
+    schema: dict[str, Any],
+    system_prompt: str,
+    user_payload: dict[str, Any],
+) -> str:
+    canonical = json.dumps(
+        {
+            "model": model,
+            "reasoningEffort": reasoning_effort,
+            "schemaName": schema_name,
+            "schema": schema,
+            "systemPrompt": system_prompt,
+            "userPayload": user_payload,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(path, timeout=10)
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS responses ("
+        "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+    )
+    connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+    return connection
+
+
+def load_cached_response(key: str) -> dict[str, Any] | None:
+    path = response_cache_path()
+    if path is None:
+        return None
+    now = time.time()
+    try:
+        with closing(_connect(path)) as connection, connection:
+            row = connection.execute("SELECT value, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None or now - row[1] > RESPONSE_CACHE_TTL_SECONDS:
+                _count("misses")
+                return None
+            connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+    except (OSError, sqlite3.Error):
+        _count("misses")
+        return None
+    _count("hits")
+    return json.loads(row[0])
+
+
+def store_cached_response(key: str, response: dict[str, Any]) -> None:
+    path = response_cache_path()
+    if path is None:
+        return
+    value = json.dumps(response, separators=(",", ":"))
+    now = time.time()
+    try:
+        with closing(_connect(path)) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, value, len(value), now, now),
+            )
+            evicted = connection.execute("DELETE FROM responses WHERE created_at < ?", (now - RESPONSE_CACHE_TTL_SECONDS,)).rowcount
+            evicted += _evict_to_size(connection)
+    except (OSError, sqlite3.Error):
+        return
+    _count("stores")
+    if evicted:
+        _count("evictions", evicted)
+
+
+def _evict_to_size(connection: sqlite3.Connection) -> int:
+    total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+    if total <= RESPONSE_CACHE_MAX_BYTES:
+        return 0
+    # Drop least recently used entries until the store fits again.
+    stale: list[str] = []
+    for key, size in connection.execute("SELECT key, size FROM responses ORDER BY accessed_at"):
+        if total <= RESPONSE_CACHE_MAX_BYTES:
+            break
+        stale.append(key)
+        total -= size
+    connection.executemany("DELETE FROM responses WHERE key = ?", [(key,) for key in stale])
+    return len(stale)
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Iterator
+
+STORE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    source_path TEXT PRIMARY KEY,
+    json_path TEXT NOT NULL,
+    title TEXT NOT NULL,
+    analysis_mode TEXT NOT NULL,
+    language TEXT,
+    word_count INTEGER NOT NULL,
+    generated_at TEXT,
+    json_mtime_ns INTEGER,
+    json_size INTEGER,
+    report TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS findings (
+    source_path TEXT NOT NULL REFERENCES reports (source_path) ON DELETE CASCADE,
+    rank INTEGER NOT NULL,
+    dimension TEXT NOT NULL,
+    label TEXT NOT NULL,
+    severity REAL NOT NULL,
+    confidence REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS findings_dimension_severity ON findings (dimension, severity);
+CREATE TABLE IF NOT EXISTS vocabulary (
+    source_path TEXT NOT NULL REFERENCES reports (source_path) ON DELETE CASCADE,
+    rank INTEGER NOT NULL,
+    target_id TEXT NOT NULL,
+    label TEXT NOT NULL,
+    total_occurrences INTEGER NOT NULL,
+    overuse_score REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS vocabulary_target ON vocabulary (target_id, total_occurrences);
+CREATE TABLE IF NOT EXISTS evidence (
+    source_path TEXT NOT NULL REFERENCES reports (source_path) ON DELETE CASCADE,
+    evidence_id TEXT NOT NULL,
+    detector TEXT NOT NULL,
+    source_type TEXT NOT NULL,
+    label TEXT NOT NULL,
+    score REAL NOT NULL,
+    start INTEGER NOT NULL,
+    end INTEGER NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS evidence_source ON evidence (source_path);
+CREATE TABLE IF NOT EXISTS contexts (
+    source_path TEXT NOT NULL REFERENCES reports (source_path) ON DELETE CASCADE,
+    context TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS contexts_context ON contexts (context);
+"""
+
+
+def store_path() -> Path | None:
+    configured = os.getenv("COMMUNICATION_SKILL_STORE")
+    return Path(configured).expanduser().resolve() if configured else None
+
+
+def _connect(path: str | Path) -> sqlite3.Connection:
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(path, timeout=30)
+    connection.execute("PRAGMA foreign_keys = ON")
+    connection.execute("PRAGMA journal_mode = WAL")
+    connection.executescript(STORE_SCHEMA)
+    return connection
+
+
+def write_report_to_store(report: dict[str, Any], path: str | Path) -> None:
+    source = report["source"]
+    source_path = source["path"]
+    # Stamp the row with the report file it mirrors so readers can tell when the JSON was rewritten since.
+    json_stat = Path(source["analysis_json_path"]).stat()
+    with closing(_connect(path)) as connection, connection:
+        # Replacing the report row cascades to its findings, vocabulary, evidence and contexts.
+        connection.execute("DELETE FROM reports WHERE source_path = ?", (source_path,))
+        connection.execute(
+            "INSERT INTO reports (source_path, json_path, title, analysis_mode, language, word_count, generated_at, json_mtime_ns, json_size, report) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                source_path,
+                source["analysis_json_path"],
+                source["title"],
+                source["analysis_mode"],
+                source["language"],
+                source["word_count"],
+                report["metadata"]["generated_at"],
+                json_stat.st_mtime_ns,
+                json_stat.st_size,
+                json.dumps(report, separators=(",", ":")),
+            ),
+        )
+        connection.executemany(
+            "INSERT INTO findings (source_path, rank, dimension, label, severity, confidence) VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (source_path, rank, finding["dimension"], finding["label"], finding["severity"], finding["confidence"])
+                for rank, finding in enumerate(report["findings"])
+            ],
+        )
+        connection.executemany(
+            "INSERT INTO vocabulary (source_path, rank, target_id, label, total_occurrences, overuse_score) VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (source_path, rank, target["id"], target["label"], target["totalOccurrences"], target["overuseScore"])
+                for rank, target in enumerate(report["vocabulary"])
+            ],
+        )
+        connection.executemany(
+            "INSERT INTO evidence (source_path, evidence_id, detector, source_type, label, score, start, end, text) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (source_path, item["id"], item["detector"], item["sourceType"], item["label"], item["score"], item["start"], item["end"], item["text"])
+                for item in report["evidence"]
+            ],
+        )
+        connection.executemany(
+            "INSERT INTO contexts (source_path, context) VALUES (?, ?)",
+            [(source_path, context) for context in source["contexts"]],
+        )
+
+
+def delete_report_from_store(path: str | Path, source_path: str | Path) -> None:
+    with closing(_connect(path)) as connection, connection:
+        connection.execute("DELETE FROM reports WHERE source_path = ?", (str(source_path),))
+
+
+def _under_root(root: str | Path) -> tuple[str, str]:
+    # Every path below root/ sorts between "root/" and "root0", since "0" follows "/".
+    prefix = str(Path(root).resolve()).rstrip(os.sep) + os.sep
+    return prefix, prefix[:-1] + chr(ord(os.sep) + 1)
+
+
+def stored_source_paths(path: str | Path, root: str | Path) -> set[str]:
+    if not Path(path).exists():
+        return set()
+    low, high = _under_root(root)
+    with closing(_connect(path)) as connection:
+        return {row[0] for row in connection.execute("SELECT source_path FROM reports WHERE source_path >= ? AND source_path < ?", (low, high))}
+
+
+def iter_stored_reports(path: str | Path, root: str | Path) -> Iterator[tuple[Path, dict[str, Any] | None]]:
+    """Yield (json_path, report) for sources under root, in the same order as a sorted analysis/ crawl.
+
+    The report is None when its JSON on disk no longer matches the stamp taken when it was
+    stored, e.g. after a run without the store configured; the caller reads the JSON instead.
+    Rows whose JSON is gone are skipped, as the crawl would skip them.
+    """
+    low, high = _under_root(root)
+    with closing(_connect(path)) as connection:
+        rows = connection.execute(
+            "SELECT source_path, json_path, json_mtime_ns, json_size FROM reports WHERE source_path >= ? AND source_path < ?", (low, high)
+        ).fetchall()
+        for source_path, json_path, mtime_ns, size in sorted(rows, key=lambda row: Path(row[1])):
+            try:
+                stat = Path(json_path).stat()
+            except OSError:
+                continue
+            if stat.st_mtime_ns != mtime_ns or stat.st_size != size:
+                yield Path(json_path), None
+                continue
+            row = connection.execute("SELECT report FROM reports WHERE source_path = ?", (source_path,)).fetchone()
+            if row is not None:
+                yield Path(json_path), json.loads(row[0])
+
+
+def query_reports_by_finding(
+    path: str | Path,
+    dimension: str,
+    min_severity: float = 0,
+    context: str | None = None,
+    root: str | Path | None = None,
+) -> list[dict[str, Any]]:
+    """Files whose finding for dimension scores at least min_severity, strongest first."""
+    sql = (
+        "SELECT reports.source_path, reports.json_path, reports.title, findings.severity FROM findings "
+        "JOIN reports ON reports.source_path = findings.source_path "
+        "WHERE findings.dimension = ? AND findings.severity >= ?"
+    )
+    params: list[Any] = [dimension, min_severity]
+    if context is not None:
+        sql += " AND EXISTS (SELECT 1 FROM contexts WHERE contexts.source_path = findings.source_path AND contexts.context = ?)"
+        params.append(context)
+    if root is not None:
+        sql += " AND findings.source_path >= ? AND findings.source_path < ?"
+        params.extend(_under_root(root))
+    sql += " ORDER BY findings.severity DESC, reports.title"
+    with closing(_connect(path)) as connection:
+        return [
+            {"source_path": source_path, "analysis_json_path": json_path, "title": title, "severity": severity}
+            for source_path, json_path, title, severity in connection.execute(sql, params)
+        ]
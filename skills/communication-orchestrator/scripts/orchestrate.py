@@ -4,13 +4,35 @@ import argparse
 import json
 import subprocess
 import sys
+import threading
+import time
 from pathlib import Path
+from typing import Callable
 
 
 REPO_ROOT = Path(__file__).resolve().parents[3]
-ANALYZE_SCRIPT = REPO_ROOT / "skills" / "communication-analysis" / "scripts" / "analyze_file.py"
-SUMMARY_SCRIPT = REPO_ROOT / "skills" / "communication-summary" / "scripts" / "summarize_folder.py"
+ANALYSIS_SCRIPTS = REPO_ROOT / "skills" / "communication-analysis" / "scripts"
+SUMMARY_SCRIPTS = REPO_ROOT / "skills" / "communication-summary" / "scripts"
+SUMMARY_SCRIPT = SUMMARY_SCRIPTS / "summarize_folder.py"
 SKIP_DIRS = {"analysis", "repairs", ".git", "node_modules", "__pycache__"}
+DEFAULT_DEBOUNCE_SECONDS = 1.0
+DEFAULT_POLL_INTERVAL_SECONDS = 1.0
+WRITE_EVENT_TYPES = {"created", "modified", "moved", "deleted", "closed"}
+
+sys.path.append(str(ANALYSIS_SCRIPTS))
+sys.path.append(str(SUMMARY_SCRIPTS))
+
+from communication_runtime.batch import analyze_source, analyze_sources  # noqa: E402
+from communication_runtime.cache import cache_path  # noqa: E402
+from communication_runtime.store import delete_report_from_store, store_path, stored_source_paths  # noqa: E402
+from summarize_folder import build_summary, write_summary  # noqa: E402
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # watchdog is optional; watch mode falls back to mtime polling.
+    FileSystemEventHandler = object
+    Observer = None
 
 
 def _run_script(script: Path, target: Path) -> dict:
@@ -23,13 +45,12 @@ def _run_script(script: Path, target: Path) -> dict:
     return json.loads(result.stdout)
 
 
+def _is_source_markdown(path: Path) -> bool:
+    return path.suffix.lower() == ".md" and not any(part in SKIP_DIRS for part in path.parts)
+
+
 def _discover_markdown_files(root: Path) -> list[Path]:
-    files: list[Path] = []
-    for path in root.rglob("*.md"):
-        if any(part in SKIP_DIRS for part in path.parts):
-            continue
-        files.append(path)
-    return sorted(files)
+    return sorted(path for path in root.rglob("*.md") if _is_source_markdown(path))
 
 
 def _analysis_artifacts_exist(source: Path) -> bool:
@@ -37,7 +58,7 @@ def _analysis_artifacts_exist(source: Path) -> bool:
     return (output_dir / f"{source.stem}.md").exists() and (output_dir / f"{source.stem}.json").exists()
 
 
-def orchestrate(target: Path, force: bool = False) -> dict:
+def orchestrate(target: Path, force: bool = False, workers: int | None = None) -> dict:
     target = target.resolve()
     if not target.exists():
         raise SystemExit(f"Target does not exist: {target}")
@@ -45,20 +66,25 @@ def orchestrate(target: Path, force: bool = False) -> dict:
     if target.is_file():
         if target.suffix.lower() != ".md":
             raise SystemExit(f"Target must be a markdown file: {target}")
-        result = _run_script(ANALYZE_SCRIPT, target)
+        result = analyze_source(target, use_cache=False if force else None)
         return {"ok": True, "mode": "file", "analyzed": [result], "summary": None}
 
     markdown_files = _discover_markdown_files(target)
     if not markdown_files:
         raise SystemExit(f"No markdown files found under {target}")
 
-    analyzed: list[dict] = []
+    store = store_path()
+    # With a store configured, files missing from it are analyzed again so the store stays complete.
+    stored = stored_source_paths(store, target) if store is not None else None
+    pending: list[Path] = []
     skipped: list[str] = []
     for path in markdown_files:
-        if not force and _analysis_artifacts_exist(path):
+        if not force and _analysis_artifacts_exist(path) and (stored is None or str(path.resolve()) in stored):
             skipped.append(str(path))
             continue
-        analyzed.append(_run_script(ANALYZE_SCRIPT, path))
+        pending.append(path)
+    # --force also bypasses the per-note report cache, so a cached report cannot survive a rebuild.
+    analyzed = analyze_sources(pending, workers=workers, use_cache=False if force else None)
 
     summary = _run_script(SUMMARY_SCRIPT, target)
     return {
@@ -70,14 +96,174 @@ def orchestrate(target: Path, force: bool = False) -> dict:
     }
 
 
+class _PollingChanges:
+    """Detect changed notes by diffing mtime/size snapshots of the tree."""
+
+    def __init__(self, root: Path, interval: float) -> None:
+        self.root = root
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        snapshot: dict[Path, tuple[int, int]] = {}
+        for path in _discover_markdown_files(self.root):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def poll(self, stop: threading.Event) -> set[Path]:
+        if stop.wait(self.interval):
+            return set()
+        previous, self._snapshot = self._snapshot, self._scan()
+        changed = {path for path, signature in self._snapshot.items() if previous.get(path) != signature}
+        return changed | (previous.keys() - self._snapshot.keys())
+
+    def close(self) -> None:
+        return
+
+
+class _EventChanges(FileSystemEventHandler):
+    """Collect changed notes from filesystem events (inotify, FSEvents, ...) via watchdog."""
+
+    def __init__(self, root: Path, interval: float) -> None:
+        super().__init__()
+        self.interval = interval
+        self._changed: set[Path] = set()
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._observer = Observer()
+        self._observer.schedule(self, str(root), recursive=True)
+        self._observer.start()
+
+    def on_any_event(self, event) -> None:
+        # Reading a note while analyzing it raises opened/closed_no_write events; only writes count.
+        if event.event_type not in WRITE_EVENT_TYPES:
+            return
+        paths = [event.src_path, getattr(event, "dest_path", "")]
+        changed = {Path(path) for path in paths if path and _is_source_markdown(Path(path))}
+        if changed:
+            with self._lock:
+                self._changed |= changed
+            self._ready.set()
+
+    def poll(self, stop: threading.Event) -> set[Path]:
+        self._ready.wait(self.interval)
+        with self._lock:
+            changed, self._changed = self._changed, set()
+            self._ready.clear()
+        return changed
+
+    def close(self) -> None:
+        self._observer.stop()
+        self._observer.join()
+
+
+def _remove_analysis_artifacts(source: Path) -> None:
+    output_dir = source.parent / "analysis"
+    for suffix in (".md", ".json", ".compact"):
+        (output_dir / f"{source.stem}{suffix}").unlink(missing_ok=True)
+    cache_path(source).unlink(missing_ok=True)
+    store = store_path()
+    if store is not None and store.exists():
+        delete_report_from_store(store, source)
+
+
+def _refresh_folder(root: Path, changed: set[Path], workers: int | None) -> dict:
+    present = sorted(path for path in changed if path.exists())
+    removed = sorted(str(path) for path in changed if not path.exists())
+    for path in removed:
+        _remove_analysis_artifacts(Path(path))
+    # One unreadable note is reported in its result instead of stopping the watch.
+    analyzed = analyze_sources(present, workers=workers, keep_going=True)
+    try:
+        # The summary index only re-reads the reports that were just rewritten.
+        summary = build_summary(root)
+    except SystemExit:
+        # No reports left under the folder (the last note was deleted): drop the stale summary.
+        for name in ("index.md", "index.json"):
+            (root / "analysis" / name).unlink(missing_ok=True)
+        summary_payload = {"ok": True, "folder": str(root), "report_count": 0}
+    else:
+        markdown_path, json_path = write_summary(summary)
+        summary_payload = {
+            "ok": True,
+            "folder": str(root),
+            "analysis_markdown_path": str(markdown_path),
+            "analysis_json_path": str(json_path),
+            "report_count": summary["metadata"]["report_count"],
+        }
+    return {
+        "ok": all(result["ok"] for result in analyzed),
+        "mode": "watch",
+        "analyzed": analyzed,
+        "removed": removed,
+        "summary": summary_payload,
+    }
+
+
+def watch(
+    target: Path,
+    debounce: float = DEFAULT_DEBOUNCE_SECONDS,
+    interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+    workers: int | None = 1,
+    on_cycle: Callable[[dict], None] | None = None,
+    stop: threading.Event | None = None,
+    use_events: bool = True,
+) -> None:
+    """Keep a folder's analysis current, re-analyzing notes once a burst of edits goes quiet."""
+    target = target.resolve()
+    if not target.is_dir():
+        raise SystemExit(f"Watch target must be a folder: {target}")
+    stop = stop or threading.Event()
+    changes = _EventChanges(target, interval) if use_events and Observer is not None else _PollingChanges(target, interval)
+    pending: set[Path] = set()
+    last_change = 0.0
+    try:
+        while not stop.is_set():
+            changed = changes.poll(stop)
+            if changed:
+                pending |= changed
+                last_change = time.monotonic()
+                continue
+            if pending and time.monotonic() - last_change >= debounce:
+                try:
+                    payload = _refresh_folder(target, pending, workers)
+                except Exception as exc:
+                    # A failed cycle (e.g. a store error) is reported and the watch carries on.
+                    payload = {"ok": False, "mode": "watch", "changed": sorted(str(path) for path in pending), "error": f"{type(exc).__name__}: {exc}"}
+                pending = set()
+                if on_cycle is not None:
+                    on_cycle(payload)
+    finally:
+        changes.close()
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Route a file or folder through the communication analysis skill suite.")
     parser.add_argument("target_path", help="Markdown file or folder to analyze")
     parser.add_argument("--force", action="store_true", help="Rebuild per-file analysis even when artifacts already exist")
+    parser.add_argument("--workers", type=int, default=None, help="Analysis worker processes for folder runs (default: CPU count, 1 runs inline)")
+    parser.add_argument("--watch", action="store_true", help="After the initial run, keep re-analyzing notes as they change")
+    parser.add_argument("--debounce", type=float, default=DEFAULT_DEBOUNCE_SECONDS, help="Seconds of quiet before a burst of edits is processed in watch mode")
+    parser.add_argument("--poll-interval", type=float, default=DEFAULT_POLL_INTERVAL_SECONDS, help="Seconds between change checks in watch mode")
     args = parser.parse_args()
 
-    payload = orchestrate(Path(args.target_path), force=args.force)
-    print(json.dumps(payload, indent=2))
+    payload = orchestrate(Path(args.target_path), force=args.force, workers=args.workers)
+    print(json.dumps(payload, indent=2), flush=True)
+    if args.watch:
+        try:
+            watch(
+                Path(args.target_path),
+                debounce=args.debounce,
+                interval=args.poll_interval,
+                workers=args.workers or 1,
+                on_cycle=lambda cycle: print(json.dumps(cycle), flush=True),
+            )
+        except KeyboardInterrupt:
+            return
 
 
 if __name__ == "__main__":
@@ -1,55 +1,191 @@
 from __future__ import annotations
 
 import argparse
+import heapq
+import importlib
+import itertools
 import json
-from collections import Counter, defaultdict
+import os
+import sys
+from array import array
+from collections import Counter
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+ANALYSIS_SCRIPTS = REPO_ROOT / "skills" / "communication-analysis" / "scripts"
 
 
 def _now() -> str:
     return datetime.now(UTC).isoformat()
 
 
-def _discover_reports(root: Path) -> list[dict[str, Any]]:
-    reports = []
-    for path in sorted(root.rglob("analysis/*.json")):
-        if path.name == "index.json":
-            continue
+SUMMARY_INDEX_VERSION = 1
+SUMMARY_GROUP_LIMIT = 6
+SUMMARY_STRENGTH_LIMIT = 5
+SUMMARY_EVIDENCE_LIMIT = 10
+
+
+def _analysis_runtime(name: str) -> Any:
+    """Import a communication_runtime module on first use, or None when the analysis skill is not alongside."""
+    if str(ANALYSIS_SCRIPTS) not in sys.path:
+        sys.path.append(str(ANALYSIS_SCRIPTS))
+    try:
+        return importlib.import_module(f"communication_runtime.{name}")
+    except ImportError:
+        return None
+
+
+def _summary_index_path(root: Path) -> Path:
+    return root / "analysis" / ".cache" / "summary-index.jsonl"
+
+
+def _report_digest(report: dict[str, Any]) -> dict[str, Any]:
+    """Project a report down to the fields the folder summary aggregates."""
+    source = report["source"]
+    return {
+        "source": {
+            "title": source["title"],
+            "path": source["path"],
+            "analysis_markdown_path": source["analysis_markdown_path"],
+            "analysis_mode": source["analysis_mode"],
+            "contexts": source.get("contexts", []),
+        },
+        "findings": [
+            {
+                "dimension": finding["dimension"],
+                "label": finding["label"],
+                "severity": finding["severity"],
+                "why_it_matters": finding["why_it_matters"],
+            }
+            for finding in report["findings"]
+        ],
+        "vocabulary": [
+            {
+                "id": target["id"],
+                "label": target["label"],
+                "totalOccurrences": target["totalOccurrences"],
+                "why_it_limits_you": target["why_it_limits_you"],
+            }
+            for target in report.get("vocabulary", [])
+        ],
+        "strengths": [
+            {
+                "label": strength["label"],
+                "score": strength["score"],
+                "explanation": strength["explanation"],
+                "evidence_text": strength.get("evidence_text", ""),
+            }
+            for strength in report.get("strengths", [])
+            if strength.get("kind") == "counterexample"
+        ],
+        "evidence": [
+            {"label": item["label"], "text": item["text"], "rationale": item["rationale"]}
+            for item in report.get("evidence", [])[:2]
+        ],
+    }
+
+
+def _read_report_digest(path: Path) -> dict[str, Any] | None:
+    # Prefer the compact sidecar written next to the report; fall back to the indented JSON.
+    compact = _analysis_runtime("compact")
+    report = compact.read_compact_report(path) if compact is not None else None
+    if report is None:
         try:
             report = json.loads(path.read_text(encoding="utf-8"))
         except json.JSONDecodeError:
-            continue
-        if "source" not in report or "findings" not in report:
-            continue
-        reports.append(report)
-    return reports
+            return None
+    if "source" not in report or "findings" not in report:
+        return None
+    return _report_digest(report)
 
 
-def _relative(root: Path, target: str | Path) -> str:
-    return str(Path(target).resolve().relative_to(root.resolve()))
+def _iter_summary_index(root: Path) -> Iterator[dict[str, Any]]:
+    try:
+        with _summary_index_path(root).open(encoding="utf-8") as handle:
+            header = json.loads(handle.readline() or "{}")
+            if header.get("version") != SUMMARY_INDEX_VERSION:
+                return
+            for line in handle:
+                yield json.loads(line)
+    except (OSError, json.JSONDecodeError):
+        return
 
 
-def build_summary(root: Path) -> dict[str, Any]:
-    reports = _discover_reports(root)
-    if not reports:
-        raise SystemExit(f"No analysis artifacts found under {root}")
+def _iter_report_paths(root: Path) -> Iterator[Path]:
+    for path in sorted(root.rglob("analysis/*.json")):
+        if path.name != "index.json":
+            yield path
+
+
+def _iter_report_digests(root: Path) -> Iterator[dict[str, Any]]:
+    """Yield one digest per report in path order, holding at most one report in memory.
+
+    The previous index is in the same path order, so it is merge-joined against the walk:
+    reports whose mtime and size match reuse their stored digest and only new or changed
+    reports are parsed. The refreshed index is written alongside and swapped in at the end.
+    """
+    index_path = _summary_index_path(root)
+    temp_path = index_path.with_suffix(".tmp")
+    previous = _iter_summary_index(root)
+    pending = next(previous, None)
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        index_out = temp_path.open("w", encoding="utf-8")
+    except OSError:
+        index_out = None
+    if index_out is not None:
+        index_out.write(json.dumps({"version": SUMMARY_INDEX_VERSION}) + "\n")
+
+    for path in _iter_report_paths(root):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        relative = path.relative_to(root)
+        while pending is not None and Path(pending["path"]) < relative:
+            pending = next(previous, None)
+        entry = pending if pending is not None and Path(pending["path"]) == relative else None
+        if entry is None or entry["mtime_ns"] != stat.st_mtime_ns or entry["size"] != stat.st_size:
+            entry = {"path": relative.as_posix(), "mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "digest": _read_report_digest(path)}
+        if index_out is not None:
+            index_out.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        if entry["digest"] is not None:
+            yield entry["digest"]
+
+    previous.close()
+    if index_out is not None:
+        index_out.close()
+        try:
+            temp_path.replace(index_path)
+        except OSError:
+            return
 
-    finding_groups: dict[str, list[dict[str, Any]]] = defaultdict(list)
-    vocabulary_groups: dict[str, list[dict[str, Any]]] = defaultdict(list)
-    context_counter: Counter[str] = Counter()
-    file_priorities: list[dict[str, Any]] = []
-    strengths: list[dict[str, Any]] = []
-    evidence: list[dict[str, Any]] = []
 
-    for report in reports:
+class _FolderAggregate:
+    """Running folder totals folded from one report digest at a time."""
+
+    def __init__(self, strength_limit: int, evidence_limit: int) -> None:
+        self.report_count = 0
+        self.finding_groups: dict[str, dict[str, Any]] = {}
+        self.vocabulary_groups: dict[str, dict[str, Any]] = {}
+        self.context_counter: Counter[str] = Counter()
+        self.file_priorities: list[dict[str, Any]] = []
+        self.evidence: list[dict[str, Any]] = []
+        self._strength_limit = strength_limit
+        self._evidence_limit = evidence_limit
+        # Min-heap of the best strengths so far; ties keep the earliest report, like a stable sort.
+        self._strength_heap: list[tuple[float, int, dict[str, Any]]] = []
+        self._strength_seq = 0
+
+    def add(self, report: dict[str, Any]) -> None:
+        self.report_count += 1
         source = report["source"]
         report_path = source["analysis_markdown_path"]
-        contexts = source.get("contexts", [])
-        context_counter.update(contexts)
+        self.context_counter.update(source["contexts"])
         strongest_finding = report["findings"][0] if report["findings"] else None
-        file_priorities.append(
+        self.file_priorities.append(
             {
                 "title": source["title"],
                 "source_path": source["path"],
@@ -59,83 +195,154 @@ def build_summary(root: Path) -> dict[str, Any]:
                 "mode": source["analysis_mode"],
             }
         )
-        for finding in report.get("findings", []):
-            finding_groups[finding["dimension"]].append(
-                {
+        for finding in report["findings"]:
+            group = self.finding_groups.get(finding["dimension"])
+            if group is None:
+                group = self.finding_groups[finding["dimension"]] = {
                     "label": finding["label"],
-                    "severity": finding["severity"],
                     "why_it_matters": finding["why_it_matters"],
-                    "source_title": source["title"],
-                    "report_path": report_path,
+                    "severities": array("d"),
+                    "examples": [],
                 }
-            )
-        for target in report.get("vocabulary", []):
-            vocabulary_groups[target["id"]].append(
-                {
+            # Severities stay as a float array so the average is summed exactly as before.
+            group["severities"].append(finding["severity"])
+            if len(group["examples"]) < 3:
+                group["examples"].append(
+                    {
+                        "label": finding["label"],
+                        "severity": finding["severity"],
+                        "why_it_matters": finding["why_it_matters"],
+                        "source_title": source["title"],
+                        "report_path": report_path,
+                    }
+                )
+        for target in report["vocabulary"]:
+            group = self.vocabulary_groups.get(target["id"])
+            if group is None:
+                group = self.vocabulary_groups[target["id"]] = {
                     "label": target["label"],
-                    "total_occurrences": target["totalOccurrences"],
                     "why_it_limits_you": target["why_it_limits_you"],
-                    "source_title": source["title"],
-                    "report_path": report_path,
+                    "affected_files": 0,
+                    "total_occurrences": 0,
+                    "examples": [],
                 }
-            )
-        for strength in report.get("strengths", []):
-            if strength.get("kind") == "counterexample":
-                strengths.append(
+            group["affected_files"] += 1
+            group["total_occurrences"] += target["totalOccurrences"]
+            if len(group["examples"]) < 3:
+                group["examples"].append(
                     {
-                        "title": source["title"],
+                        "label": target["label"],
+                        "total_occurrences": target["totalOccurrences"],
+                        "why_it_limits_you": target["why_it_limits_you"],
+                        "source_title": source["title"],
                         "report_path": report_path,
-                        "label": strength["label"],
-                        "score": strength["score"],
-                        "explanation": strength["explanation"],
-                        "evidence_text": strength.get("evidence_text", ""),
                     }
                 )
-        for item in report.get("evidence", [])[:2]:
-            evidence.append(
-                {
-                    "source_title": source["title"],
-                    "report_path": report_path,
-                    "label": item["label"],
-                    "text": item["text"],
-                    "rationale": item["rationale"],
-                }
-            )
+        for strength in report["strengths"]:
+            item = (strength["score"], -self._strength_seq, {"title": source["title"], "report_path": report_path, **strength})
+            self._strength_seq += 1
+            if len(self._strength_heap) < self._strength_limit:
+                heapq.heappush(self._strength_heap, item)
+            elif item[:2] > self._strength_heap[0][:2]:
+                heapq.heapreplace(self._strength_heap, item)
+        for item in report["evidence"]:
+            if len(self.evidence) >= self._evidence_limit:
+                break
+            self.evidence.append({"source_title": source["title"], "report_path": report_path, **item})
+
+    def strengths(self) -> list[dict[str, Any]]:
+        return [item for _, _, item in sorted(self._strength_heap, key=lambda entry: (-entry[0], -entry[1]))]
+
 
-    recurring_findings = []
-    for dimension, items in finding_groups.items():
-        avg_severity = sum(item["severity"] for item in items) / len(items)
-        recurring_findings.append(
+def _relative(root: Path, target: str | Path) -> str:
+    return str(Path(target).resolve().relative_to(root.resolve()))
+
+
+def _recurring_findings(aggregate: _FolderAggregate, limit: int) -> list[dict[str, Any]]:
+    # heapq.nsmallest is documented to equal sorted(...)[:limit], ties included.
+    return heapq.nsmallest(
+        limit,
+        (
             {
                 "id": f"summary:{dimension}",
                 "dimension": dimension,
-                "label": items[0]["label"],
-                "severity": round(avg_severity, 1),
-                "affected_files": len(items),
-                "why_it_matters": items[0]["why_it_matters"],
-                "examples": items[:3],
+                "label": group["label"],
+                "severity": round(sum(group["severities"]) / len(group["severities"]), 1),
+                "affected_files": len(group["severities"]),
+                "why_it_matters": group["why_it_matters"],
+                "examples": group["examples"],
             }
-        )
-    recurring_findings.sort(key=lambda item: (-item["affected_files"], -item["severity"], item["label"]))
+            for dimension, group in aggregate.finding_groups.items()
+        ),
+        key=lambda item: (-item["affected_files"], -item["severity"], item["label"]),
+    )
 
-    recurring_vocabulary = []
-    for target_id, items in vocabulary_groups.items():
-        total_occurrences = sum(item["total_occurrences"] for item in items)
-        recurring_vocabulary.append(
+
+def _recurring_vocabulary(aggregate: _FolderAggregate, limit: int) -> list[dict[str, Any]]:
+    return heapq.nsmallest(
+        limit,
+        (
             {
                 "id": f"summary:vocab:{target_id}",
                 "target_id": target_id,
-                "label": items[0]["label"],
-                "total_occurrences": total_occurrences,
-                "affected_files": len(items),
-                "why_it_limits_you": items[0]["why_it_limits_you"],
-                "examples": items[:3],
+                "label": group["label"],
+                "total_occurrences": group["total_occurrences"],
+                "affected_files": group["affected_files"],
+                "why_it_limits_you": group["why_it_limits_you"],
+                "examples": group["examples"],
             }
-        )
-    recurring_vocabulary.sort(key=lambda item: (-item["affected_files"], -item["total_occurrences"], item["label"]))
+            for target_id, group in aggregate.vocabulary_groups.items()
+        ),
+        key=lambda item: (-item["affected_files"], -item["total_occurrences"], item["label"]),
+    )
+
+
+def _iter_store_digests(root: Path, stored: Iterator[tuple[Path, dict[str, Any] | None]]) -> Iterator[dict[str, Any]]:
+    """Merge-join stored reports against the reports on disk, both in path order.
+
+    Reports missing from the store (analyzed without it configured) or changed since they
+    were stored are read from their JSON, so the summary covers the same files as a crawl.
+    """
+    pending = next(stored, None)
+    for path in _iter_report_paths(root.resolve()):
+        while pending is not None and pending[0] < path:
+            pending = next(stored, None)
+        report = pending[1] if pending is not None and pending[0] == path else None
+        if report is None:
+            digest = _read_report_digest(path)
+        elif "source" in report and "findings" in report:
+            digest = _report_digest(report)
+        else:
+            digest = None
+        if digest is not None:
+            yield digest
+
+
+def build_summary(root: Path, store: Path | None = None) -> dict[str, Any]:
+    aggregate = _FolderAggregate(strength_limit=SUMMARY_STRENGTH_LIMIT, evidence_limit=SUMMARY_EVIDENCE_LIMIT)
+    store_module = _analysis_runtime("store") if store is not None or os.getenv("COMMUNICATION_SKILL_STORE") else None
+    if store_module is not None:
+        store = store or store_module.store_path()
+    if store_module is not None and store is not None and store.exists():
+        stored = store_module.iter_stored_reports(store, root)
+        first = next(stored, None)
+        if first is not None:
+            for report in _iter_store_digests(root, itertools.chain([first], stored)):
+                aggregate.add(report)
+    if not aggregate.report_count:
+        # No store, or nothing stored under this folder yet: crawl the analysis/ folders.
+        for report in _iter_report_digests(root):
+            aggregate.add(report)
+    if not aggregate.report_count:
+        raise SystemExit(f"No analysis artifacts found under {root}")
+    context_counter = aggregate.context_counter
+
+    recurring_findings = _recurring_findings(aggregate, SUMMARY_GROUP_LIMIT)
+    recurring_vocabulary = _recurring_vocabulary(aggregate, SUMMARY_GROUP_LIMIT)
 
-    file_priorities.sort(key=lambda item: (-item["top_severity"], item["title"]))
-    strengths.sort(key=lambda item: item["score"], reverse=True)
+    file_priorities = sorted(aggregate.file_priorities, key=lambda item: (-item["top_severity"], item["title"]))
+    strengths = aggregate.strengths()
+    evidence = aggregate.evidence
 
     weekly_priorities = []
     for finding in recurring_findings[:2]:
@@ -165,14 +372,14 @@ def build_summary(root: Path) -> dict[str, Any]:
             "executive_diagnosis": f"The folder shows recurring pressure around {recurring_findings[0]['label'].lower() if recurring_findings else 'communication clarity'} and repeated vocabulary drag from {recurring_vocabulary[0]['label'].lower() if recurring_vocabulary else 'generic wording'}.",
             "weekly_theme": weekly_priorities[0] if weekly_priorities else "Consolidate the recurring patterns before expanding the scope of practice.",
             "snapshot": {
-                "file_count": len(reports),
+                "file_count": aggregate.report_count,
                 "contexts": [label for label, _ in context_counter.most_common(6)],
-                "report_count": len(reports),
+                "report_count": aggregate.report_count,
             },
         },
-        "findings": recurring_findings[:6],
-        "vocabulary": recurring_vocabulary[:6],
-        "strengths": strengths[:5],
+        "findings": recurring_findings,
+        "vocabulary": recurring_vocabulary,
+        "strengths": strengths,
         "practice_systems": [
             {
                 "id": f"summary:practice:{index}",
@@ -193,11 +400,11 @@ def build_summary(root: Path) -> dict[str, Any]:
             "contexts": [label for label, _ in context_counter.most_common(4)],
             "repair_targets": [item["label"] for item in recurring_findings[:3]],
         },
-        "evidence": evidence[:10],
+        "evidence": evidence,
         "metadata": {
             "generated_at": _now(),
             "report_version": "1.0.0",
-            "report_count": len(reports),
+            "report_count": aggregate.report_count,
             "file_priorities": [
                 {
                     **item,
@@ -273,13 +480,14 @@ def write_summary(summary: dict[str, Any]) -> tuple[Path, Path]:
 def main() -> None:
     parser = argparse.ArgumentParser(description="Summarize a folder of communication analysis artifacts.")
     parser.add_argument("folder_path", help="Folder containing markdown sources and analysis artifacts")
+    parser.add_argument("--store", help="SQLite analysis store to read instead of crawling analysis/ folders (default: $COMMUNICATION_SKILL_STORE)")
     args = parser.parse_args()
 
     root = Path(args.folder_path).resolve()
     if not root.exists() or not root.is_dir():
         raise SystemExit(f"Folder not found: {root}")
 
-    summary = build_summary(root)
+    summary = build_summary(root, Path(args.store).resolve() if args.store else None)
     markdown_path, json_path = write_summary(summary)
     print(
         json.dumps(
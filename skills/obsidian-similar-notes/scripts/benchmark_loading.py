@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Benchmark Smart Connections embedding loading on a synthetic vault.
+
+Times an uncached parse of every .ajson file at several worker counts, then a cold
+and a warm load through the compiled embedding cache.
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from utils.smart_connections import (  # noqa: E402
+    DEFAULT_MODEL,
+    SMART_ENV_DIR,
+    load_embedding_matrix,
+    path_to_ajson_name,
+)
+
+
+def build_synthetic_vault(vault_root, files, dim, blocks, seed=7):
+    """Write one .ajson file per synthetic note, each with a note vector and `blocks` block vectors."""
+    smart_env = os.path.join(vault_root, SMART_ENV_DIR)
+    os.makedirs(smart_env, exist_ok=True)
+    rng = random.Random(seed)
+
+    def entry(extra):
+        vec = [round(rng.uniform(-1, 1), 5) for _ in range(dim)]
+        return json.dumps({**extra, "embeddings": {DEFAULT_MODEL: {"vec": vec}}})
+
+    for i in range(files):
+        note_path = f"folder{i % 100}/Note {i}.md"
+        lines = [f"{json.dumps('smart_sources:' + note_path)}: {entry({'path': note_path})},"]
+        for h in range(blocks):
+            key = f"{note_path}#Heading {h}"
+            lines.append(f"{json.dumps('smart_blocks:' + key)}: {entry({'key': key, 'lines': [h * 10, h * 10 + 9]})},")
+        with open(os.path.join(smart_env, path_to_ajson_name(note_path)), "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main():
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description="Benchmark Smart Connections embedding loading")
+    parser.add_argument("--vault", help="Synthetic vault directory (generated if it has no .smart-env yet)")
+    parser.add_argument("--files", type=int, default=50000, help="Notes to generate (default: 50000)")
+    parser.add_argument("--dim", type=int, default=384, help="Vector dimensions (default: 384)")
+    parser.add_argument("--blocks", type=int, default=2, help="Block vectors per note (default: 2)")
+    parser.add_argument(
+        "--workers",
+        default=",".join(str(n) for n in sorted({1, 2, 4, 8, cpus}) if n <= cpus),
+        help="Comma-separated worker counts to time (default: powers of two up to the CPU count)",
+    )
+    args = parser.parse_args()
+
+    vault_root = args.vault or tempfile.mkdtemp(prefix="sc-bench-")
+    if not os.path.exists(os.path.join(vault_root, SMART_ENV_DIR)):
+        print(f"Generating {args.files} notes x {1 + args.blocks} vectors x {args.dim}d in {vault_root} ...")
+        seconds, _ = timed(lambda: build_synthetic_vault(vault_root, args.files, args.dim, args.blocks))
+        print(f"  generated in {seconds:.1f}s")
+
+    cache_root = tempfile.mkdtemp(prefix="sc-bench-cache-")
+    try:
+        os.environ["SMART_CONNECTIONS_CACHE"] = "0"
+        print(f"\nUncached parse ({cpus} CPUs)")
+        print("  workers   seconds   speedup")
+        baseline = None
+        for workers in [int(n) for n in args.workers.split(",")]:
+            seconds, matrix = timed(lambda: load_embedding_matrix(vault_root, workers=workers))
+            baseline = baseline or seconds
+            print(f"  {workers:>7}   {seconds:7.2f}   {baseline / seconds:6.2f}x")
+        print(f"  rows: {len(matrix)}, dim: {matrix.dim}")
+
+        os.environ["SMART_CONNECTIONS_CACHE"] = cache_root
+        cold, _ = timed(lambda: load_embedding_matrix(vault_root))
+        warm, _ = timed(lambda: load_embedding_matrix(vault_root))
+        print("\nCompiled cache")
+        print(f"  cold build : {cold:7.2f}s")
+        print(f"  warm load  : {warm * 1000:7.1f}ms")
+    finally:
+        shutil.rmtree(cache_root, ignore_errors=True)
+        if not args.vault:
+            shutil.rmtree(vault_root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,11 +10,19 @@ import argparse
 import os
 import sys
 
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; similarity falls back to pure Python.
+    np = None
+
+# candidate blocks are scored in row batches so only one slice is normalized at a time
+BLOCK_BATCH_ROWS = 16384
+
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-from utils.smart_connections import (
+from utils.smart_connections import (  # noqa: E402
     get_vault_root,
-    load_note_embeddings,
-    load_block_embeddings,
+    load_embedding_matrix,
+    split_embedding_matrix,
     normalize,
     cosine_similarity,
 )
@@ -40,10 +48,61 @@ def resolve_note_path(file_arg, vault_root):
     return file_arg
 
 
-def note_level(target_path, embeddings, threshold, top_k):
-    """Return [(score, path)] sorted descending."""
+def _unit_rows(matrix):
+    """Scale a float32 matrix's rows to unit length in place (all-zero rows stay zero)."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    matrix /= norms
+    return matrix
+
+
+def _normalized_matrix(vectors):
+    """Stack vectors into a float32 matrix with unit-length rows."""
+    return _unit_rows(np.array(vectors, dtype=np.float32).reshape(len(vectors), -1))
+
+
+def normalized_note_matrix(matrix):
+    """Return (paths, unit-length float32 rows) for the notes in an EmbeddingMatrix.
+
+    The rows are read straight from the matrix buffer (memory-mapped when cached) and
+    normalized once; pass the result to note_level to reuse it across queries.
+    """
+    rows = matrix.rows_by_key("note")
+    if not rows:
+        return [], np.empty((0, matrix.dim), dtype=np.float32)
+    vectors = np.frombuffer(matrix.vectors, dtype=np.float32).reshape(-1, matrix.dim)
+    return list(rows), _unit_rows(vectors[np.fromiter(rows.values(), dtype=np.intp, count=len(rows))])
+
+
+def _top_scores(scores, labels, threshold, top_k):
+    """Return [(score, label)] for the top_k scores >= threshold, ordered like sorting the tuples descending."""
+    candidates = np.flatnonzero(scores >= threshold)
+    if 0 < top_k < len(candidates):
+        # keep everything tied with the k-th best so the final tuple sort breaks ties like the pure path
+        kth = np.partition(scores[candidates], len(candidates) - top_k)[len(candidates) - top_k]
+        candidates = candidates[scores[candidates] >= kth]
+    ranked = sorted(((float(scores[i]), labels[i]) for i in candidates), reverse=True)
+    return ranked[:top_k]
+
+
+def _note_level_numpy(target_path, embeddings, threshold, top_k, normalized):
+    paths, matrix = normalized or (list(embeddings), _normalized_matrix(list(embeddings.values())))
+    target = paths.index(target_path)
+    scores = matrix @ matrix[target]
+    scores[target] = -np.inf
+    return _top_scores(scores, paths, threshold, top_k)
+
+
+def note_level(target_path, embeddings, threshold, top_k, normalized=None):
+    """Return [(score, path)] sorted descending.
+
+    normalized is an optional normalized_note_matrix() result for the same notes; without
+    it the NumPy path normalizes embeddings on every call.
+    """
     if target_path not in embeddings:
         return None  # not indexed
+    if np is not None:
+        return _note_level_numpy(target_path, embeddings, threshold, top_k, normalized)
 
     target_vec = normalize(embeddings[target_path])
     scores = [
@@ -56,6 +115,38 @@ def note_level(target_path, embeddings, threshold, top_k):
     return scores[:top_k]
 
 
+def _block_level_numpy(target_blocks, blocks, target_path, threshold, top_k):
+    src_keys = list(target_blocks)
+    target_matrix = _normalized_matrix([b["vec"] for b in target_blocks.values()])
+    cand_keys = [k for k, b in blocks.items() if b["path"] != target_path]
+    cand_paths = [blocks[k]["path"] for k in cand_keys]
+
+    # best target block for every candidate block; argmax keeps the first target on ties
+    best_score = np.empty(len(cand_keys), dtype=np.float32)
+    best_src = np.empty(len(cand_keys), dtype=np.intp)
+    for start in range(0, len(cand_keys), BLOCK_BATCH_ROWS):
+        batch = cand_keys[start:start + BLOCK_BATCH_ROWS]
+        scores = _normalized_matrix([blocks[k]["vec"] for k in batch]) @ target_matrix.T
+        best_src[start:start + len(batch)] = scores.argmax(axis=1)
+        best_score[start:start + len(batch)] = scores[np.arange(len(batch)), best_src[start:start + len(batch)]]
+
+    rows = np.flatnonzero(best_score >= threshold)
+    if not len(rows):
+        return []
+    # note ids follow the first passing block, the order the pure loop first records each note in
+    note_ids = {}
+    ids = np.array([note_ids.setdefault(cand_paths[r], len(note_ids)) for r in rows])
+    # segment max over note ids: group by note, best score first, earliest block on ties
+    order = np.lexsort((rows, -best_score[rows], ids))
+    firsts = order[np.concatenate(([True], np.diff(ids[order]) != 0))]
+    winners = [
+        (float(best_score[r]), cand_paths[r], src_keys[best_src[r]], cand_keys[r])
+        for r in rows[firsts]
+    ]
+    winners.sort(key=lambda x: x[0], reverse=True)
+    return winners[:top_k]
+
+
 def block_level(target_path, blocks, threshold, top_k):
     """Return [(score, note_path, src_heading, tgt_heading)] sorted descending.
 
@@ -66,6 +157,8 @@ def block_level(target_path, blocks, threshold, top_k):
     target_blocks = {k: v for k, v in blocks.items() if v["path"] == target_path}
     if not target_blocks:
         return None  # no blocks indexed for this note
+    if np is not None:
+        return _block_level_numpy(target_blocks, blocks, target_path, threshold, top_k)
 
     # pre-normalize target block vectors
     target_normed = [
@@ -127,10 +220,15 @@ def main():
     print(f"Note  : {note_path}")
     print()
 
+    # one pass over the vault's embeddings serves both modes
+    kinds = {"note": ("note",), "block": ("block",), "both": ("note", "block")}[args.mode]
+    matrix = load_embedding_matrix(vault_root, kinds=kinds)
+    embeddings, blocks = split_embedding_matrix(matrix, kinds)
+    normalized = normalized_note_matrix(matrix) if np is not None and "note" in kinds else None
+
     if args.mode in ("note", "both"):
         print("=== Note-level similarity ===")
-        embeddings = load_note_embeddings(vault_root)
-        results = note_level(note_path, embeddings, args.threshold, args.top)
+        results = note_level(note_path, embeddings, args.threshold, args.top, normalized)
         if results is None:
             print(f"  '{note_path}' is not indexed by Smart Connections yet.")
         elif not results:
@@ -146,7 +244,6 @@ def main():
         # use slightly lower threshold for blocks (more focused content)
         block_threshold = args.threshold * 0.85
         print(f"=== Block-level similarity (threshold {block_threshold:.2f}) ===")
-        blocks = load_block_embeddings(vault_root)
         results = block_level(note_path, blocks, block_threshold, args.top)
         if results is None:
             print(f"  No blocks indexed for '{note_path}'.")
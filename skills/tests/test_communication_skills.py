@@ -1,19 +1,25 @@
 from __future__ import annotations
 
+import contextlib
+import http.server
 import json
 import os
 import shutil
 import subprocess
 import sys
 import textwrap
+import threading
+import time
 import unittest
 import unittest.mock
+import warnings
 from pathlib import Path
 
 
 REPO_ROOT = Path("/Users/rami/Documents/code/react-native/audora")
 ANALYZE_SCRIPT = REPO_ROOT / "skills" / "communication-analysis" / "scripts" / "analyze_file.py"
 ORCHESTRATE_SCRIPT = REPO_ROOT / "skills" / "communication-orchestrator" / "scripts" / "orchestrate.py"
+SUMMARY_SCRIPTS = REPO_ROOT / "skills" / "communication-summary" / "scripts"
 
 
 TRANSCRIPT_FIXTURE = textwrap.dedent(
@@ -79,6 +85,40 @@ class CommunicationSkillTests(unittest.TestCase):
         target.mkdir(parents=True)
         return target
 
+    def _responses_server(self, statuses: list[int], text: str) -> tuple[str, dict]:
+        """Serve a stand-in Responses API on localhost; queued statuses are answered before 200s."""
+        log = {"requests": 0, "ports": set(), "paths": []}
+        body = json.dumps({"output": [{"type": "message", "content": [{"type": "output_text", "text": text}]}]}).encode("utf-8")
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self) -> None:
+                self.rfile.read(int(self.headers["Content-Length"]))
+                log["requests"] += 1
+                log["ports"].add(self.client_address[1])
+                log["paths"].append(self.path)
+                status = statuses.pop(0) if statuses else 200
+                self.send_response(status)
+                if status == 429:
+                    self.send_header("Retry-After", "0")
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args) -> None:
+                return
+
+        from communication_runtime.http_pool import close_pools
+
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.addCleanup(close_pools)
+        return f"http://127.0.0.1:{server.server_address[1]}/v1/responses", log
+
     def _run(self, script: Path, target: Path) -> dict:
         env = dict(os.environ)
         env["COMMUNICATION_SKILL_ENABLE_LLM"] = "0"
@@ -158,6 +198,324 @@ class CommunicationSkillTests(unittest.TestCase):
         self.assertTrue(summary["findings"])
         self.assertTrue(summary["metadata"]["file_priorities"])
 
+    def test_parallel_batch_analysis_matches_inline_payloads(self) -> None:
+        scripts_root = REPO_ROOT / "skills" / "communication-analysis" / "scripts"
+        sys.path.insert(0, str(scripts_root))
+        try:
+            from communication_runtime.batch import analyze_sources
+
+            root = self._workspace("batch-run")
+            sources = []
+            for index, fixture in enumerate([TRANSCRIPT_FIXTURE, NOTE_FIXTURE, TRANSCRIBED_SYSTEM_FIXTURE]):
+                source = root / f"note-{index}.md"
+                source.write_text(fixture, encoding="utf-8")
+                sources.append(source)
+
+            with unittest.mock.patch.dict(os.environ, {"COMMUNICATION_SKILL_ENABLE_LLM": "0", "COMMUNICATION_SKILL_CACHE": "0"}):
+                inline = analyze_sources(sources, workers=1)
+                pooled = analyze_sources(sources, workers=2)
+        finally:
+            sys.path.pop(0)
+
+        self.assertEqual(pooled, inline)
+        self.assertEqual([payload["source"] for payload in pooled], [str(source.resolve()) for source in sources])
+
+    def test_folder_summary_rereads_only_changed_reports(self) -> None:
+        root = self._workspace("summary-index")
+        for name, fixture in [("talk.md", TRANSCRIPT_FIXTURE), ("reflection.md", NOTE_FIXTURE), ("workflow.md", TRANSCRIBED_SYSTEM_FIXTURE)]:
+            (root / name).write_text(fixture, encoding="utf-8")
+        self._run(ORCHESTRATE_SCRIPT, root)
+
+        sys.path.insert(0, str(SUMMARY_SCRIPTS))
+        try:
+            import summarize_folder
+
+            with unittest.mock.patch.object(summarize_folder, "_read_report_digest", wraps=summarize_folder._read_report_digest) as read_digest:
+                warm = summarize_folder.build_summary(root)
+                self.assertEqual(read_digest.call_count, 0)
+
+                report_path = root / "analysis" / "talk.json"
+                report = json.loads(report_path.read_text(encoding="utf-8"))
+                report["findings"] = report["findings"][:1]
+                report_path.write_text(json.dumps(report), encoding="utf-8")
+                updated = summarize_folder.build_summary(root)
+                self.assertEqual(read_digest.call_count, 1)
+
+            summarize_folder._summary_index_path(root).unlink()
+            cold = summarize_folder.build_summary(root)
+        finally:
+            sys.path.pop(0)
+
+        self.assertEqual(warm["metadata"]["report_count"], 3)
+        for summary in (updated, cold):
+            summary["metadata"].pop("generated_at")
+        self.assertEqual(updated, cold)
+
+    def test_streaming_folder_aggregate_keeps_stable_top_strengths(self) -> None:
+        sys.path.insert(0, str(SUMMARY_SCRIPTS))
+        try:
+            from summarize_folder import _FolderAggregate
+
+            aggregate = _FolderAggregate(strength_limit=5, evidence_limit=10)
+            expected = []
+            for index in range(40):
+                strengths = [{"label": f"s{index}-{slot}", "score": (index * 7 + slot) % 4 * 10, "explanation": "", "evidence_text": ""} for slot in range(2)]
+                report = {
+                    "source": {"title": f"note {index}", "path": f"/n{index}.md", "analysis_markdown_path": f"/analysis/n{index}.md", "analysis_mode": "note", "contexts": []},
+                    "findings": [],
+                    "vocabulary": [],
+                    "strengths": strengths,
+                    "evidence": [{"label": "e", "text": str(index), "rationale": ""}] * 2,
+                }
+                aggregate.add(report)
+                expected.extend({"title": f"note {index}", "report_path": f"/analysis/n{index}.md", **strength} for strength in strengths)
+        finally:
+            sys.path.pop(0)
+
+        expected.sort(key=lambda item: item["score"], reverse=True)
+        self.assertEqual(aggregate.strengths(), expected[:5])
+        self.assertEqual([item["text"] for item in aggregate.evidence], [str(index // 2) for index in range(10)])
+
+    def test_summary_top_k_matches_full_sort_with_ties(self) -> None:
+        sys.path.insert(0, str(SUMMARY_SCRIPTS))
+        try:
+            from summarize_folder import _FolderAggregate, _recurring_findings, _recurring_vocabulary
+
+            aggregate = _FolderAggregate(strength_limit=5, evidence_limit=10)
+            for index in range(30):
+                aggregate.add(
+                    {
+                        "source": {"title": f"note {index}", "path": f"/n{index}.md", "analysis_markdown_path": f"/analysis/n{index}.md", "analysis_mode": "note", "contexts": []},
+                        "findings": [
+                            {"dimension": f"dim{(index + offset) % 9}", "label": f"Label {(index + offset) % 9 % 4}", "severity": float(40 + offset * 5), "why_it_matters": ""}
+                            for offset in range(index % 4)
+                        ],
+                        "vocabulary": [
+                            {"id": f"vocab{(index * offset) % 11}", "label": f"Vocab {offset % 3}", "totalOccurrences": 2 + offset % 2, "why_it_limits_you": ""}
+                            for offset in range(index % 5)
+                        ],
+                        "strengths": [],
+                        "evidence": [],
+                    }
+                )
+            findings = _recurring_findings(aggregate, 6)
+            all_findings = _recurring_findings(aggregate, len(aggregate.finding_groups))
+            vocabulary = _recurring_vocabulary(aggregate, 6)
+            all_vocabulary = _recurring_vocabulary(aggregate, len(aggregate.vocabulary_groups))
+        finally:
+            sys.path.pop(0)
+
+        def finding_key(item: dict) -> tuple:
+            return (-item["affected_files"], -item["severity"], item["label"])
+
+        def vocabulary_key(item: dict) -> tuple:
+            return (-item["affected_files"], -item["total_occurrences"], item["label"])
+
+        self.assertEqual(findings, sorted(all_findings, key=finding_key)[:6])
+        self.assertEqual(vocabulary, sorted(all_vocabulary, key=vocabulary_key)[:6])
+        self.assertEqual(len(findings), 6)
+
+    def test_summarizer_prefers_current_compact_sidecar(self) -> None:
+        workspace = self._workspace("compact-sidecar")
+        source = workspace / "investor-practice.md"
+        source.write_text(TRANSCRIPT_FIXTURE, encoding="utf-8")
+        payload = self._run(ANALYZE_SCRIPT, source)
+        self.assertFalse((workspace / "analysis" / "investor-practice.compact").exists())
+        with unittest.mock.patch.dict(os.environ, {"COMMUNICATION_SKILL_COMPACT_REPORTS": "1"}):
+            payload = self._run(ANALYZE_SCRIPT, source)
+        json_path = Path(payload["analysis_json_path"])
+        self.assertEqual(sorted(path.name for path in json_path.parent.iterdir() if path.is_file()), ["investor-practice.compact", "investor-practice.json", "investor-practice.md"])
+
+        sys.path.insert(0, str(SUMMARY_SCRIPTS))
+        try:
+            import summarize_folder
+            from communication_runtime.compact import compact_report_path, read_compact_report
+
+            self.assertTrue(compact_report_path(json_path).exists())
+            self.assertEqual(read_compact_report(json_path), json.loads(json_path.read_text(encoding="utf-8")))
+            expected = summarize_folder._report_digest(json.loads(json_path.read_text(encoding="utf-8")))
+            with unittest.mock.patch.object(Path, "read_text", side_effect=AssertionError("parsed indented JSON")):
+                self.assertEqual(summarize_folder._read_report_digest(json_path), expected)
+
+            newer = compact_report_path(json_path).stat().st_mtime_ns + 1_000_000_000
+            os.utime(json_path, ns=(newer, newer))
+            self.assertIsNone(read_compact_report(json_path))
+            self.assertEqual(summarize_folder._read_report_digest(json_path), expected)
+        finally:
+            sys.path.pop(0)
+
+    def test_sqlite_store_backs_queries_and_folder_summary(self) -> None:
+        root = self._workspace("analysis-store")
+        (root / "talk.md").write_text(TRANSCRIPT_FIXTURE, encoding="utf-8")
+        (root / "notes").mkdir()
+        (root / "notes" / "reflection.md").write_text(NOTE_FIXTURE, encoding="utf-8")
+        store = root / "store" / "analysis.sqlite3"
+
+        with unittest.mock.patch.dict(os.environ, {"COMMUNICATION_SKILL_STORE": str(store)}):
+            self._run(ORCHESTRATE_SCRIPT, root)
+
+        sys.path.insert(0, str(SUMMARY_SCRIPTS))
+        try:
+            import summarize_folder
+            from communication_runtime.store import query_reports_by_finding, stored_source_paths
+
+            self.assertEqual(stored_source_paths(store, root), {str((root / "talk.md").resolve()), str((root / "notes" / "reflection.md").resolve())})
+            report = json.loads((root / "notes" / "analysis" / "reflection.json").read_text(encoding="utf-8"))
+            finding = report["findings"][0]
+            matches = query_reports_by_finding(store, finding["dimension"], finding["severity"], context="communication", root=root)
+            self.assertIn(str((root / "notes" / "reflection.md").resolve()), [match["source_path"] for match in matches])
+            self.assertEqual(query_reports_by_finding(store, finding["dimension"], 101), [])
+
+            with unittest.mock.patch.object(summarize_folder, "_iter_report_digests", side_effect=AssertionError("crawled")):
+                from_store = summarize_folder.build_summary(root, store)
+            from_crawl = summarize_folder.build_summary(root)
+
+            # A report rewritten without the store configured wins over its stale row.
+            report["source"]["title"] = "Rewritten reflection"
+            (root / "notes" / "analysis" / "reflection.json").write_text(json.dumps(report, indent=2), encoding="utf-8")
+            rewritten = summarize_folder.build_summary(root, store)
+
+            # A note analyzed without the store configured has no row but is still summarized.
+            (root / "extra.md").write_text(TRANSCRIBED_SYSTEM_FIXTURE, encoding="utf-8")
+            self._run(ORCHESTRATE_SCRIPT, root)
+            self.assertNotIn(str((root / "extra.md").resolve()), stored_source_paths(store, root))
+            with unittest.mock.patch.object(summarize_folder, "_iter_report_digests", side_effect=AssertionError("crawled")):
+                with_unstored = summarize_folder.build_summary(root, store)
+        finally:
+            sys.path.pop(0)
+
+        for summary in (from_store, from_crawl):
+            summary["metadata"].pop("generated_at")
+        self.assertEqual(from_store, from_crawl)
+        self.assertIn("Rewritten reflection", [item["title"] for item in rewritten["metadata"]["file_priorities"]])
+        self.assertEqual(with_unstored["metadata"]["report_count"], 3)
+
+    def test_watch_mode_reanalyzes_only_changed_notes(self) -> None:
+        root = self._workspace("watch-mode")
+        (root / "talk.md").write_text(TRANSCRIPT_FIXTURE, encoding="utf-8")
+        (root / "reflection.md").write_text(NOTE_FIXTURE, encoding="utf-8")
+        self._run(ORCHESTRATE_SCRIPT, root)
+
+        orchestrator_root = REPO_ROOT / "skills" / "communication-orchestrator" / "scripts"
+        sys.path.insert(0, str(orchestrator_root))
+        try:
+            import orchestrate
+
+            cycles: list[dict] = []
+            stop = threading.Event()
+
+            def record(cycle: dict) -> None:
+                cycles.append(cycle)
+                stop.set()
+
+            with unittest.mock.patch.dict(os.environ, {"COMMUNICATION_SKILL_ENABLE_LLM": "0"}):
+                watcher = threading.Thread(
+                    target=orchestrate.watch,
+                    kwargs={"target": root, "debounce": 0.1, "interval": 0.05, "on_cycle": record, "stop": stop, "use_events": False},
+                )
+                watcher.start()
+                time.sleep(0.2)
+                (root / "reflection.md").write_text(NOTE_FIXTURE + "\nI will name the mechanism first.\n", encoding="utf-8")
+                (root / "new-note.md").write_text(TRANSCRIBED_SYSTEM_FIXTURE, encoding="utf-8")
+                watcher.join(timeout=10)
+                stop.set()
+        finally:
+            sys.path.pop(0)
+
+        self.assertEqual(len(cycles), 1)
+        analyzed = sorted(Path(item["source"]).name for item in cycles[0]["analyzed"])
+        self.assertEqual(analyzed, ["new-note.md", "reflection.md"])
+        self.assertEqual(cycles[0]["summary"]["report_count"], 3)
+        self.assertTrue((root / "analysis" / "new-note.json").exists())
+
+    def test_watch_mode_removes_every_artifact_of_a_deleted_note(self) -> None:
+        root = self._workspace("watch-mode-delete")
+        (root / "talk.md").write_text(TRANSCRIPT_FIXTURE, encoding="utf-8")
+        (root / "reflection.md").write_text(NOTE_FIXTURE, encoding="utf-8")
+        with unittest.mock.patch.dict(os.environ, {"COMMUNICATION_SKILL_CACHE": "1"}):
+            self._run(ORCHESTRATE_SCRIPT, root)
+        report_cache = root / "analysis" / ".cache" / "talk.json"
+        summary_index = root / "analysis" / ".cache" / "summary-index.jsonl"
+        self.assertTrue(report_cache.exists())
+        self.assertIn("talk.json", summary_index.read_text(encoding="utf-8"))
+
+        orchestrator_root = REPO_ROOT / "skills" / "communication-orchestrator" / "scripts"
+        sys.path.insert(0, str(orchestrator_root))
+        try:
+            import orchestrate
+
+            cycles: list[dict] = []
+            stop = threading.Event()
+
+            def record(cycle: dict) -> None:
+                cycles.append(cycle)
+                stop.set()
+
+            with unittest.mock.patch.dict(os.environ, {"COMMUNICATION_SKILL_ENABLE_LLM": "0"}):
+                watcher = threading.Thread(
+                    target=orchestrate.watch,
+                    kwargs={"target": root, "debounce": 0.1, "interval": 0.05, "on_cycle": record, "stop": stop, "use_events": False},
+                )
+                watcher.start()
+                time.sleep(0.2)
+                (root / "talk.md").unlink()
+                watcher.join(timeout=10)
+                stop.set()
+        finally:
+            sys.path.pop(0)
+
+        self.assertEqual(len(cycles), 1)
+        self.assertEqual([Path(path).name for path in cycles[0]["removed"]], ["talk.md"])
+        self.assertEqual(cycles[0]["summary"]["report_count"], 1)
+        self.assertEqual(sorted(path.name for path in (root / "analysis").iterdir() if path.is_file() and path.stem == "talk"), [])
+        self.assertFalse(report_cache.exists())
+        self.assertNotIn("talk.json", summary_index.read_text(encoding="utf-8"))
+
+    def test_watch_mode_survives_unreadable_notes_and_an_emptied_folder(self) -> None:
+        root = self._workspace("watch-mode-errors")
+        (root / "talk.md").write_text(TRANSCRIPT_FIXTURE, encoding="utf-8")
+        self._run(ORCHESTRATE_SCRIPT, root)
+
+        orchestrator_root = REPO_ROOT / "skills" / "communication-orchestrator" / "scripts"
+        sys.path.insert(0, str(orchestrator_root))
+        try:
+            import orchestrate
+
+            cycles: list[dict] = []
+            stop = threading.Event()
+            cycle_done = threading.Event()
+
+            def record(cycle: dict) -> None:
+                cycles.append(cycle)
+                cycle_done.set()
+                if len(cycles) == 2:
+                    stop.set()
+
+            with unittest.mock.patch.dict(os.environ, {"COMMUNICATION_SKILL_ENABLE_LLM": "0"}):
+                watcher = threading.Thread(
+                    target=orchestrate.watch,
+                    kwargs={"target": root, "debounce": 0.1, "interval": 0.05, "on_cycle": record, "stop": stop, "use_events": False},
+                )
+                watcher.start()
+                time.sleep(0.2)
+                (root / "broken.md").write_bytes(b"# Broken\n\n\xff\xfe not utf-8\n")
+                cycle_done.wait(timeout=10)
+                (root / "broken.md").unlink()
+                (root / "talk.md").unlink()
+                watcher.join(timeout=10)
+                stop.set()
+        finally:
+            sys.path.pop(0)
+
+        self.assertEqual(len(cycles), 2)
+        self.assertFalse(cycles[0]["ok"])
+        self.assertIn("UnicodeDecodeError", cycles[0]["analyzed"][0]["error"])
+        self.assertEqual(cycles[0]["summary"]["report_count"], 1)
+        self.assertTrue(cycles[1]["ok"])
+        self.assertEqual(cycles[1]["summary"]["report_count"], 0)
+        self.assertFalse((root / "analysis" / "index.md").exists())
+        self.assertFalse((root / "analysis" / "index.json").exists())
+
     def test_transcribed_markdown_uses_body_section_and_conservative_contexts(self) -> None:
         workspace = self._workspace("transcribed-system")
         source = workspace / "workflow-setup.md"
@@ -191,6 +549,164 @@ class CommunicationSkillTests(unittest.TestCase):
         self.assertNotIn(("filler", "like"), kinds)
         self.assertFalse(any(kind == "dash_fragment" for kind, _ in kinds))
 
+    def test_segmentation_scales_linearly_with_filler_spans(self) -> None:
+        scripts_root = REPO_ROOT / "skills" / "communication-analysis" / "scripts"
+        sys.path.insert(0, str(scripts_root))
+        try:
+            from communication_runtime.markdown_source import _find_artifacts, _segment_text
+        finally:
+            sys.path.pop(0)
+
+        class CountingSpan(dict):
+            lookups = 0
+
+            def __getitem__(self, key):
+                CountingSpan.lookups += 1
+                return super().__getitem__(key)
+
+        sentence_count = 4000
+        text = " ".join("Um, so, uh, like I mean the demo, um, basically worked." for _ in range(sentence_count))
+        spans = [CountingSpan(span) for span in _find_artifacts(text)]
+        segments = _segment_text(text, spans)
+
+        self.assertEqual(len(segments), sentence_count)
+        # Each span is looked up a bounded number of times; the old all-pairs scan touched every span per segment.
+        self.assertLess(CountingSpan.lookups, 8 * (len(spans) + len(segments)))
+        expected = [
+            [span["id"] for span in spans if span["start"] < segment["end"] and span["end"] > segment["start"]]
+            for segment in segments[:50]
+        ]
+        self.assertEqual([segment["artifact_span_ids"] for segment in segments[:50]], expected)
+
+    def test_streaming_loader_matches_whole_file_loader(self) -> None:
+        scripts_root = REPO_ROOT / "skills" / "communication-analysis" / "scripts"
+        sys.path.insert(0, str(scripts_root))
+        try:
+            from communication_runtime.markdown_source import load_markdown_source
+
+            workspace = self._workspace("streaming-loader")
+            for name, fixture in (("transcript", TRANSCRIPT_FIXTURE), ("note", NOTE_FIXTURE), ("transcribed", TRANSCRIBED_SYSTEM_FIXTURE)):
+                source_path = workspace / f"{name}.md"
+                source_path.write_text(fixture + "\n\n```\ncode block\n\nstill code\n```\n\n- [a link](https://example.com) and *more*\n", encoding="utf-8")
+                whole = load_markdown_source(source_path, stream=False)
+                streamed = load_markdown_source(source_path, stream=True)
+                self.assertIsNone(streamed.pop("raw_body"))
+                whole.pop("raw_body")
+                self.assertEqual(streamed, whole, name)
+        finally:
+            sys.path.pop(0)
+
+    def test_streaming_loader_matches_whole_file_loader_across_paragraph_breaks(self) -> None:
+        scripts_root = REPO_ROOT / "skills" / "communication-analysis" / "scripts"
+        sys.path.insert(0, str(scripts_root))
+        try:
+            from communication_runtime.markdown_source import load_markdown_source
+
+            workspace = self._workspace("streaming-loader-breaks")
+            body = "I keep talking around the mechanism instead of naming it.\n\nThe demo basically worked.\n"
+            cases = {
+                "inline-code": "# Practice\n\nI use `inline code\n\nacross a break` to explain it.\n\n" + body,
+                "link": "# Practice\n\nSee [the first\n\nsecond part](https://example.com) for detail.\n\n" + body,
+                "bare-heading": "#\n\nThis line goes with the bare heading.\n\n" + body,
+            }
+            for name, text in cases.items():
+                source_path = workspace / f"{name}.md"
+                source_path.write_text(text, encoding="utf-8")
+                whole = load_markdown_source(source_path, stream=False)
+                streamed = load_markdown_source(source_path, stream=True)
+                streamed.pop("raw_body")
+                whole.pop("raw_body")
+                self.assertEqual(streamed, whole, name)
+        finally:
+            sys.path.pop(0)
+
+    def test_marker_bank_matches_per_marker_counts(self) -> None:
+        scripts_root = REPO_ROOT / "skills" / "communication-analysis" / "scripts"
+        sys.path.insert(0, str(scripts_root))
+        try:
+            import re
+
+            from communication_runtime.markers import MARKER_LEXICONS, count_lexicons
+
+            text = (
+                "I think it seems like mankind often said... kind of, sort of -- you know? "
+                "Our co-founder and cofounder said I'm going to ship it, but yeah, anyway, back to the thing. "
+                "Things like that... never, I will, I WILL. It seems like it seems."
+            )
+            counts = count_lexicons(text)
+        finally:
+            sys.path.pop(0)
+
+        lowered = text.lower()
+        for name, markers in MARKER_LEXICONS.items():
+            expected = 0
+            for marker in markers:
+                if " " in marker:
+                    expected += lowered.count(marker)
+                else:
+                    expected += len(re.findall(rf"(?<![A-Za-z]){re.escape(marker)}(?![A-Za-z])", lowered))
+            self.assertEqual(counts[name], expected, name)
+
+    def test_segment_lexicon_matrix_rows_sum_to_document_counts(self) -> None:
+        scripts_root = REPO_ROOT / "skills" / "communication-analysis" / "scripts"
+        sys.path.insert(0, str(scripts_root))
+        try:
+            from communication_runtime.markdown_source import load_markdown_source
+            from communication_runtime.markers import LEXICON_WIDTH, count_lexicons, lexicon_column_totals, lexicon_row
+
+            workspace = self._workspace("lexicon-matrix")
+            source_path = workspace / "investor-practice.md"
+            source_path.write_text(TRANSCRIPT_FIXTURE, encoding="utf-8")
+            source = load_markdown_source(source_path)
+        finally:
+            sys.path.pop(0)
+
+        matrix = source["lexicon_matrix"]
+        self.assertEqual(len(matrix), len(source["segments"]) * LEXICON_WIDTH)
+        self.assertEqual(lexicon_column_totals(matrix), count_lexicons(source["clean_body"]))
+        for segment in source["segments"]:
+            self.assertEqual(lexicon_row(matrix, segment["index"]), count_lexicons(segment["text"]))
+
+    def test_numpy_segment_similarities_match_pure_python(self) -> None:
+        scripts_root = REPO_ROOT / "skills" / "communication-analysis" / "scripts"
+        sys.path.insert(0, str(scripts_root))
+        try:
+            import communication_runtime.engine as engine_module
+        finally:
+            sys.path.pop(0)
+        if engine_module.np is None:
+            self.skipTest("numpy is not installed")
+
+        from collections import Counter
+
+        vectors = [Counter({f"term{(index * 7 + offset) % 23}": 1 + offset % 2 for offset in range(index % 6)}) for index in range(90)]
+        expected = [engine_module._cosine_similarity(vectors[index - 1], vectors[index]) for index in range(1, len(vectors))]
+        self.assertEqual(engine_module._adjacent_similarities_numpy(vectors), expected)
+
+    def test_vocabulary_term_index_matches_per_term_scan(self) -> None:
+        scripts_root = REPO_ROOT / "skills" / "communication-analysis" / "scripts"
+        sys.path.insert(0, str(scripts_root))
+        try:
+            import communication_runtime.engine as engine_module
+            from communication_runtime.constants import VOCABULARY_TARGETS
+            from communication_runtime.markdown_source import _segment_text
+
+            text = "I think the thing is things. Something, you know, kind of works! Really very good people... Someone's way? I guess."
+            source = {"clean_body": text, "segments": _segment_text(text, [])}
+            matches = engine_module._find_vocabulary_matches(source)
+        finally:
+            sys.path.pop(0)
+
+        for target in VOCABULARY_TARGETS:
+            expected = []
+            for segment in source["segments"]:
+                for term in target["terms"]:
+                    for match in engine_module._bounded_pattern(term).finditer(segment["text"].lower()):
+                        expected.append((segment["id"], term, segment["start"] + match.start(), segment["start"] + match.end()))
+            expected.sort(key=lambda item: (item[2], item[3], item[1]))
+            found = [(item["segmentId"], item["term"], item["start"], item["end"]) for item in matches[target["id"]]]
+            self.assertEqual(found, expected, target["id"])
+
 
     def test_short_text_does_not_crash(self) -> None:
         workspace = self._workspace("short-text")
@@ -246,6 +762,306 @@ class CommunicationSkillTests(unittest.TestCase):
         finally:
             sys.path.pop(0)
 
+    def test_llm_requests_run_concurrently_and_keep_order(self) -> None:
+        scripts_root = REPO_ROOT / "skills" / "communication-analysis" / "scripts"
+        sys.path.insert(0, str(scripts_root))
+        try:
+            from communication_runtime.llm import run_llm_requests
+
+            def slow_call(value: int):
+                return lambda: time.sleep(0.2) or value
+
+            started = time.perf_counter()
+            results = run_llm_requests([slow_call(value) for value in range(5)])
+            elapsed = time.perf_counter() - started
+        finally:
+            sys.path.pop(0)
+
+        self.assertEqual(results, [0, 1, 2, 3, 4])
+        self.assertLess(elapsed, 0.6)
+
+    def test_llm_response_cache_skips_repeat_requests(self) -> None:
+        scripts_root = REPO_ROOT / "skills" / "communication-analysis" / "scripts"
+        sys.path.insert(0, str(scripts_root))
+        try:
+            import communication_runtime.llm as llm_module
+            import communication_runtime.response_cache as response_cache_module
+
+            workspace = self._workspace("llm-response-cache")
+            url, log = self._responses_server([], json.dumps({"summary": "Sharper.", "hypothesis": "Maybe."}))
+            llm_config = {"enabled": True, "model": "mock", "reasoningEffort": "low"}
+            finding = {"dimension": "lexical_precision", "severity": 52.0}
+            env = {"OPENAI_API_KEY": "test-key", "COMMUNICATION_SKILL_LLM_CACHE": str(workspace / "responses.sqlite3")}
+
+            with (
+                unittest.mock.patch.dict(os.environ, env),
+                unittest.mock.patch.object(llm_module, "RESPONSES_API_URL", url),
+            ):
+                before = response_cache_module.response_cache_stats()
+                first = llm_module.synthesize_finding(finding, llm_config)
+                second = llm_module.synthesize_finding(finding, llm_config)
+                other_model = llm_module.synthesize_finding(finding, {**llm_config, "model": "other"})
+                after = response_cache_module.response_cache_stats()
+        finally:
+            sys.path.pop(0)
+
+        self.assertEqual(first, {"summary": "Sharper.", "hypothesis": "Maybe."})
+        self.assertEqual(second, first)
+        self.assertEqual(other_model, first)
+        self.assertEqual(log["requests"], 2)
+        self.assertEqual(after["hits"] - before["hits"], 1)
+        self.assertEqual(after["misses"] - before["misses"], 2)
+
+    def test_unwritable_llm_response_cache_is_treated_as_a_miss(self) -> None:
+        scripts_root = REPO_ROOT / "skills" / "communication-analysis" / "scripts"
+        sys.path.insert(0, str(scripts_root))
+        try:
+            import communication_runtime.llm as llm_module
+
+            workspace = self._workspace("llm-response-cache-unwritable")
+            blocker = workspace / "not-a-directory"
+            blocker.write_text("", encoding="utf-8")
+            url, log = self._responses_server([], json.dumps({"summary": "Sharper.", "hypothesis": "Maybe."}))
+            llm_config = {"enabled": True, "model": "mock", "reasoningEffort": "low"}
+            env = {"OPENAI_API_KEY": "test-key", "COMMUNICATION_SKILL_LLM_CACHE": str(blocker / "responses.sqlite3")}
+
+            with (
+                unittest.mock.patch.dict(os.environ, env),
+                unittest.mock.patch.object(llm_module, "RESPONSES_API_URL", url),
+            ):
+                result = llm_module.synthesize_finding({"dimension": "lexical_precision", "severity": 52.0}, llm_config)
+        finally:
+            sys.path.pop(0)
+
+        self.assertEqual(result, {"summary": "Sharper.", "hypothesis": "Maybe."})
+        self.assertEqual(log["requests"], 1)
+
+    def test_llm_client_reuses_connection_and_retries_throttled_requests(self) -> None:
+        scripts_root = REPO_ROOT / "skills" / "communication-analysis" / "scripts"
+        sys.path.insert(0, str(scripts_root))
+        try:
+            import communication_runtime.llm as llm_module
+
+            url, log = self._responses_server([429, 503], json.dumps({"executiveDiagnosis": "Focus.", "weeklyTheme": "Name it."}))
+            llm_config = {"enabled": True, "model": "mock", "reasoningEffort": "low"}
+            env = {"OPENAI_API_KEY": "test-key", "COMMUNICATION_SKILL_LLM_CACHE": "0"}
+
+            with (
+                unittest.mock.patch.dict(os.environ, env),
+                unittest.mock.patch.object(llm_module, "RESPONSES_API_URL", url),
+                unittest.mock.patch("communication_runtime.http_pool.BACKOFF_BASE_SECONDS", 0.01),
+            ):
+                results = [llm_module.synthesize_report_summary({"findings": [index]}, llm_config) for index in range(3)]
+        finally:
+            sys.path.pop(0)
+
+        self.assertEqual(results, [{"executiveDiagnosis": "Focus.", "weeklyTheme": "Name it."}] * 3)
+        self.assertEqual(log["requests"], 5)
+        self.assertEqual(len(log["ports"]), 1)
+
+    def test_llm_client_sends_requests_through_configured_proxy(self) -> None:
+        scripts_root = REPO_ROOT / "skills" / "communication-analysis" / "scripts"
+        sys.path.insert(0, str(scripts_root))
+        try:
+            import communication_runtime.llm as llm_module
+
+            proxy_url, log = self._responses_server([], json.dumps({"executiveDiagnosis": "Focus.", "weeklyTheme": "Name it."}))
+            proxy = proxy_url.rsplit("/v1/", 1)[0]
+            llm_config = {"enabled": True, "model": "mock", "reasoningEffort": "low"}
+            env = {"OPENAI_API_KEY": "test-key", "COMMUNICATION_SKILL_LLM_CACHE": "0", "http_proxy": proxy, "no_proxy": "bypassed.invalid"}
+
+            with (
+                unittest.mock.patch.dict(os.environ, env),
+                unittest.mock.patch.object(llm_module, "RESPONSES_API_URL", "http://responses.invalid/v1/responses"),
+            ):
+                result = llm_module.synthesize_report_summary({"findings": []}, llm_config)
+        finally:
+            sys.path.pop(0)
+
+        self.assertEqual(result, {"executiveDiagnosis": "Focus.", "weeklyTheme": "Name it."})
+        self.assertEqual(log["paths"], ["http://responses.invalid:80/v1/responses"])
+
+    def test_http_pools_are_reset_in_forked_children(self) -> None:
+        if not hasattr(os, "fork"):
+            self.skipTest("os.fork is not available")
+        scripts_root = REPO_ROOT / "skills" / "communication-analysis" / "scripts"
+        sys.path.insert(0, str(scripts_root))
+        try:
+            import communication_runtime.http_pool as http_pool
+
+            http_pool.get_pool("http://127.0.0.1:9/v1/responses", timeout=1)
+            self.addCleanup(http_pool.close_pools)
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", DeprecationWarning)
+                with http_pool._pools_lock:
+                    pid = os.fork()
+                    if pid == 0:
+                        os._exit(0 if not http_pool._pools and not http_pool._pools_lock.locked() else 1)
+            _, status = os.waitpid(pid, 0)
+        finally:
+            sys.path.pop(0)
+
+        self.assertEqual(os.waitstatus_to_exitcode(status), 0)
+        self.assertEqual(len(http_pool._pools), 1)
+
+    def test_batched_llm_mode_refines_report_in_one_request(self) -> None:
+        scripts_root = REPO_ROOT / "skills" / "communication-analysis" / "scripts"
+        sys.path.insert(0, str(scripts_root))
+        try:
+            import communication_runtime.engine as engine_module
+            import communication_runtime.llm as llm_module
+
+            workspace = self._workspace("llm-batch")
+            source_path = workspace / "investor-practice.md"
+            source_path.write_text(TRANSCRIPT_FIXTURE, encoding="utf-8")
+            batch = {
+                "findings": [{"index": index, "summary": f"Batched finding {index}.", "hypothesis": "Batched."} for index in reversed(range(10))],
+                "vocabulary": [{"index": 0, "whyItLimitsYou": "Batched vocabulary.", "replacementOptions": [], "learningSystem": ["Batched step."]}],
+                "summary": {"executiveDiagnosis": "Batched diagnosis.", "weeklyTheme": "Batched theme."},
+            }
+            url, log = self._responses_server([], json.dumps(batch))
+            env = {
+                "OPENAI_API_KEY": "test-key",
+                "COMMUNICATION_SKILL_ENABLE_LLM": "1",
+                "COMMUNICATION_SKILL_LLM_CACHE": "0",
+                "COMMUNICATION_SKILL_LLM_BATCH": "1",
+            }
+
+            with (
+                unittest.mock.patch.dict(os.environ, env),
+                unittest.mock.patch.object(llm_module, "RESPONSES_API_URL", url),
+            ):
+                report = engine_module.build_analysis_report(source_path, use_cache=False)
+        finally:
+            sys.path.pop(0)
+
+        self.assertEqual(log["requests"], 1)
+        self.assertTrue(report["metadata"]["llm"]["batch"])
+        self.assertEqual(report["summary"]["executive_diagnosis"], "Batched diagnosis.")
+        refined = [finding for finding in report["findings"] if finding["explanation"].startswith("Batched finding")]
+        self.assertTrue(refined)
+        self.assertTrue(all(finding["hypothesis"] == "Tentative: Batched." for finding in refined))
+        self.assertEqual(report["vocabulary"][0]["why_it_limits_you"], "Batched vocabulary.")
+        self.assertEqual(report["vocabulary"][0]["learningSystem"], ["Batched step."])
+
+    def test_batched_llm_mode_requests_summary_when_batch_has_none(self) -> None:
+        scripts_root = REPO_ROOT / "skills" / "communication-analysis" / "scripts"
+        sys.path.insert(0, str(scripts_root))
+        try:
+            import communication_runtime.engine as engine_module
+            import communication_runtime.llm as llm_module
+
+            workspace = self._workspace("llm-batch-no-summary")
+            source_path = workspace / "investor-practice.md"
+            source_path.write_text(TRANSCRIPT_FIXTURE, encoding="utf-8")
+            batch = {
+                "findings": [{"index": index, "summary": f"Batched finding {index}.", "hypothesis": "Batched."} for index in range(10)],
+                "vocabulary": [],
+                "summary": {},
+            }
+            url, log = self._responses_server([], json.dumps(batch))
+            env = {
+                "OPENAI_API_KEY": "test-key",
+                "COMMUNICATION_SKILL_ENABLE_LLM": "1",
+                "COMMUNICATION_SKILL_LLM_CACHE": "0",
+                "COMMUNICATION_SKILL_LLM_BATCH": "1",
+            }
+
+            with (
+                unittest.mock.patch.dict(os.environ, env),
+                unittest.mock.patch.object(llm_module, "RESPONSES_API_URL", url),
+                unittest.mock.patch.object(
+                    engine_module,
+                    "synthesize_report_summary",
+                    return_value={"executiveDiagnosis": "Single diagnosis.", "weeklyTheme": "Single theme."},
+                ) as summary_call,
+            ):
+                report = engine_module.build_analysis_report(source_path, use_cache=False)
+        finally:
+            sys.path.pop(0)
+
+        self.assertEqual(log["requests"], 1)
+        self.assertEqual(summary_call.call_count, 1)
+        self.assertEqual(report["summary"]["executive_diagnosis"], "Single diagnosis.")
+        self.assertTrue(any(finding["explanation"].startswith("Batched finding") for finding in report["findings"]))
+
+    def test_analysis_cache_reuses_report_until_source_changes(self) -> None:
+        scripts_root = REPO_ROOT / "skills" / "communication-analysis" / "scripts"
+        sys.path.insert(0, str(scripts_root))
+        try:
+            import communication_runtime.cache as cache_module
+            import communication_runtime.engine as engine_module
+
+            workspace = self._workspace("analysis-cache")
+            source_path = workspace / "investor-practice.md"
+            source_path.write_text(TRANSCRIPT_FIXTURE, encoding="utf-8")
+            llm_config = {"enabled": False, "model": "mock", "reasoningEffort": "low"}
+
+            with unittest.mock.patch.object(engine_module, "resolve_llm_config", return_value=llm_config):
+                first = engine_module.build_analysis_report(source_path, use_cache=True)
+                with unittest.mock.patch.object(engine_module, "load_markdown_source", side_effect=AssertionError("cache miss")):
+                    cached = engine_module.build_analysis_report(source_path, use_cache=True)
+                self.assertEqual(cached, first)
+
+                source_path.write_text(TRANSCRIPT_FIXTURE + "\nI will ship the demo on Friday.\n", encoding="utf-8")
+                edited = engine_module.build_analysis_report(source_path, use_cache=True)
+                self.assertNotEqual(edited["source"]["word_count"], first["source"]["word_count"])
+
+                with (
+                    unittest.mock.patch.object(cache_module, "CONSTANTS_FINGERPRINT", "edited-lexicons"),
+                    unittest.mock.patch.object(engine_module, "load_markdown_source", side_effect=AssertionError("recomputed")),
+                    self.assertRaises(AssertionError),
+                ):
+                    engine_module.build_analysis_report(source_path, use_cache=True)
+
+            llm_config = {**llm_config, "model": "other"}
+            with unittest.mock.patch.object(engine_module, "resolve_llm_config", return_value=llm_config):
+                rebuilt = engine_module.build_analysis_report(source_path, use_cache=True)
+            self.assertEqual(rebuilt["metadata"]["llm"]["model"], "other")
+        finally:
+            sys.path.pop(0)
+
+    def test_analysis_cache_skips_reports_with_failed_llm_rewrites(self) -> None:
+        scripts_root = REPO_ROOT / "skills" / "communication-analysis" / "scripts"
+        sys.path.insert(0, str(scripts_root))
+        try:
+            import communication_runtime.batch as batch_module
+            import communication_runtime.cache as cache_module
+            import communication_runtime.engine as engine_module
+
+            workspace = self._workspace("analysis-cache-llm-failure")
+            source_path = workspace / "investor-practice.md"
+            source_path.write_text(TRANSCRIPT_FIXTURE, encoding="utf-8")
+            llm_config = {"enabled": True, "model": "mock", "reasoningEffort": "low"}
+            rewrites = {
+                "synthesize_finding": {"summary": "Mock summary.", "hypothesis": "Mock hypothesis."},
+                "synthesize_vocabulary_target": {"whyItLimitsYou": "Mock why."},
+                "synthesize_report_summary": {"executiveDiagnosis": "Mock diagnosis.", "weeklyTheme": "Mock theme."},
+            }
+
+            def patched(failing: str | None) -> contextlib.ExitStack:
+                stack = contextlib.ExitStack()
+                stack.enter_context(unittest.mock.patch.object(engine_module, "resolve_llm_config", return_value=llm_config))
+                for name, rewrite in rewrites.items():
+                    stack.enter_context(unittest.mock.patch.object(engine_module, name, return_value=None if name == failing else rewrite))
+                return stack
+
+            for failing in rewrites:
+                with patched(failing):
+                    engine_module.build_analysis_report(source_path, use_cache=True)
+                self.assertFalse(cache_module.cache_path(source_path).exists(), failing)
+
+            with patched(None):
+                complete = engine_module.build_analysis_report(source_path, use_cache=True)
+            self.assertTrue(cache_module.cache_path(source_path).exists())
+            self.assertEqual(complete["summary"]["executive_diagnosis"], "Mock diagnosis.")
+
+            # Forcing a rebuild bypasses the cached report.
+            with patched(None), unittest.mock.patch.object(engine_module, "load_cached_report", side_effect=AssertionError("read cache")):
+                batch_module.analyze_source(source_path, use_cache=False)
+        finally:
+            sys.path.pop(0)
+
 
 if __name__ == "__main__":
     unittest.main()
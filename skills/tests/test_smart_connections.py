@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import unittest
+import unittest.mock
+from pathlib import Path
+
+
+REPO_ROOT = Path("/Users/rami/Documents/code/react-native/audora")
+SIMILAR_NOTES_SCRIPTS = REPO_ROOT / "skills" / "obsidian-similar-notes" / "scripts"
+SEMANTIC_LINKER_SCRIPTS = REPO_ROOT / "skills" / "obsidian-semantic-linker" / "scripts"
+MODEL = "TaylorAI/bge-micro-v2"
+
+
+def _ajson_line(key: str, value: dict | None) -> str:
+    return json.dumps(key) + ": " + json.dumps(value) + ","
+
+
+def _note_lines(path: str, note_vec: list[float], blocks: dict[str, list[float]]) -> list[str]:
+    lines = [_ajson_line(f"smart_sources:{path}", {"path": path, "embeddings": {MODEL: {"vec": note_vec}}})]
+    for offset, (heading, vec) in enumerate(blocks.items()):
+        key = f"{path}#{heading}"
+        lines.append(_ajson_line(f"smart_blocks:{key}", {"key": key, "lines": [offset, offset + 1], "embeddings": {MODEL: {"vec": vec}}}))
+    return lines
+
+
+class SmartConnectionsTests(unittest.TestCase):
+    def _workspace(self, name: str) -> Path:
+        workspace_root = REPO_ROOT / "skills" / "tests" / "__workspace__"
+        workspace_root.mkdir(exist_ok=True)
+        target = workspace_root / name
+        if target.exists():
+            shutil.rmtree(target)
+        target.mkdir(parents=True)
+        return target
+
+    def _vault(self, name: str, notes: dict[str, list[str]]) -> Path:
+        vault = self._workspace(name)
+        multi = vault / ".smart-env" / "multi"
+        multi.mkdir(parents=True)
+        for path, lines in notes.items():
+            (multi / (path.replace("/", "_").replace(" ", "_").replace(".", "_") + ".ajson")).write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return vault
+
+    def test_embedding_cache_reparses_only_changed_ajson_files(self) -> None:
+        sys.path.append(str(REPO_ROOT / "skills"))
+        from utils import smart_connections
+
+        vault = self._vault(
+            "smart-cache",
+            {
+                "a.md": _note_lines("a.md", [1.0, 0.0, 0.0], {"Intro": [0.5, 0.5, 0.0]}),
+                "b.md": _note_lines("b.md", [0.0, 1.0, 0.0], {}),
+                "c.md": [_ajson_line("smart_sources:c.md", None)],
+            },
+        )
+        cache_root = vault / "cache"
+        parse = smart_connections._parse_ajson_file
+        with unittest.mock.patch.dict(os.environ, {"SMART_CONNECTIONS_CACHE": str(cache_root)}), unittest.mock.patch.object(
+            smart_connections, "_parse_ajson_file", side_effect=parse
+        ) as parsed:
+            notes = smart_connections.load_note_embeddings(str(vault))
+            self.assertEqual(parsed.call_count, 3)
+            self.assertEqual(sorted(notes), ["a.md", "b.md"])
+            self.assertEqual(list(notes["a.md"]), [1.0, 0.0, 0.0])
+
+            blocks = smart_connections.load_block_embeddings(str(vault))
+            self.assertEqual(parsed.call_count, 3)
+            self.assertEqual(list(blocks), ["a.md#Intro"])
+            self.assertEqual(blocks["a.md#Intro"]["path"], "a.md")
+            self.assertEqual(blocks["a.md#Intro"]["lines"], [0, 1])
+            self.assertEqual(list(blocks["a.md#Intro"]["vec"]), [0.5, 0.5, 0.0])
+
+            # a matrix orphaned by an interrupted or losing concurrent build is cleaned up on the next publish
+            (next(cache_root.iterdir()) / "vectors-orphan.f32").write_bytes(b"\0" * 12)
+            b_file = vault / ".smart-env" / "multi" / "b_md.ajson"
+            b_file.write_text("\n".join(_note_lines("b.md", [0.0, 0.0, 1.0], {})) + "\n", encoding="utf-8")
+            os.utime(b_file, ns=(b_file.stat().st_atime_ns, b_file.stat().st_mtime_ns + 1_000_000_000))
+            notes = smart_connections.load_note_embeddings(str(vault))
+            self.assertEqual(parsed.call_count, 4)
+            self.assertEqual(list(notes["b.md"]), [0.0, 0.0, 1.0])
+            self.assertEqual(list(notes["a.md"]), [1.0, 0.0, 0.0])
+
+        cache_files = sorted(path.name for path in next(cache_root.iterdir()).iterdir())
+        self.assertEqual(cache_files[:2], ["build.lock", "index.json"])
+        self.assertEqual(len(cache_files), 3)
+        self.assertTrue(cache_files[2].startswith("vectors-"))
+
+        with unittest.mock.patch.dict(os.environ, {"SMART_CONNECTIONS_CACHE": "0"}):
+            uncached = smart_connections.load_note_embeddings(str(vault))
+        self.assertEqual({path: list(vec) for path, vec in uncached.items()}, {path: list(vec) for path, vec in notes.items()})
+
+    def test_embedding_cache_reports_vectors_with_mismatched_length(self) -> None:
+        sys.path.append(str(REPO_ROOT / "skills"))
+        from utils import smart_connections
+
+        vault = self._vault(
+            "smart-mismatch",
+            {
+                "a.md": _note_lines("a.md", [1.0, 0.0, 0.0], {"Odd": [1.0, 0.0]}),
+                "b.md": _note_lines("b.md", [0.0, 1.0, 0.0], {}),
+            },
+        )
+        cache_root = vault / "cache"
+        with unittest.mock.patch.dict(os.environ, {"SMART_CONNECTIONS_CACHE": str(cache_root)}), unittest.mock.patch(
+            "sys.stderr", new_callable=io.StringIO
+        ) as stderr:
+            built = smart_connections.load_embedding_matrix(str(vault))
+            reused = smart_connections.load_embedding_matrix(str(vault))
+
+        self.assertEqual([record[1] for record in built.records], ["a.md", "b.md"])
+        self.assertEqual(built.skipped, ["a.md#Odd"])
+        self.assertEqual(reused.skipped, ["a.md#Odd"])
+        self.assertEqual(stderr.getvalue().count("a.md#Odd"), 1)
+        self.assertIn("skipped 1 embedding", stderr.getvalue())
+
+    def test_loaded_vectors_are_float32_sequences_usable_by_callers(self) -> None:
+        sys.path.append(str(REPO_ROOT / "skills"))
+        sys.path.append(str(SEMANTIC_LINKER_SCRIPTS))
+        import link_notes
+        from utils import smart_connections
+
+        vault = self._vault(
+            "smart-contract",
+            {
+                "unprocessed/New.md": _note_lines("unprocessed/New.md", [1.0, 0.5, 0.0], {}),
+                "Old.md": _note_lines("Old.md", [1.0, 0.4, 0.0], {}),
+                "Empty.md": _note_lines("Empty.md", [0.0, 0.0, 0.0], {}),
+            },
+        )
+        (vault / "unprocessed").mkdir()
+        (vault / "unprocessed" / "New.md").write_text("# New\n", encoding="utf-8")
+        with unittest.mock.patch.dict(os.environ, {"SMART_CONNECTIONS_CACHE": str(vault / "cache")}):
+            notes = smart_connections.load_note_embeddings(str(vault))
+
+        vec = notes["Old.md"]
+        self.assertEqual(len(vec), 3)
+        self.assertEqual(json.loads(json.dumps(list(vec))), [1.0, 0.4000000059604645, 0.0])
+        self.assertIsInstance(smart_connections.normalize(vec), list)
+        self.assertEqual(smart_connections.normalize(notes["Empty.md"]), [0.0, 0.0, 0.0])
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            updated = link_notes.process_files(notes, str(vault))
+        self.assertEqual(updated, 1)
+        self.assertIn("- [[Old]]", (vault / "unprocessed" / "New.md").read_text(encoding="utf-8"))
+
+    def test_single_pass_loader_projects_kinds_before_parsing(self) -> None:
+        sys.path.append(str(REPO_ROOT / "skills"))
+        from utils import smart_connections
+
+        other_model = {"embeddings": {"other/model": {"vec": [9.0, 9.0]}}}
+        vault = self._vault(
+            "smart-single-pass",
+            {
+                "a.md": _note_lines("a.md", [1.0, 0.0], {"Intro": [0.0, 1.0], "Outro": [1.0, 1.0]}),
+                "b.md": _note_lines("b.md", [0.0, 1.0], {}) + ['"smart_blocks:b.md#Broken": {not json},', _ajson_line("smart_blocks:b.md#Other", other_model)],
+            },
+        )
+        records = list(smart_connections.iter_embedding_records(str(vault)))
+        self.assertEqual(
+            [(kind, key, path, lines) for kind, key, path, lines, _ in records],
+            [
+                ("note", "a.md", "a.md", None),
+                ("block", "a.md#Intro", "a.md", [0, 1]),
+                ("block", "a.md#Outro", "a.md", [1, 2]),
+                ("note", "b.md", "b.md", None),
+            ],
+        )
+
+        loads = []
+        real_loads = json.loads
+        with unittest.mock.patch.object(smart_connections.json, "loads", side_effect=lambda text: loads.append(text) or real_loads(text)):
+            notes_only = list(smart_connections.iter_embedding_records(str(vault), kinds=("note",)))
+        self.assertEqual([key for _, key, _, _, _ in notes_only], ["a.md", "b.md"])
+        self.assertTrue(all("smart_blocks:" not in text for text in loads))
+
+        with unittest.mock.patch.dict(os.environ, {"SMART_CONNECTIONS_CACHE": "0"}):
+            notes, blocks = smart_connections.load_embeddings(str(vault))
+            note_only, no_blocks = smart_connections.load_embeddings(str(vault), kinds=("note",))
+        self.assertEqual(sorted(notes), ["a.md", "b.md"])
+        self.assertEqual(sorted(blocks), ["a.md#Intro", "a.md#Outro"])
+        self.assertEqual(list(blocks["a.md#Outro"]["vec"]), [1.0, 1.0])
+        self.assertEqual(sorted(note_only), ["a.md", "b.md"])
+        self.assertEqual(no_blocks, {})
+
+    def test_parallel_parse_matches_sequential_parse(self) -> None:
+        sys.path.append(str(REPO_ROOT / "skills"))
+        from utils import smart_connections
+
+        vault = self._vault(
+            "smart-parallel",
+            {
+                f"notes/n{i}.md": _note_lines(f"notes/n{i}.md", [float(i), 1.0], {f"H{j}": [float(j), float(i)] for j in range(i % 3)})
+                for i in range(12)
+            },
+        )
+        with unittest.mock.patch.dict(os.environ, {"SMART_CONNECTIONS_CACHE": "0"}):
+            sequential = smart_connections.load_embedding_matrix(str(vault), workers=1)
+            with unittest.mock.patch.object(smart_connections, "PARALLEL_MIN_FILES", 1), unittest.mock.patch.object(
+                smart_connections, "PARALLEL_SHARD_FILES", 5
+            ):
+                parallel = smart_connections.load_embedding_matrix(str(vault), workers=2)
+        self.assertEqual(len(sequential), 12 + 12)
+        self.assertEqual(parallel.records, sequential.records)
+        self.assertEqual(parallel.dim, 2)
+        self.assertEqual(parallel.vectors.tolist(), sequential.vectors.tolist())
+
+    def test_numpy_note_level_matches_pure_python(self) -> None:
+        sys.path.append(str(SIMILAR_NOTES_SCRIPTS))
+        import find_similar
+
+        if find_similar.np is None:
+            self.skipTest("numpy is not installed")
+
+        embeddings = {
+            "target.md": [1.0, 0.0, 0.0],
+            "same-a.md": [2.0, 0.0, 0.0],
+            "same-b.md": [3.0, 0.0, 0.0],
+            "close.md": [1.0, 0.2, 0.0],
+            "far.md": [0.0, 1.0, 0.0],
+            "opposite.md": [-1.0, 0.0, 0.0],
+            "empty.md": [0.0, 0.0, 0.0],
+        }
+        for threshold, top_k in [(0.45, 10), (0.45, 2), (0.0, 1), (-1.0, 7), (2.0, 3), (0.5, 0)]:
+            vectorized = find_similar.note_level("target.md", embeddings, threshold, top_k)
+            with unittest.mock.patch.object(find_similar, "np", None):
+                expected = find_similar.note_level("target.md", embeddings, threshold, top_k)
+            self.assertEqual([path for _, path in vectorized], [path for _, path in expected])
+            for (score, _), (expected_score, _) in zip(vectorized, expected):
+                self.assertAlmostEqual(score, expected_score, places=6)
+        self.assertIsNone(find_similar.note_level("missing.md", embeddings, 0.45, 10))
+
+    def test_numpy_note_level_reuses_normalized_embedding_matrix(self) -> None:
+        sys.path.append(str(REPO_ROOT / "skills"))
+        sys.path.append(str(SIMILAR_NOTES_SCRIPTS))
+        import find_similar
+        from utils import smart_connections
+
+        if find_similar.np is None:
+            self.skipTest("numpy is not installed")
+
+        vault = self._vault(
+            "smart-normalized",
+            {
+                "a.md": _note_lines("a.md", [3.0, 0.0, 0.0], {"Intro": [1.0, 1.0, 1.0]}),
+                "b.md": _note_lines("b.md", [2.0, 1.0, 0.0], {}),
+                "c.md": _note_lines("c.md", [0.0, 0.0, 5.0], {}),
+            },
+        )
+        with unittest.mock.patch.dict(os.environ, {"SMART_CONNECTIONS_CACHE": str(vault / "cache")}):
+            matrix = smart_connections.load_embedding_matrix(str(vault))
+        notes, _ = smart_connections.split_embedding_matrix(matrix)
+        paths, unit = find_similar.normalized_note_matrix(matrix)
+        self.assertEqual(paths, ["a.md", "b.md", "c.md"])
+        self.assertEqual(unit.dtype, find_similar.np.float32)
+        self.assertEqual(unit[0].tolist(), [1.0, 0.0, 0.0])
+
+        with unittest.mock.patch.object(find_similar, "_normalized_matrix", side_effect=AssertionError("renormalized")):
+            reused = find_similar.note_level("a.md", notes, -1.0, 5, (paths, unit))
+        self.assertEqual(reused, find_similar.note_level("a.md", notes, -1.0, 5))
+        self.assertEqual([path for _, path in reused], ["b.md", "c.md"])
+
+    def test_numpy_block_level_matches_pure_python(self) -> None:
+        sys.path.append(str(SIMILAR_NOTES_SCRIPTS))
+        import find_similar
+
+        if find_similar.np is None:
+            self.skipTest("numpy is not installed")
+
+        def block(path: str, vec: list[float]) -> dict:
+            return {"path": path, "vec": vec, "lines": [0, 1]}
+
+        blocks = {
+            "target.md#A": block("target.md", [1.0, 0.0, 0.0]),
+            "target.md#B": block("target.md", [0.0, 1.0, 0.0]),
+            "low.md#One": block("low.md", [0.3, 0.2, 1.0]),
+            "tied.md#One": block("tied.md", [1.0, 1.0, 0.0]),
+            "tied.md#Two": block("tied.md", [2.0, 2.0, 0.0]),
+            "late-best.md#Weak": block("late-best.md", [0.5, 0.0, 1.0]),
+            "late-best.md#Strong": block("late-best.md", [0.0, 3.0, 0.1]),
+            "twin.md#One": block("twin.md", [1.0, 1.0, 0.0]),
+            "empty.md#One": block("empty.md", [0.0, 0.0, 0.0]),
+        }
+        with unittest.mock.patch.object(find_similar, "BLOCK_BATCH_ROWS", 3):
+            for threshold, top_k in [(0.38, 10), (0.38, 2), (0.0, 1), (-1.0, 10), (2.0, 3)]:
+                vectorized = find_similar.block_level("target.md", blocks, threshold, top_k)
+                with unittest.mock.patch.object(find_similar, "np", None):
+                    expected = find_similar.block_level("target.md", blocks, threshold, top_k)
+                self.assertEqual([result[1:] for result in vectorized], [result[1:] for result in expected])
+                for result, expected_result in zip(vectorized, expected):
+                    self.assertAlmostEqual(result[0], expected_result[0], places=6)
+        self.assertIsNone(find_similar.block_level("missing.md", blocks, 0.38, 10))
+
+
+if __name__ == "__main__":
+    unittest.main()
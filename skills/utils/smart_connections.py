@@ -4,14 +4,38 @@ shared utilities for reading Smart Connections embeddings from .smart-env/multi/
 Smart Connections stores per-note NDJSON files where each line is:
   "smart_sources:path": {..., "embeddings": {"model": {"vec": [...]}}}
   "smart_blocks:path#heading": {..., "embeddings": {"model": {"vec": [...]}}, "lines": [start, end]}
+
+The load_* functions return vectors as read-only float32 memoryviews over one shared
+buffer (memory-mapped when cached): they support len(), indexing, slicing and
+iteration, but use list(vec) where a real list is needed, e.g. before json.dumps.
 """
-import os
+import array
+import hashlib
 import json
 import math
+import mmap
+import os
+import sys
+import tempfile
 import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # no advisory locks on Windows; concurrent cache builds are then unserialized.
+    fcntl = None
 
 SMART_ENV_DIR = ".smart-env/multi"
 DEFAULT_MODEL = "TaylorAI/bge-micro-v2"
+DEFAULT_CACHE_DIR = "~/.cache/smart-connections"
+CACHE_VERSION = 2
+EMBEDDING_KINDS = ("note", "block")
+# Below this many files to parse, process start-up costs more than the pool saves.
+PARALLEL_MIN_FILES = 512
+PARALLEL_SHARD_FILES = 64
+# Every .ajson line starts with its JSON-quoted key, so a kind can be skipped before parsing.
+_KIND_PREFIXES = {"note": '"smart_sources:', "block": '"smart_blocks:'}
 
 
 def get_vault_root():
@@ -35,10 +59,11 @@ def path_to_ajson_name(note_path):
     return note_path.replace("/", "_").replace(" ", "_").replace(".", "_") + ".ajson"
 
 
-def _parse_ajson_file(filepath):
+def _parse_ajson_file(filepath, prefixes=None):
     """Parse a Smart Connections .ajson file into a dict of {key: entry}.
 
     Each line is NDJSON of the form: "key": {...}, or "key": null,
+    When prefixes is given, lines that do not start with one of them are skipped unparsed.
     """
     entries = {}
     try:
@@ -47,6 +72,8 @@ def _parse_ajson_file(filepath):
                 line = line.strip().rstrip(",")
                 if not line:
                     continue
+                if prefixes and not line.startswith(prefixes):
+                    continue
                 try:
                     obj = json.loads("{" + line + "}")
                     entries.update(obj)
@@ -57,72 +84,366 @@ def _parse_ajson_file(filepath):
     return entries
 
 
-def load_note_embeddings(vault_root, model=DEFAULT_MODEL):
-    """Load note-level embeddings from all .ajson files.
-
-    Returns: dict of {vault_relative_path: vector_list}
-    Skips notes with null entries (not yet embedded by SC).
-    """
+def _smart_env_dir(vault_root):
     smart_env = os.path.join(vault_root, SMART_ENV_DIR)
     if not os.path.exists(smart_env):
         raise FileNotFoundError(f"Smart Connections data not found at {smart_env}")
+    return smart_env
+
+
+def _list_ajson_files(smart_env):
+    """Return sorted [(filename, mtime_ns, size)] for every .ajson file in smart_env."""
+    listing = []
+    with os.scandir(smart_env) as it:
+        for entry in it:
+            if entry.name.endswith(".ajson") and entry.is_file():
+                stat = entry.stat()
+                listing.append((entry.name, stat.st_mtime_ns, stat.st_size))
+    listing.sort()
+    return listing
 
-    embeddings = {}
-    for filename in os.listdir(smart_env):
-        if not filename.endswith(".ajson"):
+
+def _embedding_records(entries, model):
+    """Yield (kind, key, path, lines, vec) for each note/block in a parsed .ajson file embedded by model."""
+    for key, val in entries.items():
+        if not val:
             continue
-        entries = _parse_ajson_file(os.path.join(smart_env, filename))
-        for key, val in entries.items():
-            if not key.startswith("smart_sources:"):
-                continue
-            if not val:
-                continue
+        if key.startswith("smart_sources:"):
             vec = val.get("embeddings", {}).get(model, {}).get("vec")
             if vec:
                 note_path = val.get("path") or key[len("smart_sources:"):]
-                embeddings[note_path] = vec
+                yield "note", note_path, note_path, None, vec
+        elif key.startswith("smart_blocks:"):
+            vec = val.get("embeddings", {}).get(model, {}).get("vec")
+            if vec:
+                block_key = val.get("key") or key[len("smart_blocks:"):]
+                note_path = block_key.split("#")[0] if "#" in block_key else block_key
+                yield "block", block_key, note_path, val.get("lines"), vec
 
-    return embeddings
 
+def _read_ajson_records(filepath, model, kinds=EMBEDDING_KINDS):
+    prefixes = tuple(_KIND_PREFIXES[kind] for kind in kinds)
+    return _embedding_records(_parse_ajson_file(filepath, prefixes), model)
 
-def load_block_embeddings(vault_root, model=DEFAULT_MODEL):
-    """Load block-level (per-heading) embeddings from all .ajson files.
 
-    Returns: dict of {block_key: {"path": str, "vec": list, "lines": [start, end]}}
-    Block key format: 'note/path.md#Heading#Subheading'
+def iter_embedding_records(vault_root, model=DEFAULT_MODEL, kinds=EMBEDDING_KINDS):
+    """Stream (kind, key, path, lines, vec) for every note and block embedded by model.
+
+    vec is the list of floats parsed from the .ajson line, not a float32 view.
+
+    Each .ajson file is read once for all kinds; lines for kinds left out of kinds are
+    skipped before they are JSON-parsed, so their vectors are never decoded.
     """
-    smart_env = os.path.join(vault_root, SMART_ENV_DIR)
-    if not os.path.exists(smart_env):
-        raise FileNotFoundError(f"Smart Connections data not found at {smart_env}")
+    smart_env = _smart_env_dir(vault_root)
+    for name, _, _ in _list_ajson_files(smart_env):
+        yield from _read_ajson_records(os.path.join(smart_env, name), model, kinds)
 
-    blocks = {}
-    for filename in os.listdir(smart_env):
-        if not filename.endswith(".ajson"):
-            continue
-        entries = _parse_ajson_file(os.path.join(smart_env, filename))
-        for key, val in entries.items():
-            if not key.startswith("smart_blocks:"):
-                continue
-            if not val:
-                continue
-            vec = val.get("embeddings", {}).get(model, {}).get("vec")
-            if not vec:
-                continue
-            block_key = val.get("key") or key[len("smart_blocks:"):]
-            note_path = block_key.split("#")[0] if "#" in block_key else block_key
-            blocks[block_key] = {
-                "path": note_path,
-                "vec": vec,
-                "lines": val.get("lines"),
+
+class EmbeddingMatrix:
+    """Float32 embeddings for one vault and model, stored row by row in one contiguous buffer.
+
+    records[i] is [kind, key, path, lines] for row i, where kind is "note" or "block".
+    vectors is a flat float32 memoryview, memory-mapped when it comes from the cache.
+    skipped lists the keys left out because their vector length differed from dim.
+    """
+
+    def __init__(self, records, dim, vectors, skipped=()):
+        self.records = records
+        self.dim = dim
+        self.vectors = vectors
+        self.skipped = list(skipped)
+
+    def __len__(self):
+        return len(self.records)
+
+    def row(self, i):
+        """Zero-copy float32 view of row i."""
+        return self.vectors[i * self.dim:(i + 1) * self.dim]
+
+    def rows_by_key(self, kind):
+        """Return {key: row} for one kind; a key seen twice keeps its last row, like the loaders."""
+        rows = {}
+        for i, record in enumerate(self.records):
+            if record[0] == kind:
+                rows[record[1]] = i
+        return rows
+
+
+def embedding_cache_dir(vault_root, model=DEFAULT_MODEL):
+    """Directory holding the compiled matrix for this vault and model, or None if caching is off.
+
+    SMART_CONNECTIONS_CACHE overrides the base directory; set it to 0 to disable the cache.
+    """
+    configured = os.getenv("SMART_CONNECTIONS_CACHE")
+    if configured == "0":
+        return None
+    base = os.path.expanduser(configured or DEFAULT_CACHE_DIR)
+    digest = hashlib.sha256(f"{os.path.abspath(vault_root)}\0{model}".encode("utf-8")).hexdigest()[:16]
+    return os.path.join(base, digest)
+
+
+def _read_cache_index(cache_dir, model):
+    try:
+        with open(os.path.join(cache_dir, "index.json"), "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if index.get("version") != CACHE_VERSION or index.get("model") != model or index.get("byteorder") != sys.byteorder:
+        return None
+    return index
+
+
+def _map_matrix(cache_dir, index):
+    """Memory-map the matrix an index points at, or None if it is missing or the wrong size."""
+    expected = len(index["records"]) * index["dim"] * 4
+    if expected == 0:
+        return memoryview(array.array("f"))
+    try:
+        with open(os.path.join(cache_dir, index["matrix"]), "rb") as f:
+            if os.fstat(f.fileno()).st_size != expected:
+                return None
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)).cast("f")
+    except OSError:
+        return None
+
+
+def _pack_ajson_file(filepath, model, kinds):
+    """Parse one .ajson file into ([kind, key, path, lines, length], float32 array of every vector)."""
+    records, packed = [], array.array("f")
+    for kind, key, path, lines, vec in _read_ajson_records(filepath, model, kinds):
+        records.append([kind, key, path, lines, len(vec)])
+        packed.extend(vec)
+    return records, packed
+
+
+def _pack_ajson_shard(smart_env, names, model, kinds):
+    return [_pack_ajson_file(os.path.join(smart_env, name), model, kinds) for name in names]
+
+
+def _parse_files(smart_env, names, model, kinds, workers):
+    """Yield _pack_ajson_file results for names in order, sharded across processes when it pays off."""
+    workers = min(workers or os.cpu_count() or 1, -(-len(names) // PARALLEL_SHARD_FILES))
+    if workers <= 1 or len(names) < PARALLEL_MIN_FILES:
+        for name in names:
+            yield _pack_ajson_file(os.path.join(smart_env, name), model, kinds)
+        return
+    shards = [names[i:i + PARALLEL_SHARD_FILES] for i in range(0, len(names), PARALLEL_SHARD_FILES)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for packed_files in executor.map(
+            _pack_ajson_shard,
+            [smart_env] * len(shards),
+            shards,
+            [model] * len(shards),
+            [kinds] * len(shards),
+        ):
+            yield from packed_files
+
+
+def _compile_matrix(smart_env, listing, model, out, previous=None, kinds=EMBEDDING_KINDS, workers=1):
+    """Write float32 rows for every listed file to out and return (records, files, dim, skipped).
+
+    previous is (index, vectors) from an earlier build; rows for files whose mtime and size
+    are unchanged are copied from it instead of re-parsing the .ajson file. The rest are
+    parsed by _parse_files, across up to workers processes (None means one per CPU).
+    Vectors whose length differs from the first one seen are left out and their keys
+    returned in skipped (and kept per file, so reused files still report them).
+    """
+    reusable = {}
+    dim = 0
+    if previous is not None:
+        index, vectors = previous
+        dim = index["dim"]
+        start = 0
+        for name, mtime_ns, size, count, file_skipped in index["files"]:
+            reusable[name] = (mtime_ns, size, start, count, file_skipped)
+            start += count
+
+    def is_reusable(name, mtime_ns, size):
+        old = reusable.get(name)
+        return old is not None and old[:2] == (mtime_ns, size)
+
+    stale = [name for name, mtime_ns, size in listing if not is_reusable(name, mtime_ns, size)]
+    parsed = _parse_files(smart_env, stale, model, kinds, workers)
+
+    records, files, skipped, newly_skipped = [], [], [], []
+    for name, mtime_ns, size in listing:
+        if is_reusable(name, mtime_ns, size):
+            _, _, start, count, file_skipped = reusable[name]
+            out.write(vectors[start * dim:(start + count) * dim])
+            records.extend(index["records"][start:start + count])
+        else:
+            count = offset = 0
+            file_skipped = []
+            file_records, packed = next(parsed)
+            packed = memoryview(packed)
+            for kind, key, path, lines, length in file_records:
+                dim = dim or length
+                if length == dim:
+                    out.write(packed[offset:offset + length])
+                    records.append([kind, key, path, lines])
+                    count += 1
+                else:
+                    file_skipped.append(key)
+                offset += length
+            newly_skipped.extend(file_skipped)
+        skipped.extend(file_skipped)
+        files.append([name, mtime_ns, size, count, file_skipped])
+    if newly_skipped:
+        print(
+            f"Warning: skipped {len(newly_skipped)} embedding(s) whose length is not {dim}: "
+            + ", ".join(newly_skipped[:5])
+            + (" ..." if len(newly_skipped) > 5 else ""),
+            file=sys.stderr,
+        )
+    return records, files, dim, skipped
+
+
+class _ArrayWriter:
+    """File-like sink that appends float32 rows to an in-memory array."""
+
+    def __init__(self, target):
+        self.target = target
+
+    def write(self, rows):
+        self.target.frombytes(memoryview(rows).cast("B"))
+
+
+@contextmanager
+def _build_lock(cache_dir):
+    """Serialize cache builds for one directory across processes."""
+    with open(os.path.join(cache_dir, "build.lock"), "a") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        yield
+
+
+def _load_cached_matrix(cache_dir, model, listing):
+    """Return (index, vectors, fresh) for the published cache; (None, None, False) if unusable."""
+    index = _read_cache_index(cache_dir, model)
+    vectors = _map_matrix(cache_dir, index) if index else None
+    if vectors is None:
+        return None, None, False
+    return index, vectors, [tuple(f[:3]) for f in index["files"]] == listing
+
+
+def _remove_stale_cache_files(cache_dir, matrix_name):
+    """Delete matrix and index temp files the published index does not reference."""
+    for name in os.listdir(cache_dir):
+        if name != matrix_name and (
+            (name.startswith("vectors-") and name.endswith(".f32")) or (name.startswith("index-") and name.endswith(".json"))
+        ):
+            try:
+                os.unlink(os.path.join(cache_dir, name))
+            except OSError:
+                pass
+
+
+def _index_skipped(index):
+    return [key for file_entry in index["files"] for key in file_entry[4]]
+
+
+def load_embedding_matrix(vault_root, model=DEFAULT_MODEL, kinds=EMBEDDING_KINDS, workers=None):
+    """Load every note and block embedding for model as one EmbeddingMatrix.
+
+    The matrix is compiled into embedding_cache_dir() and memory-mapped on later calls;
+    only .ajson files whose mtime or size changed since the last build are parsed again.
+    The cache always holds every kind; kinds only narrows what is parsed when it is off.
+    Large parses are sharded across workers processes (default: one per CPU, 1 disables).
+    """
+    smart_env = _smart_env_dir(vault_root)
+    listing = _list_ajson_files(smart_env)
+    cache_dir = embedding_cache_dir(vault_root, model)
+
+    if cache_dir is None:
+        out = array.array("f")
+        records, _, dim, skipped = _compile_matrix(smart_env, listing, model, _ArrayWriter(out), kinds=kinds, workers=workers)
+        return EmbeddingMatrix(records, dim, memoryview(out), skipped)
+
+    index, vectors, fresh = _load_cached_matrix(cache_dir, model, listing)
+    if fresh:
+        return EmbeddingMatrix(index["records"], index["dim"], vectors, _index_skipped(index))
+
+    os.makedirs(cache_dir, exist_ok=True)
+    with _build_lock(cache_dir):
+        # Another process may have published the same build while this one waited.
+        index, vectors, fresh = _load_cached_matrix(cache_dir, model, listing)
+        if fresh:
+            return EmbeddingMatrix(index["records"], index["dim"], vectors, _index_skipped(index))
+
+        fd, matrix_path = tempfile.mkstemp(prefix="vectors-", suffix=".f32", dir=cache_dir)
+        try:
+            with os.fdopen(fd, "wb") as out:
+                records, files, dim, skipped = _compile_matrix(
+                    smart_env, listing, model, out, previous=(index, vectors) if index else None, workers=workers
+                )
+            new_index = {
+                "version": CACHE_VERSION,
+                "model": model,
+                "byteorder": sys.byteorder,
+                "dim": dim,
+                "matrix": os.path.basename(matrix_path),
+                "files": files,
+                "records": records,
             }
+            vectors = _map_matrix(cache_dir, new_index)
+            fd, index_path = tempfile.mkstemp(prefix="index-", suffix=".json", dir=cache_dir)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(new_index, f, separators=(",", ":"))
+            # The index names its own matrix file, so a reader never pairs it with a half-written one.
+            os.replace(index_path, os.path.join(cache_dir, "index.json"))
+        except BaseException:
+            os.unlink(matrix_path)
+            raise
+        # Readers that already mapped an older matrix keep their mapping after it is unlinked.
+        _remove_stale_cache_files(cache_dir, new_index["matrix"])
+    return EmbeddingMatrix(records, dim, vectors, skipped)
+
+
+def load_embeddings(vault_root, model=DEFAULT_MODEL, kinds=EMBEDDING_KINDS, workers=None):
+    """Load note and block embeddings together, reading the .ajson files (or the cache) once.
 
-    return blocks
+    Returns: (notes, blocks) shaped like load_note_embeddings and load_block_embeddings,
+    with float32 memoryview vectors; a kind left out of kinds comes back as an empty dict.
+    """
+    return split_embedding_matrix(load_embedding_matrix(vault_root, model, kinds, workers), kinds)
+
+
+def split_embedding_matrix(matrix, kinds=EMBEDDING_KINDS):
+    """Return (notes, blocks) dicts over an already loaded EmbeddingMatrix; see load_embeddings."""
+    notes, blocks = {}, {}
+    want_notes, want_blocks = "note" in kinds, "block" in kinds
+    for i, (kind, key, path, lines) in enumerate(matrix.records):
+        if kind == "note":
+            if want_notes:
+                notes[key] = matrix.row(i)
+        elif want_blocks:
+            blocks[key] = {"path": path, "vec": matrix.row(i), "lines": lines}
+    return notes, blocks
+
+
+def load_note_embeddings(vault_root, model=DEFAULT_MODEL):
+    """Load note-level embeddings from all .ajson files.
+
+    Returns: dict of {vault_relative_path: float32 memoryview}
+    Skips notes with null entries (not yet embedded by SC).
+    """
+    return load_embeddings(vault_root, model, kinds=("note",))[0]
+
+
+def load_block_embeddings(vault_root, model=DEFAULT_MODEL):
+    """Load block-level (per-heading) embeddings from all .ajson files.
+
+    Returns: dict of {block_key: {"path": str, "vec": float32 memoryview, "lines": [start, end]}}
+    Block key format: 'note/path.md#Heading#Subheading'
+    """
+    return load_embeddings(vault_root, model, kinds=("block",))[1]
 
 
 def normalize(v):
+    """Return v scaled to unit length as a list (a zero vector comes back as a list of zeros)."""
     norm = math.sqrt(sum(x * x for x in v))
     if norm == 0:
-        return v
+        return list(v)
     return [x / norm for x in v]
 
 